@@ -0,0 +1,229 @@
+"""Kedro commands to inspect multinodes."""
+
+import statistics
+from typing import Any, List, Tuple, Union
+
+import click
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline
+from typing_extensions import TypedDict
+
+from kedro_partitioned.pipeline.multinode import _SlicerNode
+from kedro_partitioned.plugin import MultiNodeEnabler
+
+
+class SliceSummary(TypedDict):
+    """Partitions assigned to a slice, as planned by the slicer."""
+
+    partitions: int
+    bytes: Union[float, None]
+    cost: float
+
+
+class SliceReport(TypedDict):
+    """Slice plan of a multinode, with its predicted makespan and skew."""
+
+    name: str
+    balance: str
+    slices: List[SliceSummary]
+    makespan: float
+    mean: float
+    stdev: float
+    skew: float
+
+
+def _balance_name(slicer: _SlicerNode) -> str:
+    return "custom" if callable(slicer.balance) else slicer.balance
+
+
+def inspect_slicer(slicer: _SlicerNode, catalog: DataCatalog) -> SliceReport:
+    """Runs the slicer logic and summarizes its plan.
+
+    The cost of a slice is the cost the slicer balances, e.g. seconds for
+    'runtime' and bytes for 'size', or the number of partitions when
+    balancing by 'count' or 'hash'. The makespan is the cost of the costliest
+    slice, and the skew is the makespan over the mean slice cost.
+
+    Args:
+        slicer (_SlicerNode): slicer of a multinode
+        catalog (DataCatalog): catalog with the slicer inputs, after the
+            multinode hook ran
+
+    Returns:
+        SliceReport
+
+    Example:
+        >>> from kedro_partitioned.pipeline import multinode
+        >>> pipe = multinode(max, 'a', 'b', 'x', n_slices=2)
+        >>> slicer = next(n for n in pipe.nodes if isinstance(n, _SlicerNode))
+        >>> catalog = DataCatalog(feed_dict={
+        ...     'a': {'a.csv': None, 'b.csv': None, 'c.csv': None}})
+        >>> pprint(inspect_slicer(slicer, catalog))
+        {'balance': 'count',
+         'makespan': 2,
+         'mean': 1.5,
+         'name': 'x',
+         'skew': 1.3333333333333333,
+         'slices': [{'bytes': None, 'cost': 2, 'partitions': 2},
+                    {'bytes': None, 'cost': 1, 'partitions': 1}],
+         'stdev': 0.5}
+    """
+    report = slicer.report(*(catalog.load(name) for name in slicer.inputs))
+    slices = report["plan"]["slices"]
+    sizes = report["sizes"]
+    costs = report["costs"]
+    if costs is None:
+        costs = {p: 1 for s in slices for p in s}
+
+    summaries: List[SliceSummary] = [
+        {
+            "partitions": len(s),
+            "bytes": None if sizes is None else sum(sizes[p] for p in s),
+            "cost": sum(costs[p] for p in s),
+        }
+        for s in slices
+    ]
+    slice_costs = [s["cost"] for s in summaries]
+    mean = statistics.mean(slice_costs) if slice_costs else 0
+    makespan = max(slice_costs, default=0)
+    return {
+        "name": slicer.name,
+        "balance": _balance_name(slicer),
+        "slices": summaries,
+        "makespan": makespan,
+        "mean": mean,
+        "stdev": statistics.pstdev(slice_costs) if slice_costs else 0,
+        "skew": makespan / mean if mean else 1.0,
+    }
+
+
+def inspect_pipeline(
+    pipeline: Pipeline, catalog: DataCatalog, names: List[str] = None
+) -> List[SliceReport]:
+    """Inspects the slicers of a pipeline.
+
+    Args:
+        pipeline (Pipeline): pipeline with multinodes
+        catalog (DataCatalog): catalog of the pipeline, it is not modified
+        names (List[str], optional): names of the multinodes or
+            multipipelines to inspect. Defaults to None, i.e. all of them.
+
+    Returns:
+        List[SliceReport]
+    """
+    catalog = catalog.shallow_copy()
+    MultiNodeEnabler().before_pipeline_run({}, pipeline, catalog)
+    return [
+        inspect_slicer(slicer, catalog)
+        for slicer in pipeline.nodes
+        if isinstance(slicer, _SlicerNode) and (not names or slicer.name in names)
+    ]
+
+
+def format_report(report: SliceReport, skew_threshold: float) -> str:
+    """Formats a slice report as a table.
+
+    Slices whose cost is above `skew_threshold` times the mean are flagged.
+
+    Args:
+        report (SliceReport): report to format
+        skew_threshold (float): tolerated slice cost over the mean
+
+    Returns:
+        str
+
+    Example:
+        >>> print(format_report({
+        ...     'name': 'x', 'balance': 'size',
+        ...     'slices': [{'partitions': 1, 'bytes': 30, 'cost': 30},
+        ...                {'partitions': 2, 'bytes': 10, 'cost': 10}],
+        ...     'makespan': 30, 'mean': 20, 'stdev': 10, 'skew': 1.5}, 1.2))
+        x (balance: size)
+          slice  partitions  bytes  cost
+              0           1     30    30  SKEWED
+              1           2     10    10
+          predicted makespan: 30, mean: 20, stdev: 10, skew: 1.50
+    """
+    header = ("slice", "partitions", "bytes", "cost")
+    rows = [
+        (
+            str(i),
+            str(s["partitions"]),
+            "-" if s["bytes"] is None else f"{s['bytes']:g}",
+            f"{s['cost']:g}",
+        )
+        for i, s in enumerate(report["slices"])
+    ]
+    widths = [max(len(r[col]) for r in [header] + rows) for col in range(4)]
+    flags = [
+        "  SKEWED" if s["cost"] > skew_threshold * report["mean"] else ""
+        for s in report["slices"]
+    ]
+    lines = [f"{report['name']} (balance: {report['balance']})"]
+    lines.append("  " + "  ".join(h.rjust(w) for h, w in zip(header, widths)))
+    for row, flag in zip(rows, flags):
+        lines.append("  " + "  ".join(c.rjust(w) for c, w in zip(row, widths)) + flag)
+    lines.append(
+        f"  predicted makespan: {report['makespan']:g}, mean: {report['mean']:g}, "
+        f"stdev: {report['stdev']:g}, skew: {report['skew']:.2f}"
+    )
+    return "\n".join(lines)
+
+
+def _load_project(
+    metadata: Any, pipeline: str, env: Union[str, None]
+) -> Tuple[Pipeline, DataCatalog]:
+    from kedro.framework.project import pipelines
+    from kedro.framework.session import KedroSession
+
+    with KedroSession.create(project_path=metadata.project_path, env=env) as session:
+        return pipelines[pipeline], session.load_context().catalog
+
+
+@click.group(name="kedro-partitioned")
+def commands():
+    """Kedro-partitioned commands."""
+
+
+@commands.group()
+def partitioned():
+    """Inspects multinodes and multipipelines."""
+
+
+@partitioned.command()
+@click.option("--pipeline", "-p", default="__default__", help="Pipeline name.")
+@click.option(
+    "--name",
+    "-n",
+    "names",
+    multiple=True,
+    help="Multinode or multipipeline to inspect. Defaults to all of them.",
+)
+@click.option("--env", "-e", default=None, help="Kedro configuration environment.")
+@click.option(
+    "--skew-threshold",
+    type=float,
+    default=1.5,
+    show_default=True,
+    help="Flags slices whose cost exceeds this ratio of the mean slice cost.",
+)
+@click.pass_obj
+def inspect(
+    metadata: Any,
+    pipeline: str,
+    names: Tuple[str, ...],
+    env: Union[str, None],
+    skew_threshold: float,
+):
+    """Prints the slice plan of multinodes without running them.
+
+    Runs only the slicer logic against the catalog, and reports the number of
+    partitions, bytes and predicted cost of each slice.
+    """
+    pipe, catalog = _load_project(metadata, pipeline, env)
+    reports = inspect_pipeline(pipe, catalog, list(names))
+    if not reports:
+        raise click.ClickException(f'No multinodes found in pipeline "{pipeline}"')
+    click.echo("\n\n".join(format_report(r, skew_threshold) for r in reports))
+    if any(r["skew"] > skew_threshold for r in reports):
+        click.echo(f"\nSlices above {skew_threshold:g} times the mean cost found.")
@@ -1,15 +1,16 @@
 """Package for non abstract datasets."""
 
-from .datasets.concatenated_dataset import (
-    ConcatenatedDataset,
-    PandasConcatenatedDataset,
-)
-from .datasets.nullable_dataset import NullableDataset
-from .datasets.threaded_partitioned_dataset import ThreadedPartitionedDataset
-
-__all__ = [
-    "ConcatenatedDataset",
-    "PandasConcatenatedDataset",
-    "NullableDataset",
-    "ThreadedPartitionedDataset",
-]
+from kedro_partitioned.utils.other import lazy_module
+
+_DATASETS = {
+    "ConcatenatedDataset": ".datasets.concatenated_dataset",
+    "PandasConcatenatedDataset": ".datasets.concatenated_dataset",
+    "NullableDataset": ".datasets.nullable_dataset",
+    "ThreadedPartitionedDataset": ".datasets.threaded_partitioned_dataset",
+}
+
+__all__ = list(_DATASETS)
+
+# datasets are imported on first access, so importing one of them does not
+# import the dependencies of the others, e.g. pandas
+__getattr__, __dir__ = lazy_module(__name__, _DATASETS)
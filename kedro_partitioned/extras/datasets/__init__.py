@@ -1,5 +1,10 @@
 """Package for datasets."""
 
-from .threaded_partitioned_dataset import ThreadedPartitionedDataset
+from kedro_partitioned.utils.other import lazy_module
 
-__all__ = ["ThreadedPartitionedDataset"]
+_DATASETS = {"ThreadedPartitionedDataset": ".threaded_partitioned_dataset"}
+
+__all__ = list(_DATASETS)
+
+# datasets are imported on first access, see `kedro_partitioned.extras`
+__getattr__, __dir__ = lazy_module(__name__, _DATASETS)
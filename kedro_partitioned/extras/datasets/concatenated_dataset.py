@@ -46,7 +46,9 @@ class ConcatenatedDataset(PathSafePartitionedDataset, Generic[T]):
             python import path to a function.
             Defaults to {}.
         filter (Union[Callable[[str], bool], str], optional):
-            filter partitions by its relative paths. Defaults to truthify.
+            filter partitions by its relative paths. Regexes with a literal
+            prefix, and functions with a `prefixes` attribute, list only the
+            paths starting with the prefixes. Defaults to truthify.
     """
 
     _IMPORTLIB_SEPARATOR = "."
@@ -125,7 +127,14 @@ class ConcatenatedDataset(PathSafePartitionedDataset, Generic[T]):
 
     def _load(self) -> T:
         partitions = super()._load()
-        loaders = {k: v for k, v in partitions.items() if self.filter(k)}
+        prefixes = getattr(self.filter, "prefixes", None)
+        if prefixes is not None:
+            partitions = partitions.within(prefixes)
+        many = getattr(self.filter, "many", None)
+        if many is not None:
+            loaders = {k: partitions[k] for k in many(list(partitions))}
+        else:
+            loaders = {k: v for k, v in partitions.items() if self.filter(k)}
         with ThreadPoolExecutor() as pool:
             data_list = list(pool.map(self._load_partition, loaders.items()))
         return self.concat_func(data_list)
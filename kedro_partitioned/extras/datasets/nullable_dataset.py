@@ -105,28 +105,20 @@ class NullableDataset(WrapperDataset):
         else:
             raise KeyError(f'"_filepath" property doesn\'t exist in {self._dataset}')
 
-    def save(self, data: Any):
-        """Saves data to the underlying Dataset.
-
-        Args:
-            data (Any): Data to save.
-        """
+    # `_save` and `_load` are overridden, instead of `save` and `load`, since
+    # kedro replaces `save` and `load` by them in every subclass
+    def _save(self, data: Any):
         if data is Null:
             if self._verbose:
                 self._logger.warning(
                     f'Received `Null` while saving into "{self._filepath}"'
                 )
         else:
-            super().save(data)
+            super()._save(data)
 
-    def load(self) -> Any:
-        """Loads data from the underlying Dataset.
-
-        Returns:
-            Any: Data loaded from the underlying Dataset.
-        """
+    def _load(self) -> Any:
         try:
-            return super().load()
+            return super()._load()
         except Exception:
             if self._verbose:
                 self._logger.warning(f'Could not load Dataset from "{self._filepath}"')
@@ -1,19 +1,88 @@
 """A PartitionedDataset that saves asynchronously."""
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from copy import deepcopy
-from typing import Any, Dict, Tuple
+from functools import partial
+import os
+from typing import Any, Callable, Dict, Iterable, Set
 from kedro_partitioned.io.path_safe_partitioned_dataset import (
     PathSafePartitionedDataset,
 )
 
 
 class ThreadedPartitionedDataset(PathSafePartitionedDataset):
-    """Same implementation as the PartitionedDataset, but using threads."""
+    """Same implementation as the PartitionedDataset, but using threads.
+
+    Partitions are saved by up to `max_workers` threads. Lazy partitions, i.e.
+    callables, are only computed by the thread saving them, and partitions
+    are submitted as threads become free, so at most `max_workers` of them
+    are computed at once. If a partition fails, the partitions not submitted
+    or not started yet are cancelled and the error is raised.
+
+    Example:
+        >>> import tempfile
+        >>> ds = ThreadedPartitionedDataset(
+        ...     path=tempfile.mkdtemp(), dataset='json.JSONDataset',
+        ...     filename_suffix='.json', max_workers=2)
+        >>> ds.save({'a': {'x': 1}, 'b': lambda: {'x': 2}})
+        >>> sorted((k, v()) for k, v in ds.load().items())
+        [('a', {'x': 1}), ('b', {'x': 2})]
+    """
+
+    DELETE_BATCH_SIZE = 1000
+
+    def __init__(self, max_workers: int = None, **kwargs: Any):
+        """Initializes a ThreadedPartitionedDataset.
+
+        Args:
+            max_workers (int, optional): Number of partitions saved at the
+                same time, and of batches of files deleted at the same time
+                when `overwrite`. Defaults to None, i.e. the default of
+                `ThreadPoolExecutor`.
+            kwargs: Same arguments as the `PartitionedDataset`.
+        """
+        self._max_workers = max_workers
+        super().__init__(**kwargs)
+
+    @property
+    def _workers(self) -> int:
+        return self._max_workers or min(32, (os.cpu_count() or 1) + 4)
 
-    def _save_partition(self, partition: Tuple[str, Any]):
-        self._logger.info(f"Saving partition {partition[0]}")
-        partition_id, partition_data = partition
+    def _run(self, pool: ThreadPoolExecutor, tasks: Iterable[Callable[[], Any]]):
+        """Runs tasks in a pool, stopping at the first one that raises.
+
+        Up to twice the number of workers are submitted at once, so the
+        pool is kept busy without holding every task in its queue.
+
+        Args:
+            pool (ThreadPoolExecutor): pool running the tasks
+            tasks (Iterable[Callable[[], Any]]): tasks to run
+        """
+        pending: Set[Future] = set()
+        try:
+            for task in tasks:
+                if len(pending) >= 2 * self._workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(pool.submit(task))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _save_partition(self, partition_id: str, partition_data: Any):
+        self._logger.info(f"Saving partition {partition_id}")
+        # copied for each partition, since datasets may change nested args
         kwargs = deepcopy(self._dataset_config)
         partition_path = self._partition_to_path(partition_id)
         # join the protocol back since tools like PySpark may rely on it
@@ -23,11 +92,35 @@ class ThreadedPartitionedDataset(PathSafePartitionedDataset):
             partition_data = partition_data()
         dataset.save(partition_data)
 
-    def _save(self, data: Dict[str, Any]):
-        if self._overwrite and self._filesystem.exists(self._normalized_path):
-            self._filesystem.rm(self._normalized_path, recursive=True)
+    def _delete(self, pool: ThreadPoolExecutor):
+        """Deletes the files of the dataset in batches, in parallel.
 
-        with ThreadPoolExecutor() as pool:
-            pool.map(self._save_partition, data.items())
+        Args:
+            pool (ThreadPoolExecutor): pool deleting the batches
+        """
+        paths = self._filesystem.find(self._normalized_path)
+        self._run(
+            pool,
+            (
+                partial(self._filesystem.rm, paths[i : i + self.DELETE_BATCH_SIZE])
+                for i in range(0, len(paths), self.DELETE_BATCH_SIZE)
+            ),
+        )
+        # removes the folders left behind, if the filesystem has folders
+        if self._filesystem.exists(self._normalized_path):
+            self._filesystem.rm(self._normalized_path, recursive=True)
 
-        self._invalidate_caches()
+    def _save(self, data: Dict[str, Any]):
+        try:
+            with ThreadPoolExecutor(self._workers) as pool:
+                if self._overwrite and self._filesystem.exists(self._normalized_path):
+                    self._delete(pool)
+                self._run(
+                    pool,
+                    (
+                        partial(self._save_partition, partition, data[partition])
+                        for partition in sorted(data)
+                    ),
+                )
+        finally:
+            self._invalidate_caches()
@@ -1,7 +1,15 @@
 """kedro_partitioned IO module."""
 
-from kedro_partitioned.io.path_safe_partitioned_dataset import (
-    PathSafePartitionedDataset,
-)
+from kedro_partitioned.utils.other import lazy_module
 
-__all__ = ["PathSafePartitionedDataset"]
+_DATASETS = {
+    "CheckpointDataset": ".checkpoint_dataset",
+    "LeaseDataset": ".lease_dataset",
+    "PathSafePartitionedDataset": ".path_safe_partitioned_dataset",
+}
+
+__all__ = list(_DATASETS)
+
+# datasets are imported on first access, so the multinodes importing the
+# leases and checkpoints do not import `kedro_datasets.partitions`
+__getattr__, __dir__ = lazy_module(__name__, _DATASETS)
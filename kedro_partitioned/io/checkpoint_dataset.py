@@ -0,0 +1,107 @@
+"""A Dataset that persists partitions one by one, marking them as committed."""
+
+from typing import Any, Dict, List
+
+from kedro.io import AbstractDataset
+
+from kedro_partitioned.io.lease_dataset import LeaseDataset, Leases
+
+
+class Checkpoint:
+    """Saves the outputs of a partition and marks it as committed.
+
+    A partition is only marked as committed after all of its outputs are
+    saved, so a partition interrupted halfway is processed again.
+
+    Example:
+        >>> import fsspec, tempfile
+        >>> saved = {}
+        >>> class Output:
+        ...     def save(self, data): saved.update(data)
+        >>> checkpoint = Checkpoint(
+        ...     Leases(fsspec.filesystem('file'), tempfile.mkdtemp()), [Output()])
+        >>> checkpoint.committed('run', 'x/a')
+        False
+        >>> checkpoint.commit('run', 'x/a', 'a', [1], 'x-slice-0')
+        >>> checkpoint.committed('run', 'x/a'), saved
+        (True, {'a': 1})
+        >>> checkpoint.committed('other-run', 'x/a')
+        False
+    """
+
+    def __init__(self, markers: Leases, outputs: List[AbstractDataset]):
+        """Initializes the checkpoint.
+
+        Args:
+            markers (Leases): where the commit markers are stored
+            outputs (List[AbstractDataset]): partitioned datasets receiving
+                the outputs of each partition
+        """
+        self._markers = markers
+        self._outputs = outputs
+
+    def committed(self, scope: str, key: str) -> bool:
+        """Whether a key was committed.
+
+        Args:
+            scope (str): scope of the key, e.g. a run id
+            key (str): key of the partition
+
+        Returns:
+            bool
+        """
+        return self._markers.owner(scope, key) is not None
+
+    def commit(
+        self, scope: str, key: str, partition: str, values: List[Any], owner: str
+    ):
+        """Saves the outputs of a partition, then marks it as committed.
+
+        Args:
+            scope (str): scope of the key, e.g. a run id
+            key (str): key of the partition
+            partition (str): partition id in the outputs
+            values (List[Any]): value of each output
+            owner (str): who is committing the partition
+        """
+        for output, value in zip(self._outputs, values):
+            output.save({partition: value})
+        self._markers.claim(scope, key, owner)
+
+
+class CheckpointDataset(LeaseDataset):
+    """Loads a `Checkpoint` of outputs with markers stored in a folder.
+
+    Example:
+        >>> import tempfile
+        >>> from kedro.io import MemoryDataset
+        >>> output = MemoryDataset()
+        >>> ds = CheckpointDataset(path=tempfile.mkdtemp(), outputs=[output])
+        >>> ds.load().commit('run', 'x/a', 'a', [1], 'x-slice-0')
+        >>> ds.load().committed('run', 'x/a'), output.load()
+        (True, {'a': 1})
+    """
+
+    def __init__(
+        self,
+        path: str,
+        outputs: List[AbstractDataset],
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """Initializes a CheckpointDataset.
+
+        Args:
+            path (str): folder of the commit markers
+            outputs (List[AbstractDataset]): partitioned datasets receiving
+                the outputs of each partition
+            credentials (Dict[str, Any], optional): filesystem credentials.
+                Defaults to None.
+            fs_args (Dict[str, Any], optional): extra filesystem arguments.
+                Defaults to None.
+        """
+        super().__init__(path=path, credentials=credentials, fs_args=fs_args)
+        self._outputs = outputs
+
+    def _load(self) -> Checkpoint:
+        return Checkpoint(super()._load(), self._outputs)
@@ -0,0 +1,152 @@
+"""A Dataset that hands out exclusive leases stored in a filesystem."""
+
+import hashlib
+import posixpath
+from typing import Any, Dict, Union
+
+import fsspec
+from kedro.io import AbstractDataset
+from kedro.io.core import DatasetError, get_protocol_and_path
+
+
+class Leases:
+    """Claims keys exclusively by atomically creating one file per key.
+
+    A key is claimed by a single owner as long as the filesystem fails to
+    open an existing file in "xb" mode, e.g. local and network mounted
+    filesystems, or object stores implementing it with conditional writes.
+    Filesystems without exclusive creation are refused, since the last
+    writer would win and two owners could claim the same key.
+
+    Example:
+        >>> import tempfile
+        >>> leases = Leases(fsspec.filesystem('file'), tempfile.mkdtemp())
+        >>> leases.claim('run', 'partition', 'slice-0')
+        True
+        >>> leases.claim('run', 'partition', 'slice-1')
+        False
+        >>> leases.owner('run', 'partition')
+        'slice-0'
+        >>> leases.owner('other-run', 'partition') is None
+        True
+
+        Filesystems without exclusive creation are refused
+
+        >>> from fsspec.implementations.local import LocalFileSystem
+        >>> class Overwriting(LocalFileSystem):
+        ...     def _open(self, path, mode='rb', **kwargs):
+        ...         if 'x' in mode:
+        ...             raise NotImplementedError(mode)
+        ...         return super()._open(path, mode, **kwargs)
+        >>> Leases(Overwriting(), tempfile.mkdtemp()).claim(
+        ...     'run', 'partition', 'slice-0')
+        Traceback (most recent call last):
+        ...
+        kedro.io.core.DatasetError: Overwriting cannot create files \
+exclusively, which leases require to be claimed once
+    """
+
+    SUFFIX = ".lease"
+
+    def __init__(self, filesystem: fsspec.AbstractFileSystem, path: str):
+        """Initializes the leases.
+
+        Args:
+            filesystem (fsspec.AbstractFileSystem): where the leases are stored
+            path (str): folder of the leases
+        """
+        self._filesystem = filesystem
+        self._path = path
+
+    def _lease_path(self, scope: str, key: str) -> str:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return posixpath.join(self._path, scope, f"{digest}{self.SUFFIX}")
+
+    def claim(self, scope: str, key: str, owner: str) -> bool:
+        """Claims a key, if it was not claimed before.
+
+        Args:
+            scope (str): scope of the key, e.g. a run id
+            key (str): key to claim
+            owner (str): identifies who is claiming the key
+
+        Returns:
+            bool: whether the key was claimed by `owner`
+
+        Raises:
+            DatasetError: if the filesystem cannot create files exclusively
+        """
+        path = self._lease_path(scope, key)
+        self._filesystem.makedirs(posixpath.dirname(path), exist_ok=True)
+        try:
+            with self._filesystem.open(path, "xb") as f:
+                f.write(owner.encode())
+            return True
+        except FileExistsError:
+            return False
+        except (ValueError, NotImplementedError) as e:
+            raise DatasetError(
+                f"{type(self._filesystem).__name__} cannot create files "
+                "exclusively, which leases require to be claimed once"
+            ) from e
+
+    def owner(self, scope: str, key: str) -> Union[str, None]:
+        """Who claimed a key.
+
+        Args:
+            scope (str): scope of the key, e.g. a run id
+            key (str): claimed key
+
+        Returns:
+            Union[str, None]: owner of the key, or None if it is not claimed
+        """
+        path = self._lease_path(scope, key)
+        try:
+            with self._filesystem.open(path, "rb") as f:
+                return f.read().decode()
+        except FileNotFoundError:
+            return None
+
+
+class LeaseDataset(AbstractDataset):
+    """Loads `Leases` stored in a folder of any fsspec filesystem.
+
+    Example:
+        >>> import tempfile
+        >>> ds = LeaseDataset(path=tempfile.mkdtemp())
+        >>> ds.load().claim('run', 'partition', 'slice-0')
+        True
+        >>> ds.load().claim('run', 'partition', 'slice-1')
+        False
+    """
+
+    def __init__(
+        self,
+        path: str,
+        credentials: Dict[str, Any] = None,
+        fs_args: Dict[str, Any] = None,
+    ):
+        """Initializes a LeaseDataset.
+
+        Args:
+            path (str): folder of the leases
+            credentials (Dict[str, Any], optional): filesystem credentials.
+                Defaults to None.
+            fs_args (Dict[str, Any], optional): extra filesystem arguments.
+                Defaults to None.
+        """
+        protocol, root = get_protocol_and_path(path)
+        self._path = path
+        self._root = root
+        self._filesystem = fsspec.filesystem(
+            protocol, **(credentials or {}), **(fs_args or {})
+        )
+
+    def _load(self) -> Leases:
+        return Leases(self._filesystem, self._root)
+
+    def _save(self, data: Any):
+        raise DatasetError(f"Leases of '{self._path}' are read only")
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"path": self._path}
@@ -0,0 +1,137 @@
+"""Loaders of the partitions of a partitioned dataset, created on demand."""
+
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterator, List
+
+from kedro_partitioned.utils.partition_index import PartitionIndex
+
+
+class PartitionLoaders(Mapping):
+    """Partition loaders of a partitioned dataset, created on demand.
+
+    The dataset is listed on first access, and the loader of a partition is
+    only created when it is retrieved. Loaders of known partitions can be
+    created with `subset` without listing the dataset, e.g. from a manifest
+    of partitions listed previously.
+
+    Example:
+        >>> listed = []
+        >>> loaders = PartitionLoaders(
+        ...     lambda: listed.append(True) or {'a': 'dir/a.csv'},
+        ...     factory=lambda partition, path=None: lambda: (partition, path),
+        ...     sizes=lambda: {'a': 10})
+        >>> loaders.subset(['b'])['b']()
+        ('b', None)
+        >>> listed
+        []
+        >>> list(loaders)
+        ['a']
+        >>> loaders['a']()
+        ('a', 'dir/a.csv')
+        >>> loaders.sizes
+        {'a': 10}
+        >>> listed
+        [True]
+        >>> loaders.index.ids
+        ['a']
+    """
+
+    def __init__(
+        self,
+        partitions: Callable[[], Dict[str, str]],
+        factory: Callable[[str, str], Callable[[], Any]],
+        sizes: Callable[[], Dict[str, int]] = dict,
+        within: Callable[[List[str]], "PartitionLoaders"] = None,
+    ):
+        """Initializes the loaders mapping.
+
+        Args:
+            partitions (Callable[[], Dict[str, str]]): lists the partitions,
+                returning partition id by its path.
+            factory (Callable[[str, str], Callable[[], Any]]): creates the
+                loader of a partition id, given its path if it was listed.
+            sizes (Callable[[], Dict[str, int]], optional): returns partition
+                id by its size in bytes, as returned by the filesystem
+                listing. Called after listing. Defaults to dict.
+            within (Callable[[List[str]], PartitionLoaders], optional):
+                creates the loaders of the partitions starting with any of
+                the given prefixes, listing only them. Defaults to None,
+                i.e. the whole listing is filtered.
+        """
+        self._list = partitions
+        self._factory = factory
+        self._list_sizes = sizes
+        self._within = within
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+
+    @cached_property
+    def _partitions(self) -> Dict[str, str]:
+        return self._list()
+
+    @cached_property
+    def sizes(self) -> Dict[str, int]:
+        """Partition id by its size in bytes.
+
+        Returns:
+            Dict[str, int]
+        """
+        self._partitions
+        return self._list_sizes()
+
+    @cached_property
+    def index(self) -> PartitionIndex:
+        """Index of the partition ids, built once per listing.
+
+        Returns:
+            PartitionIndex
+        """
+        return PartitionIndex(self._partitions)
+
+    def __getitem__(self, partition: str) -> Callable[[], Any]:
+        if partition not in self._loaders:
+            path = self._partitions[partition]
+            self._loaders[partition] = self._factory(partition, path)
+        return self._loaders[partition]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._partitions)
+
+    def __len__(self) -> int:
+        return len(self._partitions)
+
+    def subset(self, partitions: List[str]) -> Dict[str, Callable[[], Any]]:
+        """Creates the loaders of known partitions without listing them.
+
+        Args:
+            partitions (List[str]): partition ids
+
+        Returns:
+            Dict[str, Callable[[], Any]]: partition id by its loader
+        """
+        return {partition: self._factory(partition) for partition in partitions}
+
+    def within(self, prefixes: List[str]) -> Mapping[str, Callable[[], Any]]:
+        """Loaders of the partitions whose ids start with any of the prefixes.
+
+        Args:
+            prefixes (List[str]): partition id prefixes
+
+        Returns:
+            Mapping[str, Callable[[], Any]]
+
+        Example:
+            >>> loaders = PartitionLoaders(
+            ...     lambda: {'a/1': 'a/1.csv', 'b/1': 'b/1.csv'},
+            ...     factory=lambda partition, path=None: lambda: partition)
+            >>> list(loaders.within(['a/']))
+            ['a/1']
+        """
+        if self._within is not None:
+            return self._within(prefixes)
+        prefixes = tuple(prefixes)
+        return {
+            partition: self[partition]
+            for partition in self
+            if partition.startswith(prefixes)
+        }
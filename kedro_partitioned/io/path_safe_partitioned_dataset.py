@@ -1,9 +1,20 @@
 """A Dataset that is partitioned into multiple Datasets."""
 
+from copy import copy, deepcopy
+from functools import cached_property
+import glob
+import operator
 from pathlib import PurePosixPath
 import posixpath
+from typing import Any, Callable, Dict, List, Tuple
+
+from cachetools import Cache, cachedmethod
+import fsspec
+from kedro.io.core import VERSION_KEY, DatasetError
 from kedro_datasets.partitions import PartitionedDataset
 
+from kedro_partitioned.io.partition_loaders import PartitionLoaders
+
 
 class PathSafePartitionedDataset(PartitionedDataset):
     """Partitioned Dataset, but handles mixed relative and absolute paths.
@@ -26,6 +37,189 @@ class PathSafePartitionedDataset(PartitionedDataset):
         'path/to/partition1.csv'
     """
 
+    # mutable configurations copied by clones, instead of shared
+    _CLONED_CONFIGS = ("_dataset_config", "_credentials", "_fs_args", "_load_args")
+    # cached methods, whose wrappers are bound and stored per instance
+    _CACHED_METHODS = ("_list_partitions", "_subpath_prefix")
+
+    def __init__(self, **kwargs: Any):
+        """Initializes a PathSafePartitionedDataset.
+
+        Args:
+            kwargs: Same arguments as the `PartitionedDataset`.
+        """
+        self._partition_sizes: Dict[str, int] = {}
+        self._subpath_prefixes: Dict[str, str] = {}
+        super().__init__(**kwargs)
+
+    @cached_property
+    def _filesystem(self) -> fsspec.AbstractFileSystem:
+        """Filesystem of the dataset, created once and shared by its clones.
+
+        Returns:
+            fsspec.AbstractFileSystem
+        """
+        return super()._filesystem
+
+    def clone(self) -> "PathSafePartitionedDataset":
+        """Copies the dataset without copying its filesystem.
+
+        The clone shares the filesystem, and thus its connections, with this
+        dataset, but has its own configuration, and lists and caches the
+        partitions on its own.
+
+        Returns:
+            PathSafePartitionedDataset
+
+        Example:
+            >>> ds = PathSafePartitionedDataset(
+            ...          path="data/path",
+            ...          dataset="pandas.CSVDataset",
+            ...          credentials={"auto_mkdir": True})
+            >>> clone = ds.clone()
+            >>> clone._filesystem is ds._filesystem
+            True
+            >>> clone._credentials == ds._credentials
+            True
+            >>> clone._credentials is ds._credentials
+            False
+            >>> clone._partition_cache is ds._partition_cache
+            False
+        """
+        self._filesystem
+        clone = copy(self)
+        for name in self._CLONED_CONFIGS:
+            if hasattr(self, name):
+                setattr(clone, name, deepcopy(getattr(self, name)))
+        for name in self._CACHED_METHODS:
+            clone.__dict__.pop(name, None)
+        clone._partition_cache = Cache(maxsize=1)
+        clone._partition_sizes = {}
+        clone._subpath_prefixes = {}
+        return clone
+
+    @cachedmethod(cache=operator.attrgetter("_partition_cache"))
+    def _list_partitions(self) -> List[str]:
+        """Lists the partitions, keeping their sizes from the listing details.
+
+        Returns:
+            List[str]: partition paths
+        """
+        if VERSION_KEY in self._dataset_config:
+            return super()._list_partitions()
+
+        self._partition_sizes = self._find(self._normalized_path)
+        return list(self._partition_sizes)
+
+    def _find(self, path: str) -> Dict[str, int]:
+        """Lists the partition files under a path.
+
+        Args:
+            path (str): folder to list recursively
+
+        Returns:
+            Dict[str, int]: size in bytes by partition path
+        """
+        details = self._filesystem.find(path, detail=True, **self._load_args)
+        return {
+            path: info.get("size")
+            for path, info in details.items()
+            if path.endswith(self._filename_suffix)
+        }
+
+    def _load(self) -> PartitionLoaders:
+        return PartitionLoaders(
+            self._list_partition_ids,
+            factory=self._partition_loader,
+            sizes=self._listed_sizes,
+            within=None if VERSION_KEY in self._dataset_config else self._load_within,
+        )
+
+    def _load_within(self, prefixes: List[str]) -> PartitionLoaders:
+        """Creates the loaders of the partitions starting with the prefixes.
+
+        Only the entries starting with the prefixes are listed, recursing
+        into the matching folders, e.g. the prefix 'sales/2020-' globs
+        'sales/2020-*', which lists the folder 'sales' one level deep, and
+        lists the folder 'sales/2020-01' but not 'sales/2021-01'.
+
+        Args:
+            prefixes (List[str]): partition id prefixes
+
+        Returns:
+            PartitionLoaders
+        """
+        sizes: Dict[str, int] = {}
+
+        def list_partitions() -> Dict[str, str]:
+            found: Dict[str, int] = {}
+            for prefix in sorted(set(prefixes)):
+                pattern = glob.escape(posixpath.join(self._normalized_path, prefix))
+                entries = self._filesystem.glob(
+                    f"{pattern}*", detail=True, **self._load_args
+                )
+                for path, info in entries.items():
+                    if info["type"] == "directory":
+                        found.update(self._find(path))
+                    elif path.endswith(self._filename_suffix):
+                        found[path] = info.get("size")
+            partitions = {}
+            for path, size in found.items():
+                partition = self._path_to_partition(path)
+                if partition.startswith(tuple(prefixes)):
+                    partitions[partition] = path
+                    sizes[partition] = size
+            return partitions
+
+        return PartitionLoaders(
+            list_partitions, factory=self._partition_loader, sizes=lambda: sizes
+        )
+
+    def _list_partition_ids(self) -> Dict[str, str]:
+        partitions = {
+            self._path_to_partition(path): path for path in self._list_partitions()
+        }
+        if not partitions:
+            raise DatasetError(f"No partitions found in '{self._path}'")
+        return partitions
+
+    def _listed_sizes(self) -> Dict[str, int]:
+        return {
+            self._path_to_partition(path): size
+            for path, size in self._partition_sizes.items()
+        }
+
+    def _partition_loader(
+        self, partition_id: str, path: str = None
+    ) -> Callable[[], Any]:
+        """Creates the loader of a partition.
+
+        Args:
+            partition_id (str): partition id, as listed by `load`
+            path (str, optional): path of the partition, if it was listed.
+                Defaults to None, i.e. the path is built from the id.
+
+        Returns:
+            Callable[[], Any]
+
+        Example:
+            >>> ds = PathSafePartitionedDataset(
+            ...          path="data/path",
+            ...          dataset="pandas.CSVDataset",
+            ...          filename_suffix=".csv")
+            >>> ds._partition_loader("a/partition1").__self__._filepath
+            PurePosixPath('data/path/a/partition1.csv')
+        """
+        kwargs = deepcopy(self._dataset_config)
+        kwargs[self._filepath_arg] = self._join_protocol(
+            self._partition_to_path(partition_id) if path is None else path
+        )
+        return self._dataset_type(**kwargs).load
+
+    def _invalidate_caches(self):
+        self._partition_sizes = {}
+        super()._invalidate_caches()
+
     def _path_to_partition(self, path: str) -> str:
         """Takes only the relative subpath from the partitioned dataset path.
 
@@ -56,13 +250,32 @@ class PathSafePartitionedDataset(PartitionedDataset):
             full uri to the folder. This makes Kedro's partitioned dataset to
             not rsplit(partition, path) correctly.
         """
-        subpath = super()._path_to_partition(path)
+        subpath = path.split(self._stripped_path, 1).pop().lstrip(self._sep)
+        if self._filename_suffix and subpath.endswith(self._filename_suffix):
+            subpath = subpath[: -len(self._filename_suffix)]
+
+        first_part = "/" if path.startswith("/") else path.split("/", 1)[0]
+        return subpath.replace(self._subpath_prefix(first_part), "", 1)
+
+    @cached_property
+    def _stripped_path(self) -> str:
+        return self._filesystem._strip_protocol(self._normalized_path)
+
+    @cached_property
+    def _path_parts(self) -> Tuple[str, ...]:
+        return PurePosixPath(self._normalized_path).parts
 
-        subpath_parts = PurePosixPath(path).parts
-        path_parts = PurePosixPath(self._normalized_path).parts
+    @cachedmethod(cache=operator.attrgetter("_subpath_prefixes"))
+    def _subpath_prefix(self, first_part: str) -> str:
+        """Part of the dataset path left in the paths starting with a part.
 
+        Args:
+            first_part (str): first part of the listed paths
+
+        Returns:
+            str
+        """
         common_index = next(
-            (i for i, part in enumerate(path_parts) if part == subpath_parts[0]), 0
+            (i for i, part in enumerate(self._path_parts) if part == first_part), 0
         )
-        suffix = str(PurePosixPath(*path_parts[common_index:])) + posixpath.sep
-        return subpath.replace(suffix, "", 1)
+        return str(PurePosixPath(*self._path_parts[common_index:])) + posixpath.sep
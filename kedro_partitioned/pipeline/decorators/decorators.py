@@ -4,20 +4,21 @@ from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import posixpath
 import re
-from typing import Any, Callable, Iterable, Union, List, Dict
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Union, List, Dict
 
 from kedro_partitioned.pipeline.decorators.helper_factory import regex_filter
 from kedro_partitioned.utils.typing import IsFunction
 from kedro_partitioned.utils.other import kwargs_only, identity
 from kedro_partitioned.utils.iterable import tolist
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def concat_partitions(
     partitioned_arg: str,
     filter: Union[str, IsFunction[str], List[IsFunction[str]]] = None,
-    func: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+    func: Callable[["pd.DataFrame"], "pd.DataFrame"] = identity,
     func_args: List[str] = [],
 ) -> Callable[[Callable], Callable]:
     """Decorator that concatenates DataFrames in a partitioned dataset.
@@ -35,6 +36,7 @@ def concat_partitions(
         Callable[[Callable], Callable]
 
     Example:
+        >>> import pandas as pd
         >>> fake_partitioned = {'a': lambda: pd.DataFrame({'a': [1]}),
         ...                     'ab': lambda: pd.DataFrame({'a': [2]}),
         ...                     'c': lambda: pd.DataFrame({'a': [3]})}
@@ -169,6 +171,8 @@ def concat_partitions(
         @wraps(f)
         @kwargs_only(f)
         def wrapper(**kwargs: Any) -> Any:
+            import pandas as pd
+
             loaders_dict: Dict[str, Callable[[], pd.DataFrame]] = kwargs[
                 partitioned_arg
             ]
@@ -250,6 +254,7 @@ def split_into_partitions(
         Callable
 
     Example:
+        >>> import pandas as pd
         >>> df = pd.DataFrame({'name': ['Apple', 'Pear'], 'price': [10, 15]})
         >>> @split_into_partitions(
         ...     keys=['name', 'price'],
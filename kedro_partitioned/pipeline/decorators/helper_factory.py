@@ -2,10 +2,15 @@
 
 import re
 from re import Pattern
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Union
 
-import pandas as pd
+from kedro_partitioned.utils.string import regex_prefix
 from kedro_partitioned.utils.typing import IsFunction
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 DATE_FORMAT_ISO = "%Y-%m-%d"
 
 
@@ -38,7 +43,7 @@ def not_filter(fn: IsFunction[str]) -> IsFunction[str]:
 
 
 def regex_filter(pattern: str) -> IsFunction[str]:
-    """Converts a regex pattern into a boolean filter.
+    r"""Converts a regex pattern into a boolean filter.
 
     Args:
         pattern (str)
@@ -55,12 +60,21 @@ def regex_filter(pattern: str) -> IsFunction[str]:
         True
         >>> fn('db')
         False
+
+        Patterns anchored with a literal prefix declare it, so partitioned
+        datasets list only the paths starting with it
+
+        >>> regex_filter(r'^sales/2020-\d{2}').prefixes
+        ['sales/2020-']
     """
     regex = re.compile(pattern)
 
     def filter_fn(x: str) -> bool:
         return bool(regex.search(x))
 
+    prefix = regex_prefix(pattern) if pattern.startswith("^") else None
+    if prefix:
+        filter_fn.prefixes = [prefix]
     return filter_fn
 
 
@@ -87,22 +101,172 @@ def _date_format_to_regex(format: str) -> Pattern:
     )
 
 
+def _date_prefixes(
+    root: str, min_date: "pd.Timestamp", max_date: "pd.Timestamp", format: str
+) -> Union[List[str], None]:
+    """Prefixes of the paths whose dates that follow `root` are in a range.
+
+    Args:
+        root (str): path preceding the dates
+        min_date (pd.Timestamp)
+        max_date (pd.Timestamp)
+        format (str)
+
+    Returns:
+        Union[List[str], None]: one prefix per month, or per year if the
+            format has no month right after the year, or None if the format
+            does not start with the year
+
+    Example:
+        >>> import pandas as pd
+        >>> _date_prefixes('sales/', pd.Timestamp('2020-11-15'),
+        ...                pd.Timestamp('2021-01-02'), '%Y-%m-%d')
+        ['sales/2020-11', 'sales/2020-12', 'sales/2021-01']
+        >>> _date_prefixes('', pd.Timestamp('2020-11-15'),
+        ...                pd.Timestamp('2021-01-02'), '%Y/%d/%m')
+        ['2020', '2021']
+        >>> _date_prefixes('', pd.Timestamp('2020-11-15'),
+        ...                pd.Timestamp('2021-01-02'), '%d%m%Y')
+    """
+    if not format.startswith("%Y"):
+        return None
+    month = format.find("%m")
+    if month > 0 and "%" not in format[2:month]:
+        prefix_format, freq = format[: month + 2], "M"
+    else:
+        prefix_format, freq = "%Y", "Y"
+    import pandas as pd
+
+    periods = pd.period_range(min_date, max_date, freq=freq)
+    return [root + period.strftime(prefix_format) for period in periods]
+
+
+class DateIndex:
+    """Dates parsed once from a listing of paths, sorted for range queries.
+
+    Paths are matched and parsed in a single vectorized pass, then each range
+    query is answered with a binary search over the sorted dates.
+
+    Example:
+        >>> import pandas as pd
+        >>> index = DateIndex(['b/2020-03-01', 'a/2020-01-01', 'c/2021-01-01',
+        ...                    'd/none', 'e/2020-02-01'])
+        >>> len(index)
+        4
+        >>> index.select([(pd.Timestamp('2020-01-15'), pd.Timestamp('2020-12-31'))])
+        ['b/2020-03-01', 'e/2020-02-01']
+
+        Disjoint ranges select the paths in any of them, in listing order
+
+        >>> index.select([(pd.Timestamp('2021-01-01'), pd.Timestamp('2021-01-01')),
+        ...               (pd.Timestamp('2020-01-01'), pd.Timestamp('2020-01-31'))])
+        ['a/2020-01-01', 'c/2021-01-01']
+
+        With a root, the date must directly follow it
+
+        >>> DateIndex(['x/2020-01-01', 'y/x/2020-01-01'], root='x/').select(
+        ...     [(pd.Timestamp.min, pd.Timestamp.max)])
+        ['x/2020-01-01']
+    """
+
+    def __init__(
+        self, paths: Iterable[str], format: str = DATE_FORMAT_ISO, root: str = None
+    ):
+        """Initializes the index.
+
+        Args:
+            paths (Iterable[str]): paths to index, paths without a date are
+                never selected
+            format (str, optional): Defaults to DATE_FORMAT_ISO.
+            root (str, optional): path preceding the date. Defaults to None,
+                i.e. the date can be anywhere.
+        """
+        import numpy as np
+        import pandas as pd
+
+        self._paths = list(paths)
+        pattern = f"(?P<date>{_date_format_to_regex(format).pattern})"
+        if root is not None:
+            pattern = f"^{re.escape(root)}{pattern}"
+        matches = pd.Series(self._paths, dtype=object).str.extract(pattern)["date"]
+        # paths without a match are NaT, while matches that are not valid
+        # dates raise, like the filter applied to each path
+        dates = pd.to_datetime(matches, format=format).to_numpy()
+        (positions,) = np.nonzero(~np.isnat(dates))
+        order = np.argsort(dates[positions], kind="stable")
+        self._dates = dates[positions][order]
+        self._positions = positions[order]
+
+    def __len__(self) -> int:
+        """Number of paths with a date."""
+        return len(self._dates)
+
+    def mask(self, ranges: List[Tuple["pd.Timestamp", "pd.Timestamp"]]) -> "np.ndarray":
+        """Whether each path has a date in any of the ranges.
+
+        Args:
+            ranges (List[Tuple[pd.Timestamp, pd.Timestamp]]): inclusive
+                bounds of each range
+
+        Returns:
+            np.ndarray: booleans aligned to the indexed paths
+        """
+        import numpy as np
+
+        mask = np.zeros(len(self._paths), dtype=bool)
+        for lower, upper in ranges:
+            start = np.searchsorted(self._dates, lower.to_datetime64(), side="left")
+            stop = np.searchsorted(self._dates, upper.to_datetime64(), side="right")
+            mask[self._positions[start:stop]] = True
+        return mask
+
+    def select(self, ranges: List[Tuple["pd.Timestamp", "pd.Timestamp"]]) -> List[str]:
+        """Paths with a date in any of the ranges, in their original order.
+
+        Args:
+            ranges (List[Tuple[pd.Timestamp, pd.Timestamp]]): inclusive
+                bounds of each range
+
+        Returns:
+            List[str]
+        """
+        return [p for p, keep in zip(self._paths, self.mask(ranges)) if keep]
+
+
 def date_range_filter(
-    min_date: str = pd.Timestamp.min,
-    max_date: str = pd.Timestamp.max,
+    min_date: str = None,
+    max_date: str = None,
     format: str = DATE_FORMAT_ISO,
+    root: str = None,
+    ranges: List[Tuple[str, str]] = None,
 ) -> IsFunction[str]:
     """Generates a date_range filter function.
 
     Args:
-        min_date (str, optional): Defaults to pd.Timestamp.min.
-        max_date (str, optional): Defaults to pd.Timestamp.max.
+        min_date (str, optional): Defaults to None, i.e. no lower bound.
+        max_date (str, optional): Defaults to None, i.e. no upper bound.
         format (str, optional): Defaults to DATE_FORMAT_ISO.
+        root (str, optional): Path preceding the date, e.g. 'sales/'. When
+            given, the date must directly follow it, and if both dates are
+            given and the format starts with the year, the filter declares
+            the prefixes of the months (or years) in range, so partitioned
+            datasets list only those paths. Defaults to None, i.e. the date
+            can be anywhere.
+        ranges (List[Tuple[str, str]], optional): disjoint date ranges to
+            use instead of `min_date` and `max_date`. Defaults to None.
 
     Returns:
         IsFunction[str]: A function that takes a string as input, extracts
             a regex match of the specified format and returns True whether
             a string is in date range (both inclusive), otherwise False.
+            Its `many` attribute filters a whole listing at once through a
+            `DateIndex`, which slicers use instead of calling it per path.
+            Both raise if a match of the format is not a valid date, e.g.
+            '2020-02-30'.
+
+    Raises:
+        ValueError: if `ranges` is given together with `min_date` or
+            `max_date`
 
     Example:
         >>> upper = date_range_filter(max_date='2020-02-02', format='%Y-%m-%d')
@@ -134,22 +298,75 @@ def date_range_filter(
         >>> bounded('prefix25-05/2020suffix')
         False
 
+        >>> rooted = date_range_filter(min_date='2020-12-30',
+        ...     max_date='2021-01-02', root='sales/')
+        >>> rooted('sales/2021-01-01/a'), rooted('other/sales/2021-01-01/a')
+        (True, False)
+        >>> rooted.prefixes
+        ['sales/2020-12', 'sales/2021-01']
+
+        >>> quarters = date_range_filter(ranges=[('2020-01-01', '2020-03-31'),
+        ...     ('2020-10-01', '2020-12-31')], root='sales/')
+        >>> quarters.many(['sales/2020-02-01', 'sales/2020-05-01',
+        ...                'sales/2020-11-01'])
+        ['sales/2020-02-01', 'sales/2020-11-01']
+        >>> quarters.prefixes
+        ['sales/2020-01', 'sales/2020-02', 'sales/2020-03', 'sales/2020-10', \
+'sales/2020-11', 'sales/2020-12']
+
     Warning:
         the specified format format must not be ambiguous. for example, if
         a string format is '%Y%m%d', and another number of 8 digits appear,
         it will be recognized as date. if it is a path for example, this can
         be avoided by using '/%Y%m%d/' as the format pattern
     """
-    pd_min = pd.to_datetime(min_date, format=format)
-    pd_max = pd.to_datetime(max_date, format=format)
+    import pandas as pd
+
+    pd_min = (
+        pd.Timestamp.min
+        if min_date is None
+        else pd.to_datetime(min_date, format=format)
+    )
+    pd_max = (
+        pd.Timestamp.max
+        if max_date is None
+        else pd.to_datetime(max_date, format=format)
+    )
+    unbounded = pd_min == pd.Timestamp.min, pd_max == pd.Timestamp.max
+    if ranges is not None and not all(unbounded):
+        raise ValueError(
+            "`ranges` cannot be used together with `min_date` or `max_date`"
+        )
+    if ranges is None:
+        bounds = [(pd_min, pd_max)]
+    else:
+        bounds = [
+            (pd.to_datetime(lower, format=format), pd.to_datetime(upper, format=format))
+            for lower, upper in ranges
+        ]
     regex = _date_format_to_regex(format)
 
     def filter(path: str) -> bool:
-        match = re.search(regex, path)
+        if root is None:
+            match = re.search(regex, path)
+        elif path.startswith(root):
+            match = re.match(regex, path[len(root) :])
+        else:
+            match = None
         if match:
             str_date = match[0]
             pd_date = pd.to_datetime(str_date, format=format)
-            return pd_date >= pd_min and pd_date <= pd_max
+            return any(lower <= pd_date <= upper for lower, upper in bounds)
         return False
 
+    def many(paths: Iterable[str]) -> List[str]:
+        return DateIndex(paths, format, root).select(bounds)
+
+    filter.many = many
+    if root is not None and (ranges is not None or not any(unbounded)):
+        prefixes = [
+            _date_prefixes(root, lower, upper, format) for lower, upper in bounds
+        ]
+        if all(p is not None for p in prefixes):
+            filter.prefixes = [prefix for p in prefixes for prefix in p]
     return filter
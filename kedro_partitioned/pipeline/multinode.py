@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 from abc import abstractmethod
-from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
-from functools import cached_property, reduce, wraps
+from collections import Counter, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from functools import cached_property, lru_cache, partial, wraps
 import itertools
+import logging
 import math
 import re
+import statistics
+import time
+import traceback
+import uuid
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Pattern,
     Set,
     Tuple,
@@ -24,14 +39,20 @@ from typing_extensions import Literal, NotRequired
 
 from kedro.pipeline.node import Node
 from kedro.pipeline import node
+from kedro_partitioned.extras.datasets.nullable_dataset import (
+    Null,
+    NullType,
+    isnull,
+)
+from kedro_partitioned.io.checkpoint_dataset import Checkpoint
+from kedro_partitioned.io.lease_dataset import Leases
+from kedro_partitioned.io.partition_loaders import PartitionLoaders
 from kedro_partitioned.utils.constants import MAX_NODES, MAX_WORKERS
 from kedro_partitioned.utils.other import (
     nonefy,
     truthify,
 )
-from kedro_partitioned.utils.string import (
-    get_filepath_without_extension,
-)
+from kedro_partitioned.utils.partition_index import JOINS, Join, partition_index
 from kedro_partitioned.utils.iterable import (
     firstorlist,
     partition,
@@ -40,9 +61,11 @@ from kedro_partitioned.utils.iterable import (
     optionaltolist,
 )
 from kedro.pipeline import Pipeline
+from kedro_partitioned.utils.scheduling import jump_hash, lpt_schedule
 from kedro_partitioned.utils.typing import T, Args, IsFunction
 
 _Partitioned = Dict[str, Callable[[], Any]]
+_Balance = Union[Literal["count", "size", "runtime", "hash"], Callable[[str], float]]
 
 
 class _Template(TypedDict):
@@ -76,6 +99,69 @@ class _Configurator(TypedDict, total=False):
     data: dict
 
 
+class _SliceStats(TypedDict):
+    """Stats recorded by a slice after processing its partitions.
+
+    Attributes:
+        timestamp: Unix time of when the slice finished.
+        elapsed: Seconds spent loading and processing each partition.
+        resumed: Partitions skipped because a previous attempt of the same
+            run committed them.
+        errors: Traceback of each partition that failed, if the slice
+            continues on errors.
+    """
+
+    timestamp: float
+    elapsed: Dict[str, float]
+    resumed: NotRequired[List[str]]
+    errors: NotRequired[Dict[str, str]]
+
+
+class _PartitionError(NamedTuple):
+    """Result of a partition that failed, if the slice continues on errors."""
+
+    traceback: str
+
+
+class _SlicePlan(TypedDict):
+    """Partitions planned by a slicer node for each one of the slices.
+
+    Attributes:
+        version: Version of the plan schema. Plans written by older versions
+            as a plain list of slices are read as version 0.
+        slices: Partitions of each slice.
+        configurators: Index of the configurator resolved for each partition,
+            for each slice. Partitions without a configurator are omitted.
+        manifests: Partition ids of each input listed by the slicer, in the
+            same order of the partitions, for each slice. Only inputs that can
+            create loaders for known partitions are listed, and slices
+            without partitions have an empty manifest.
+        run_id: Identifies the run, scoping the leases of work stealing and
+            the commit markers of checkpoints.
+    """
+
+    version: int
+    slices: List[List[str]]
+    configurators: NotRequired[List[Dict[str, int]]]
+    manifests: NotRequired[List[Dict[str, List[str]]]]
+    run_id: NotRequired[str]
+
+
+class _SlicerReport(TypedDict):
+    """Slicer plan, with the partition estimates used to build it.
+
+    Attributes:
+        plan: Plan written by the slicer.
+        costs: Cost of each planned partition, or None if balanced by count.
+        sizes: Size in bytes of each planned partition, or None if any size
+            could not be found.
+    """
+
+    plan: _SlicePlan
+    costs: Union[Dict[str, float], None]
+    sizes: Union[Dict[str, float], None]
+
+
 class _Configurators(TypedDict):
     """
     TypedDict for a container of `Configurator`s.
@@ -104,6 +190,7 @@ class ConfiguratorFinder:
 
     NOT_FOUND = -1
     ANY = "*"
+    _REGEX_CHARS = set(".^$*+?{}[]\\|()")
 
     def __init__(self, configurators: _Configurators):
         """Initializes the ConfiguratorFinder.
@@ -113,6 +200,7 @@ class ConfiguratorFinder:
         """
         self._template = configurators["template"]
         self._configurators = configurators["configurators"]
+        self._memo: Dict[str, Union[int, None]] = {}
 
     @cached_property
     def keys(self) -> List[str]:
@@ -181,27 +269,149 @@ class ConfiguratorFinder:
             + r"$"
         )
 
-    def _score_match(self, path: str, configurator: _Configurator) -> int:
-        """Computes the score of a configurator if it matches the path.
+    def _score(self, configurator: _Configurator) -> int:
+        """Computes the score of a configurator given its target specificity.
 
         Args:
-            path (str): Path to match the configurator with.
             configurator (_Configurator): Configurator to score.
 
         Returns:
             int: Score of the configurator.
         """
-        regex = self._build_regex(configurator)
-        targets = configurator["target"]
-        weights = self.weights
-        if re.match(regex, path):
-            raw_possibility = [group != self.ANY for group in targets]
-            possibility = hash(
-                tuple(key for _, key in sorted(zip(weights, raw_possibility)))
+        raw_possibility = [group != self.ANY for group in configurator["target"]]
+        possibility = hash(
+            tuple(key for _, key in sorted(zip(self.weights, raw_possibility)))
+        )
+        return self.scores[possibility]
+
+    @cached_property
+    def _compiled(self) -> List[Tuple[Tuple[int, int], Pattern, _Configurator]]:
+        """Compiled configurators, sorted by best score and declaration order.
+
+        Returns:
+            List[Tuple[Tuple[int, int], Pattern, _Configurator]]: rank (i.e.
+                negative score and index), compiled regex and configurator
+        """
+        return sorted(
+            (
+                (-self._score(configurator), i),
+                re.compile(self._build_regex(configurator)),
+                configurator,
             )
-            return self.scores[possibility]
-        else:
-            return self.NOT_FOUND
+            for i, configurator in enumerate(self._configurators)
+        )
+
+    @classmethod
+    def _is_literal(cls, string: str) -> bool:
+        return not any(char in cls._REGEX_CHARS for char in string)
+
+    @cached_property
+    def _literal_index(self) -> Dict[str, Tuple[Tuple[int, int], _Configurator]]:
+        """Index of paths matched by configurators without regex targets.
+
+        Configurators whose targets are all literals (or lists of literals)
+        match exact paths, which are rendered once so lookups need no regex.
+
+        Returns:
+            Dict[str, Tuple[Tuple[int, int], _Configurator]]: rank and
+                configurator by path
+        """
+        index: Dict[str, Tuple[Tuple[int, int], _Configurator]] = {}
+        pattern = self._template["pattern"]
+        if not self._is_literal(re.sub(r"\{(.+?)\}", "", pattern)):
+            return index
+        for rank, _, configurator in self._compiled:
+            values = [tolist(target) for target in configurator["target"]]
+            if not all(
+                value != self.ANY and self._is_literal(value)
+                for options in values
+                for value in options
+            ):
+                continue
+            for combination in itertools.product(*values):
+                replacements = iter(combination)
+                path = re.sub(r"\{(.+?)\}", lambda _: next(replacements), pattern)
+                index.setdefault(path, (rank, configurator))
+        return index
+
+    def _find(self, path: str) -> Union[int, None]:
+        literal_rank, _ = self._literal_index.get(path, (None, None))
+        for rank, regex, _ in self._compiled:
+            if literal_rank is not None and rank >= literal_rank:
+                break
+            if regex.match(path):
+                return rank[1]
+        return None if literal_rank is None else literal_rank[1]
+
+    @cached_property
+    def _values_regex(self) -> Pattern:
+        """Regex capturing the placeholders of the template.
+
+        Returns:
+            Pattern
+        """
+        any_regexes = self._template.get("any", {})
+        placeholders = iter(range(len(self.keys)))
+        return re.compile(
+            r"^"
+            + re.sub(
+                r"\{(.+?)\}",
+                lambda m: (
+                    f"(?P<_{next(placeholders)}>{any_regexes.get(m.group(1), '.*')})"
+                ),
+                self._template["pattern"],
+            )
+            + r"$"
+        )
+
+    def values(self, path: str) -> Union[Dict[str, str], None]:
+        """Extracts the template placeholder values of a path.
+
+        Args:
+            path (str): Path to extract the values from.
+
+        Returns:
+            Union[Dict[str, str], None]: value by placeholder, or None if the
+                path does not match the template.
+
+        Example:
+            >>> finder = ConfiguratorFinder({
+            ...     'template': {'pattern': 'data/{store}/{product}',
+            ...                  'any': {'store': '[^/]+'}},
+            ...     'configurators': []})
+            >>> finder.values('data/s1/p/1')
+            {'store': 's1', 'product': 'p/1'}
+            >>> finder.values('other/s1/p1') is None
+            True
+        """
+        match = self._values_regex.match(path)
+        if match is None:
+            return None
+        return {key: match.group(f"_{i}") for i, key in enumerate(self.keys)}
+
+    def index(self, path: str) -> Union[int, None]:
+        """Finds the index of the best configurator for a given path.
+
+        Args:
+            path (str): Path to find the best configurator for.
+
+        Returns:
+            Union[int, None]: Index of the best configurator in the
+                configurators list.
+
+        Example:
+            >>> finder = ConfiguratorFinder({
+            ...     'template': {'pattern': 'data/{store}'},
+            ...     'configurators': [{'target': ['*'], 'data': 0},
+            ...                       {'target': ['s1'], 'data': 1}]})
+            >>> finder.index('data/s1'), finder.index('data/s2')
+            (1, 0)
+            >>> finder.index('other/s1') is None
+            True
+        """
+        if path not in self._memo:
+            self._memo[path] = self._find(path)
+        return self._memo[path]
 
     def __getitem__(self, path: str) -> Union[_Configurator, None]:
         """Finds the best configurator for a given path.
@@ -211,15 +421,24 @@ class ConfiguratorFinder:
 
         Returns:
             Union[_Configurator, None]: Best configurator for the path.
+
+        Example:
+            >>> finder = ConfiguratorFinder({
+            ...     'template': {'pattern': 'data/{store}/{product}'},
+            ...     'configurators': [
+            ...         {'target': ['*', '*'], 'data': 0},
+            ...         {'target': ['s1', '*'], 'data': 1},
+            ...         {'target': [['s1', 's2'], 'p1'], 'data': 2},
+            ...         {'target': ['s.', 'p2'], 'data': 3}]})
+            >>> [finder[f'data/{s}/{p}']['data']
+            ...  for s in ['s1', 's2', 's3'] for p in ['p1', 'p2', 'p3']]
+            [2, 3, 1, 2, 3, 0, 0, 3, 0]
+
+            >>> finder['other/s1/p1'] is None
+            True
         """
-        configurator = max(
-            self._configurators, key=lambda x: self._score_match(path, x)
-        )
-        return (
-            None
-            if self._score_match(path, configurator) == self.NOT_FOUND
-            else configurator
-        )
+        index = self.index(path)
+        return None if index is None else self._configurators[index]
 
 
 class _CustomizedFuncNode(Node):
@@ -269,20 +488,20 @@ class _SlicerNode(_CustomizedFuncNode):
         >>> dictionary = {'a': {'subpath/a.txt': lambda: 3,
         ...                     'subpath/b.txt': lambda: 4}}
         >>> n.run(inputs=dictionary)
-        {'b-slicer': [['subpath/a'], ['subpath/b']]}
+        {'b-slicer': {'version': 1, 'slices': [['subpath/a'], ['subpath/b']]}}
 
         >>> dictionary = {'a': {'subpath/a.txt': lambda: 3,
         ...                     'subpath/b.txt': lambda: 4,
         ...                     'subpath/c.txt': lambda: 5}}
-        >>> n.run(inputs=dictionary)
-        {'b-slicer': [['subpath/a', 'subpath/b'], ['subpath/c']]}
+        >>> n.run(inputs=dictionary)['b-slicer']['slices']
+        [['subpath/a', 'subpath/b'], ['subpath/c']]
 
         >>> n = _SlicerNode(3, 'a', 'b', 'x')
         >>> dictionary = {'a': {'subpath/a.txt': lambda: 3,
         ...                     'subpath/b.txt': lambda: 4,
         ...                     'subpath/c.txt': lambda: 5}}
-        >>> n.run(inputs=dictionary)
-        {'b-slicer': [['subpath/a'], ['subpath/b'], ['subpath/c']]}
+        >>> n.run(inputs=dictionary)['b-slicer']['slices']
+        [['subpath/a'], ['subpath/b'], ['subpath/c']]
 
         With multiple inputs
 
@@ -291,8 +510,8 @@ class _SlicerNode(_CustomizedFuncNode):
         ...                     'subpath/b.txt': lambda: 4},
         ...               'b': {'subpath/a.txt': lambda: 3,
         ...                     'subpath/b.txt': lambda: 4}}
-        >>> n.run(inputs=dictionary)
-        {'c-slicer': [['subpath/a'], ['subpath/b']]}
+        >>> n.run(inputs=dictionary)['c-slicer']['slices']
+        [['subpath/a'], ['subpath/b']]
 
         Intersect partitions
 
@@ -301,8 +520,8 @@ class _SlicerNode(_CustomizedFuncNode):
         ...               'b': {'subpath/a.txt': lambda: 3,
         ...                     'subpath/b.txt': lambda: 4,
         ...                     'subpath/c.txt': lambda: 5}}
-        >>> n.run(inputs=dictionary)
-        {'c-slicer': [['subpath/a'], ['subpath/b']]}
+        >>> n.run(inputs=dictionary)['c-slicer']['slices']
+        [['subpath/a'], ['subpath/b']]
 
         Using configurators
 
@@ -320,10 +539,81 @@ class _SlicerNode(_CustomizedFuncNode):
         ...                         {'target': ['*'], 'cached': False,
         ...                             'data': 1}]}}
         >>> n.run(inputs=dictionary)
-        {'c-slicer': [['subpath/b'], []]}
+        {'c-slicer': {'version': 1, 'slices': [['subpath/b'], []], \
+'configurators': [{'subpath/b': 1}, {}]}}
+
+        Balancing by a cost function
+
+        >>> costs = {'subpath/a': 10, 'subpath/b': 3, 'subpath/c': 4}
+        >>> n = _SlicerNode(2, 'a', 'b', 'x', balance=costs.get)
+        >>> dictionary = {'a': {'subpath/a.txt': lambda: 3,
+        ...                     'subpath/b.txt': lambda: 4,
+        ...                     'subpath/c.txt': lambda: 5}}
+        >>> n.run(inputs=dictionary)['b-slicer']['slices']
+        [['subpath/a'], ['subpath/b', 'subpath/c']]
+
+        Keeping partitions of the same store together
+
+        >>> n = _SlicerNode(2, 'a', 'b', 'x', configurator='params:z',
+        ...                 group_by='store')
+        >>> n.run(inputs={'a': {'s1/p1.txt': lambda: 1,
+        ...                     's1/p2.txt': lambda: 2,
+        ...                     's2/p1.txt': lambda: 3,
+        ...                     's3/p1.txt': lambda: 4},
+        ...               'params:z': {
+        ...                   'template': {'pattern': '{store}/{product}'},
+        ...                   'configurators': [{'target': ['*', '*'],
+        ...                                      'data': 1}]}})
+        {'b-slicer': {'version': 1, \
+'slices': [['s1/p1', 's1/p2'], ['s2/p1', 's3/p1']], \
+'configurators': [{'s1/p1': 0, 's1/p2': 0}, {'s2/p1': 0, 's3/p1': 0}]}}
+
+        Slicing only as much as needed
+
+        >>> n = _SlicerNode(3, 'a', 'b', 'x', auto_slices=True)
+        >>> plan = n.run(inputs={'a': {'subpath/a.txt': lambda: 3,
+        ...                            'subpath/b.txt': lambda: 4}})
+        >>> plan['b-slicer']['slices']
+        [['subpath/a'], ['subpath/b'], []]
+
+        Identifying the run for work stealing
+
+        >>> n = _SlicerNode(2, 'a', 'b', 'x', work_stealing=True)
+        >>> n.leases_input
+        'b-slicer-leases'
+        >>> plan = n.run(inputs=dictionary)['b-slicer']
+        >>> plan['slices'], len(plan['run_id'])
+        ([['subpath/a', 'subpath/b'], ['subpath/c']], 32)
+
+        Balancing by the runtime of previous runs
+
+        >>> n = _SlicerNode(2, 'a', 'b', 'x', balance='runtime')
+        >>> n
+        Node(nonefy, ['a', 'b-slicer-stats'], 'b-slicer', 'x')
+        >>> dictionary['b-slicer-stats'] = {
+        ...     'x-slice-0': lambda: {'timestamp': 1,
+        ...                           'elapsed': {'subpath/a': 1}},
+        ...     'x-slice-1': lambda: {'timestamp': 1,
+        ...                           'elapsed': {'subpath/b': 3,
+        ...                                       'subpath/c': 4}}}
+        >>> n.run(inputs=dictionary)['b-slicer']['slices']
+        [['subpath/c'], ['subpath/a', 'subpath/b']]
+
+        Reading plans written by older versions as a list of slices
+
+        >>> _SlicerNode.read_plan([['subpath/a'], ['subpath/b']])
+        {'version': 0, 'slices': [['subpath/a'], ['subpath/b']]}
     """
 
     SLICER_SUFFIX = "-slicer"
+    STATS_SUFFIX = "-stats"
+    LEASES_SUFFIX = "-leases"
+    CHECKPOINTS_SUFFIX = "-checkpoints"
+    BALANCE_COUNT = "count"
+    BALANCE_SIZE = "size"
+    BALANCE_RUNTIME = "runtime"
+    BALANCE_HASH = "hash"
+    PLAN_VERSION = 1
 
     def __init__(
         self,
@@ -336,15 +626,31 @@ class _SlicerNode(_CustomizedFuncNode):
         namespace: str = None,
         filter: IsFunction[str] = truthify,
         configurator: str = None,
+        balance: _Balance = BALANCE_COUNT,
+        work_stealing: bool = False,
+        auto_slices: bool = False,
+        group_by: Union[str, List[str]] = None,
+        checkpoint: bool = False,
+        join: Join = "inner",
     ):
+        self._work_stealing = work_stealing
+        self._checkpoint = checkpoint
+        self._join = join
+        self._auto_slices = auto_slices
+        self._group_by = optionaltolist(group_by)
         self._partitioned_inputs = partitioned_inputs
         self._slice_count = slice_count
         self._original_output = partitioned_outputs
         self._filter = filter
         self._configurator = configurator
+        self._balance = balance
         super().__init__(
             func=nonefy,
-            inputs=tolist(partitioned_inputs) + optionaltolist(configurator),
+            inputs=(
+                tolist(partitioned_inputs)
+                + optionaltolist(configurator)
+                + optionaltolist(self.stats_input)
+            ),
             outputs=self._add_slicer_suffix(partitioned_outputs),
             name=name,
             tags=tags,
@@ -356,13 +662,90 @@ class _SlicerNode(_CustomizedFuncNode):
     def slice_count(self) -> int:
         return self._slice_count
 
+    @property
+    def balance(self) -> _Balance:
+        """How partitions are distributed among the slices.
+
+        Returns:
+            _Balance
+        """
+        return self._balance
+
+    @property
+    def join(self) -> Join:
+        """How the partitions of multiple inputs are matched.
+
+        Returns:
+            Join
+        """
+        return self._join
+
     @property
     def original_output(self) -> str:
         return self._original_output
 
     @property
     def json_output(self) -> str:
-        return self._outputs
+        return self._add_slicer_suffix(self._original_output)
+
+    @staticmethod
+    def read_plan(plan: Union[List[List[str]], _SlicePlan]) -> _SlicePlan:
+        """Reads a slicer output, accepting the list of slices of old versions.
+
+        Args:
+            plan (Union[List[List[str]], _SlicePlan]): slicer json output
+
+        Returns:
+            _SlicePlan
+        """
+        if isinstance(plan, list):
+            return {"version": 0, "slices": plan}
+        return plan
+
+    @property
+    def stats_name(self) -> str:
+        """Name of the folder where the slices write their stats.
+
+        Returns:
+            str
+        """
+        return f"{self.json_output}{self.STATS_SUFFIX}"
+
+    @property
+    def stats_input(self) -> Union[str, None]:
+        """Stats written by the slices in previous runs, if balancing by runtime.
+
+        Returns:
+            Union[str, None]
+        """
+        if self._balance == self.BALANCE_RUNTIME:
+            return self.stats_name
+        else:
+            return None
+
+    @property
+    def leases_input(self) -> Union[str, None]:
+        """Leases the slices use to claim partitions, if stealing work.
+
+        Returns:
+            Union[str, None]
+        """
+        if self._work_stealing:
+            return f"{self.json_output}{self.LEASES_SUFFIX}"
+        else:
+            return None
+
+    @property
+    def checkpoints_name(self) -> Union[str, None]:
+        """Folder of the partition commit markers, if checkpointing.
+
+        Returns:
+            Union[str, None]
+        """
+        if self._checkpoint:
+            return f"{self.json_output}{self.CHECKPOINTS_SUFFIX}"
+        else:
+            return None
 
     def _copy(self, **overwrite_params: Any) -> _SlicerNode:
         params = {
@@ -375,6 +758,12 @@ class _SlicerNode(_CustomizedFuncNode):
             "confirms": self._confirms,
             "configurator": self._configurator,
             "filter": self._filter,
+            "balance": self._balance,
+            "work_stealing": self._work_stealing,
+            "auto_slices": self._auto_slices,
+            "group_by": self._group_by,
+            "checkpoint": self._checkpoint,
+            "join": self._join,
         }
         params.update(overwrite_params)
         return self.__class__(**params)
@@ -403,46 +792,59 @@ class _SlicerNode(_CustomizedFuncNode):
             else f"{string}{cls.SLICER_SUFFIX}"
         )
 
-    def _intersect_partitioneds(self, partitioneds: List[_Partitioned]) -> List[str]:
-        """Takes only the matching partitions (required for the input `zip`).
+    def _join_partitioneds(self, partitioneds: List[_Partitioned]) -> List[str]:
+        """Takes the partitions of the inputs given the join mode.
 
         Args:
             partitioneds (List[Partitioned]): partitioned dicionaries
 
         Returns:
             List[str]
-        """
-        partitioned_sets = [
-            {get_filepath_without_extension(path) for path in partitioned}
-            for partitioned in partitioneds
-        ]
 
-        return list(
-            reduce(lambda inter, curr: inter.intersection(curr), partitioned_sets)
-        )
+        Example:
+            >>> inputs = [{'a.csv': 0, 'b.csv': 0}, {'b.csv': 0, 'c.csv': 0}]
+            >>> _SlicerNode(2, ['x', 'y'], 'z', 'n')._join_partitioneds(inputs)
+            ['b']
+            >>> _SlicerNode(2, ['x', 'y'], 'z', 'n', join='left'
+            ...     )._join_partitioneds(inputs)
+            ['a', 'b']
+            >>> _SlicerNode(2, ['x', 'y'], 'z', 'n', join='outer'
+            ...     )._join_partitioneds(inputs)
+            ['a', 'b', 'c']
+        """
+        indexes = [partition_index(partitioned) for partitioned in partitioneds]
+        return indexes[0].join(*indexes[1:], how=self._join)
 
-    def _calc_slice_bound(self, partition_count: int, slice_id: int) -> int:
+    def _calc_slice_bound(
+        self, partition_count: int, slice_id: int, slice_count: int = None
+    ) -> int:
         """Calculates the bounds of the subset of partitions for node.
 
         Args:
             partition_count (int): size of the partitions dictionary
             slice_id (int): current slice id
+            slice_count (int, optional): number of slices receiving
+                partitions. Defaults to None, i.e. all of them.
 
         Returns:
             int
         """
-        return math.ceil((partition_count / self._slice_count) * slice_id)
+        slice_count = slice_count or self._slice_count
+        return math.ceil((partition_count / slice_count) * slice_id)
 
     def _slice_partitions(
         self,
         partitions: List[str],
         slice_id: int,
+        slice_count: int = None,
     ) -> List[str]:
         """Returns a subset of the original partitions.
 
         Args:
             partitions (List[str])
             slice_id (int)
+            slice_count (int, optional): number of slices receiving
+                partitions. Defaults to None, i.e. all of them.
 
         Returns:
             List[str]
@@ -452,55 +854,603 @@ class _SlicerNode(_CustomizedFuncNode):
             self._calc_slice_bound(
                 partition_count,
                 slice_id,
+                slice_count,
             ) : self._calc_slice_bound(
                 partition_count,
                 slice_id + 1,
+                slice_count,
             )
         ]
 
+    @classmethod
+    def _loader_size(cls, loader: Callable[[], Any]) -> Union[int, None]:
+        """Asks the filesystem for the size of a partition given its loader.
+
+        Args:
+            loader (Callable[[], Any]): bound `load` method of a partition
+
+        Returns:
+            Union[int, None]: size in bytes, or None if it cannot be found
+        """
+        dataset = getattr(loader, "__self__", None)
+        filesystem = getattr(dataset, "_fs", None)
+        filepath = getattr(dataset, "_filepath", None)
+        if filesystem is None or filepath is None:
+            return None
+        return filesystem.size(str(filepath))
+
+    def _partition_sizes(
+        self, partitions: List[str], partitioneds: List[_Partitioned]
+    ) -> Union[Dict[str, float], None]:
+        """Sums the size in bytes of each partition across the inputs.
+
+        Args:
+            partitions (List[str]): partitions to compute the size of
+            partitioneds (List[Partitioned]): partitioned dicionaries
+
+        Returns:
+            Union[Dict[str, float], None]: size by partition, or None if any
+                size could not be found
+        """
+        sizes = dict.fromkeys(partitions, 0.0)
+        for partitioned in partitioneds:
+            listed_sizes = getattr(partitioned, "sizes", {})
+            paths = partition_index(partitioned).subset(partitions)
+            for partition_id, path in paths.items():
+                size = listed_sizes.get(path)
+                if size is None:
+                    size = self._loader_size(partitioned[path])
+                if size is None:
+                    return None
+                sizes[partition_id] += size
+        return sizes
+
+    @classmethod
+    def _historical_elapsed(cls, stats: _Partitioned) -> Dict[str, float]:
+        """Sums the latest elapsed time of each partition across the nodes.
+
+        Args:
+            stats (Partitioned): slice stats by the slice node name
+
+        Returns:
+            Dict[str, float]: elapsed seconds by partition
+
+        Example:
+            >>> _SlicerNode._historical_elapsed({
+            ...     'x-slice-0': lambda: {'timestamp': 2,
+            ...                           'elapsed': {'a': 1, 'b': 2}},
+            ...     'x-slice-1': lambda: {'timestamp': 1,
+            ...                           'elapsed': {'a': 10}},
+            ...     'y-slice-0': lambda: {'timestamp': 2,
+            ...                           'elapsed': {'a': 3}}})
+            {'a': 4, 'b': 2}
+        """
+        latest: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        for slice_name, loader in stats.items():
+            node_name = re.sub(rf"{_MultiNode.SLICE_SUFFIX}\d+$", "", slice_name)
+            slice_stats: _SliceStats = loader()
+            for path, elapsed in slice_stats["elapsed"].items():
+                key = (node_name, path)
+                if key not in latest or latest[key][0] < slice_stats["timestamp"]:
+                    latest[key] = (slice_stats["timestamp"], elapsed)
+
+        elapsed_sum: Dict[str, float] = {}
+        for (_, path), (_, elapsed) in latest.items():
+            elapsed_sum[path] = elapsed_sum.get(path, 0) + elapsed
+        return elapsed_sum
+
+    def _runtime_costs(
+        self,
+        partitions: List[str],
+        sizes: Callable[[], Union[Dict[str, float], None]],
+        stats: Union[_Partitioned, None],
+    ) -> Union[Dict[str, float], None]:
+        """Estimates the cost of each partition by its previous runtimes.
+
+        Partitions without a previous runtime are estimated by their size,
+        converted to seconds using the runtime per byte of the known ones.
+
+        Args:
+            partitions (List[str]): partitions to estimate the cost of
+            sizes (Callable[[], Union[Dict[str, float], None]]): returns the
+                size by partition
+            stats (Union[Partitioned, None]): slice stats of previous runs
+
+        Returns:
+            Union[Dict[str, float], None]: cost by partition, or None if the
+                partitions must be balanced by count
+        """
+        elapsed = self._historical_elapsed(stats) if stats else {}
+        known = {p: elapsed[p] for p in partitions if p in elapsed}
+        if len(known) == len(partitions):
+            return known
+
+        sizes = sizes()
+        if not known:
+            return sizes
+
+        known_size = sum(sizes[p] for p in known) if sizes else 0
+        if known_size > 0:
+            rate = sum(known.values()) / known_size
+            return {p: known.get(p, sizes[p] * rate) for p in partitions}
+        else:
+            mean = statistics.mean(known.values())
+            return {p: known.get(p, mean) for p in partitions}
+
+    def _partition_costs(
+        self,
+        partitions: List[str],
+        sizes: Callable[[], Union[Dict[str, float], None]],
+        stats: Union[_Partitioned, None] = None,
+    ) -> Union[Dict[str, float], None]:
+        """Estimates the cost of each partition given the balance strategy.
+
+        Args:
+            partitions (List[str]): partitions to estimate the cost of
+            sizes (Callable[[], Union[Dict[str, float], None]]): returns the
+                size by partition, only called if the strategy needs it
+            stats (Union[Partitioned, None]): slice stats of previous runs
+
+        Returns:
+            Union[Dict[str, float], None]: cost by partition, or None if the
+                partitions must be balanced by count
+        """
+        if callable(self._balance):
+            return {p: self._balance(p) for p in partitions}
+        elif self._balance == self.BALANCE_RUNTIME:
+            return self._runtime_costs(partitions, sizes, stats)
+        elif self._balance == self.BALANCE_SIZE:
+            sizes = sizes()
+            if sizes is None:
+                self._logger.warning(
+                    f'Could not find partition sizes for "{self.name}", '
+                    "balancing by partition count"
+                )
+            return sizes
+        else:
+            return None
+
+    def _assign_partitions(
+        self,
+        partitions: List[str],
+        costs: Union[Dict[str, float], None],
+        configurators: _Configurators = None,
+    ) -> List[List[str]]:
+        """Assigns the sorted partitions to the slices.
+
+        Args:
+            partitions (List[str]): sorted partitions
+            costs (Union[Dict[str, float], None]): cost by partition, or None
+                to balance by count
+            configurators (_Configurators): configurators, required to group
+                partitions
+
+        Returns:
+            List[List[str]]: partitions of each slice
+
+        Note:
+            Hash balancing always hashes into every slice, also when slicing
+            automatically, so the number of buckets, and thus the slice of
+            each partition, does not depend on the partitions listed.
+        """
+        if self._group_by:
+            groups = self._group_partitions(partitions, configurators)
+            group_costs = {
+                group: sum(costs[p] for p in members) if costs else len(members)
+                for group, members in groups.items()
+            }
+            if self._balance == self.BALANCE_HASH:
+                shares = self._hash_slices(groups, self._slice_count, key="/".join)
+            else:
+                active = self._active_slice_count(list(groups), group_costs)
+                shares = lpt_schedule(group_costs, active)
+            slices = [
+                sorted(p for group in share for p in groups[group]) for share in shares
+            ]
+        elif self._balance == self.BALANCE_HASH:
+            slices = self._hash_slices(partitions, self._slice_count)
+        else:
+            active = self._active_slice_count(partitions, costs)
+            if costs is None:
+                slices = [
+                    self._slice_partitions(partitions, i, active) for i in range(active)
+                ]
+            else:
+                slices = [sorted(s) for s in lpt_schedule(costs, active)]
+        return slices + [[] for _ in range(self._slice_count - len(slices))]
+
+    @staticmethod
+    def _hash_slices(
+        items: Iterable[T], slice_count: int, key: Callable[[T], str] = str
+    ) -> List[List[T]]:
+        """Assigns each item to a slice by the consistent hash of its key.
+
+        Args:
+            items (Iterable[T]): sorted items to assign
+            slice_count (int): number of slices
+            key (Callable[[T], str]): hashed key of an item. Defaults to str.
+
+        Returns:
+            List[List[T]]: items of each slice, keeping their order
+
+        Example:
+            >>> _SlicerNode._hash_slices(['a', 'b', 'c', 'd'], 2)
+            [['a', 'c', 'd'], ['b']]
+        """
+        slices: List[List[T]] = [[] for _ in range(slice_count)]
+        for item in items:
+            slices[jump_hash(key(item), slice_count)].append(item)
+        return slices
+
+    def _group_partitions(
+        self, partitions: List[str], configurators: _Configurators
+    ) -> Dict[Tuple[str, ...], List[str]]:
+        """Groups the partitions by the `group_by` template placeholders.
+
+        Partitions that do not match the template are kept alone. Groups are
+        tagged, so an unmatched partition named after a placeholder value is
+        not merged into its group.
+
+        Args:
+            partitions (List[str]): sorted partitions
+            configurators (_Configurators)
+
+        Returns:
+            Dict[Tuple[str, ...], List[str]]: partitions by group
+
+        Example:
+            >>> n = _SlicerNode(2, 'a', 'b', 'x', configurator='params:z',
+            ...                 group_by='store')
+            >>> n._group_partitions(['s1', 's1/p1', 's1/p2'], {
+            ...     'template': {'pattern': '{store}/{product}'},
+            ...     'configurators': []})
+            {('unmatched', 's1'): ['s1'], ('group', 's1'): ['s1/p1', 's1/p2']}
+        """
+        finder = ConfiguratorFinder(configurators)
+        groups: Dict[Tuple[str, ...], List[str]] = {}
+        for p in partitions:
+            values = finder.values(p)
+            group = (
+                ("unmatched", p)
+                if values is None
+                else ("group",) + tuple(values[key] for key in self._group_by)
+            )
+            groups.setdefault(group, []).append(p)
+        return groups
+
+    def _active_slice_count(
+        self, partitions: List[str], costs: Union[Dict[str, float], None]
+    ) -> int:
+        """Number of slices that receive partitions.
+
+        When slicing automatically, slices are limited to the number of
+        partitions, and to the number of slices that can still shorten the
+        slowest slice, i.e. the total cost over the costliest partition.
+
+        Args:
+            partitions (List[str]): partitions to slice
+            costs (Union[Dict[str, float], None]): cost by partition
+
+        Returns:
+            int
+
+        Example:
+            >>> n = _SlicerNode(8, 'a', 'b', 'x', auto_slices=True)
+            >>> n._active_slice_count(['a', 'b', 'c'], None)
+            3
+            >>> n._active_slice_count(['a', 'b', 'c'], {'a': 4, 'b': 1, 'c': 1})
+            2
+            >>> n._active_slice_count([], None)
+            1
+        """
+        if not self._auto_slices:
+            return self._slice_count
+        active = min(self._slice_count, max(1, len(partitions)))
+        if costs and max(costs.values()) > 0:
+            active = min(active, math.ceil(sum(costs.values()) / max(costs.values())))
+        return active
+
     def _apply_filter(self, intersection: List[str]) -> List[str]:
+        many = getattr(self._filter, "many", None)
+        if many is not None:
+            return many(intersection)
         return [p for p in intersection if self._filter(p)]
 
+    def _push_filter(self, partitioneds: List[_Partitioned]) -> List[_Partitioned]:
+        """Lists only the partitions starting with the filter prefixes.
+
+        Filters may declare a `prefixes` attribute, a list of prefixes every
+        partition they keep starts with, e.g. the ones created by
+        `regex_filter` and `date_range_filter`.
+
+        Args:
+            partitioneds (List[Partitioned]): partitioned dicionaries
+
+        Returns:
+            List[Partitioned]
+
+        Example:
+            >>> fn = lambda p: p.startswith('a/')
+            >>> fn.prefixes = ['a/']
+            >>> n = _SlicerNode(2, 'a', 'b', 'x', filter=fn)
+            >>> loaders = PartitionLoaders(
+            ...     lambda: {'a/1': 'a/1.csv', 'b/1': 'b/1.csv'},
+            ...     factory=lambda partition, path=None: lambda: partition)
+            >>> [list(p) for p in n._push_filter([loaders])]
+            [['a/1']]
+        """
+        prefixes = getattr(self._filter, "prefixes", None)
+        if prefixes is None:
+            return partitioneds
+        return [
+            p.within(prefixes) if isinstance(p, PartitionLoaders) else p
+            for p in partitioneds
+        ]
+
     @classmethod
     def _extract_args_part(cls, args: tuple, nargs: int) -> Tuple[tuple, tuple]:
         return args[:nargs], args[nargs:]
 
-    def _extract_args(self, args: tuple) -> Tuple[List[_Partitioned], _Configurators]:
+    def _extract_args(
+        self, args: tuple
+    ) -> Tuple[List[_Partitioned], _Configurators, Union[_Partitioned, None]]:
+        stats = None
+        if self.stats_input is not None:
+            args, stats = self._extract_args_part(args, -1)
+            stats = None if isnull(stats[0]) else stats[0]
+
         if self._configurator is None:
-            return args, {}
+            return args, {}, stats
         else:
             partitioneds, configurators = self._extract_args_part(args, -1)
-            return partitioneds, configurators[0]
+            return partitioneds, configurators[0], stats
 
-    def _filter_cached(
+    def _resolve_configurators(
         self, configurators: _Configurators, intersection: List[str]
+    ) -> Dict[str, Union[int, None]]:
+        """Resolves the configurator index of each partition.
+
+        Args:
+            configurators (_Configurators)
+            intersection (List[str]): partitions
+
+        Returns:
+            Dict[str, Union[int, None]]
+        """
+        configurator_finder = ConfiguratorFinder(configurators)
+        return {p: configurator_finder.index(p) for p in intersection}
+
+    def _filter_cached(
+        self,
+        configurators: _Configurators,
+        resolved: Dict[str, Union[int, None]],
+        intersection: List[str],
     ) -> List[str]:
-        if self._configurator:
-            configurator_finder = ConfiguratorFinder(configurators)
-            return [
-                p
-                for p in intersection
-                if not (configurator_finder[p] or {}).get("cached", False)
+        return [
+            p
+            for p in intersection
+            if resolved[p] is None
+            or not configurators["configurators"][resolved[p]].get("cached", False)
+        ]
+
+    def _build_manifests(
+        self, slices: List[List[str]], partitioneds: List[_Partitioned]
+    ) -> List[Dict[str, List[str]]]:
+        """Lists the partition ids of each input for each slice.
+
+        Args:
+            slices (List[List[str]]): partitions of each slice
+            partitioneds (List[Partitioned]): partitioned dicionaries
+
+        Returns:
+            List[Dict[str, List[str]]]: partition ids by input, for each
+                slice, empty for slices without partitions
+        """
+        indexes = {
+            input: partition_index(partitioned)
+            for input, partitioned in zip(
+                tolist(self._partitioned_inputs), partitioneds
+            )
+            if isinstance(partitioned, PartitionLoaders)
+        }
+        return [
+            {
+                input: [index.path(p) for p in slice if p in index]
+                for input, index in indexes.items()
+            }
+            if slice
+            else {}
+            for slice in slices
+        ]
+
+    def _build_plan(
+        self,
+        slices: List[List[str]],
+        resolved: Dict[str, Union[int, None]],
+        partitioneds: List[_Partitioned],
+    ) -> _SlicePlan:
+        """Builds the slicer output given the slices and their metadata.
+
+        Args:
+            slices (List[List[str]]): partitions of each slice
+            resolved (Dict[str, Union[int, None]]): configurator index by
+                partition
+            partitioneds (List[Partitioned]): partitioned dicionaries
+
+        Returns:
+            _SlicePlan
+        """
+        plan: _SlicePlan = {"version": self.PLAN_VERSION, "slices": slices}
+        if self._configurator is not None:
+            plan["configurators"] = [
+                {p: resolved[p] for p in slice if resolved[p] is not None}
+                for slice in slices
             ]
-        else:
-            return intersection
+        manifests = self._build_manifests(slices, partitioneds)
+        if any(manifests):
+            plan["manifests"] = manifests
+        if self._work_stealing or self._checkpoint:
+            plan["run_id"] = uuid.uuid4().hex
+        return plan
+
+    def _plan(
+        self, args: tuple
+    ) -> Tuple[
+        _SlicePlan,
+        Union[Dict[str, float], None],
+        Callable[[], Union[Dict[str, float], None]],
+    ]:
+        """Plans the slices given the slicer inputs.
+
+        Args:
+            args (tuple): slicer inputs
+
+        Returns:
+            Tuple[_SlicePlan, Union[Dict[str, float], None],
+                Callable[[], Union[Dict[str, float], None]]]: the plan, the
+                cost by partition, and a function returning the size by
+                partition, computed once
+        """
+        partitioneds, configurators, stats = self._extract_args(args)
+        partitioneds = self._push_filter(partitioneds)
+
+        intersection = self._join_partitioneds(partitioneds)
+        intersection = self._apply_filter(intersection)
+        resolved = {}
+        if self._configurator:
+            resolved = self._resolve_configurators(configurators, intersection)
+            intersection = self._filter_cached(configurators, resolved, intersection)
+        intersection = sorted(intersection)
+
+        sizes = lru_cache(maxsize=None)(
+            partial(self._partition_sizes, intersection, partitioneds)
+        )
+        costs = self._partition_costs(intersection, sizes, stats)
+        slices = self._assign_partitions(intersection, costs, configurators)
+        return self._build_plan(slices, resolved, partitioneds), costs, sizes
+
+    def report(self, *args: Any) -> _SlicerReport:
+        """Plans the slices, returning the partition estimates used.
+
+        Partitions are listed, and their sizes found, only once.
+
+        Args:
+            args (Any): slicer inputs, in the order of the node inputs
+
+        Returns:
+            _SlicerReport
+
+        Example:
+            >>> n = _SlicerNode(2, 'a', 'b', 'x', balance={'a': 3, 'b': 1}.get)
+            >>> pprint(n.report({'a.csv': None, 'b.csv': None}))
+            {'costs': {'a': 3, 'b': 1},
+             'plan': {'slices': [['a'], ['b']], 'version': 1},
+             'sizes': None}
+        """
+        plan, costs, sizes = self._plan(args)
+        return {"plan": plan, "costs": costs, "sizes": sizes()}
 
     @property
     def func(self) -> Callable:
-        def fn(*args: Any) -> List[List[str]]:
-            partitioneds, configurators = self._extract_args(args)
+        def fn(*args: Any) -> _SlicePlan:
+            return self._plan(args)[0]
 
-            intersection = self._intersect_partitioneds(partitioneds)
-            intersection = self._apply_filter(intersection)
-            intersection = self._filter_cached(configurators, intersection)
-            intersection = sorted(intersection)
+        return fn
 
-            return [
-                self._slice_partitions(intersection, i)
-                for i in range(self._slice_count)
-            ]
 
-        return fn
+def _load(loader: Callable[[], Any]) -> Any:
+    return loader()
+
+
+def _null() -> NullType:
+    """Loads the partition of an input missing it, in joins.
+
+    Declared at module level, so it can be sent to process pools.
+
+    Returns:
+        NullType
+    """
+    return Null
+
+
+def _process_partition(
+    func: Callable, loaders: List[Callable[[], Any]], args: List[Any]
+) -> Tuple[Any, float]:
+    """Loads a partition and runs a function over it.
+
+    Declared at module level, so it can be sent to process pools.
+
+    Args:
+        func (Callable): multinode original function
+        loaders (List[Callable[[], Any]]): loaders of each partitioned input
+        args (List[Any]): configurator data and other inputs
+
+    Returns:
+        Tuple[Any, float]: the function return and the seconds spent
+
+    Example:
+        >>> _process_partition(max, [lambda: 1, lambda: 3], [2])  # doctest: +ELLIPSIS
+        (3, ...)
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor() as pool:
+        inputs = list(pool.map(_load, loaders))
+    return func(*inputs, *args), time.perf_counter() - start
+
+
+def _retry(
+    process: Callable[[], T],
+    retries: int,
+    backoff: float,
+    first: Callable[[], T] = None,
+) -> T:
+    """Calls a function, calling it again with exponential backoff if it raises.
+
+    Declared at module level, so it can be sent to process pools.
+
+    Args:
+        process (Callable[[], T]): function to call
+        retries (int): number of calls after the first one
+        backoff (float): seconds waited before the first retry, doubled
+            for each retry after it
+        first (Callable[[], T], optional): function called in the first
+            attempt instead of `process`, e.g. over prefetched inputs.
+            Defaults to None.
+
+    Returns:
+        T: the function return
+
+    Example:
+        >>> attempts = []
+        >>> def flaky() -> int:
+        ...     attempts.append(True)
+        ...     if len(attempts) < 3:
+        ...         raise OSError('transient')
+        ...     return len(attempts)
+        >>> _retry(flaky, retries=2, backoff=0)
+        3
+
+        >>> def prefetched() -> int: raise OSError('transient')
+        >>> _retry(lambda: 'reloaded', retries=1, backoff=0, first=prefetched)
+        'reloaded'
+    """
+    for attempt in range(retries + 1):
+        call = first if attempt == 0 and first is not None else process
+        try:
+            return call()
+        except Exception as e:
+            if attempt == retries:
+                raise
+            delay = backoff * 2**attempt
+            logging.getLogger(__name__).warning(
+                f"{e!r}, retrying in {delay:g}s ({attempt + 1}/{retries})"
+            )
+            time.sleep(delay)
+
+
+def _timed_load(loader: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    return loader(), time.perf_counter() - start
 
 
 class _MultiNode(_CustomizedFuncNode):
@@ -520,10 +1470,17 @@ class _MultiNode(_CustomizedFuncNode):
         ...                slice_id=0,
         ...                slice_count=2,
         ...                name='x')
-        >>> dictionary['b-slicer'] = [['subpath/a'], ['subpath/b']]
+        >>> dictionary['b-slicer'] = {'version': 1,
+        ...                           'slices': [['subpath/a'], ['subpath/b']]}
         >>> n.run(inputs=dictionary)
         {'b-slice-0': {'subpath/a': 13}}
 
+        Plans written by older versions as a list of slices
+
+        >>> n.run(inputs={**dictionary,
+        ...               'b-slicer': [['subpath/a'], ['subpath/b']]})
+        {'b-slice-0': {'subpath/a': 13}}
+
         Multiple inputs
 
         >>> dictionary['b'] = {'subpath/a.txt': lambda: 4,
@@ -563,31 +1520,131 @@ class _MultiNode(_CustomizedFuncNode):
         ...                slice_id=0,
         ...                slice_count=2,
         ...                name='x')
-        >>> n.run(inputs=dictionary)
-        {'c-slice-0': {'subpath/a': 103}, 'd-slice-0': {'subpath/a': 104}}
+        >>> n.run(inputs=dictionary)
+        {'c-slice-0': {'subpath/a': 103}, 'd-slice-0': {'subpath/a': 104}}
+
+        Configurators
+
+        >>> def fn(x: int, y: int, conf, e: int) -> list:
+        ...     return [x+e+conf['add'], y+e+conf['add']]
+        >>> n = _MultiNode(slicer=lbn,
+        ...                func=fn,
+        ...                partitioned_inputs=['a', 'b'],
+        ...                partitioned_outputs=['c', 'd'],
+        ...                other_inputs=['e'],
+        ...                slice_id=0,
+        ...                slice_count=1,
+        ...                name='x',
+        ...                configurator='param:conf')
+        >>> dictionary['param:conf'] = {
+        ...     'template': {'pattern': 'subpath/{ab}'},
+        ...     'configurators': [{'target': ['a'], 'data': {'add': 100}},
+        ...                       {'target': ['*'], 'data': {'add': 20}}]}
+        >>> n.run(inputs=dictionary)
+        {'c-slice-0': {'subpath/a': 203}, 'd-slice-0': {'subpath/a': 204}}
+
+        Configurators resolved by the slicer
+
+        >>> n.run(inputs={**dictionary,
+        ...               'b-slicer': {'slices': [['subpath/a']],
+        ...                            'configurators': [{'subpath/a': 1}]}})
+        {'c-slice-0': {'subpath/a': 123}, 'd-slice-0': {'subpath/a': 124}}
+
+        Recording stats for balancing by runtime
+
+        >>> rbn = _SlicerNode(2, 'a', 'b', 'x', balance='runtime')
+        >>> n = _MultiNode(slicer=rbn,
+        ...                func=lambda x: x+10,
+        ...                partitioned_inputs='a',
+        ...                partitioned_outputs='b',
+        ...                slice_id=0,
+        ...                slice_count=2,
+        ...                name='x')
+        >>> n
+        Node(<lambda>, ['b-slicer', 'a'], ['b-slice-0', 'x-slice-0-stats'], \
+'x-slice-0')
+        >>> out = n.run(inputs={'b-slicer': dictionary['b-slicer'],
+        ...                     'a': dictionary['a']})
+        >>> out['b-slice-0']
+        {'subpath/a': 13}
+        >>> list(out['x-slice-0-stats']['elapsed'])
+        ['subpath/a']
+
+        Streaming, partitions are only processed when saved
+
+        >>> n = _MultiNode(slicer=lbn,
+        ...                func=lambda x: x+10,
+        ...                partitioned_inputs='a',
+        ...                partitioned_outputs='c',
+        ...                slice_id=0,
+        ...                slice_count=2,
+        ...                name='x',
+        ...                streaming=True)
+        >>> out = n.run(inputs={'b-slicer': dictionary['b-slicer'],
+        ...                     'a': dictionary['a']})
+        >>> out['c-slice-0']['subpath/a']()
+        13
+
+        Streaming requires a single partitioned output
+
+        >>> _MultiNode(slicer=lbn,
+        ...            func=lambda x: [x+10, x+20],
+        ...            partitioned_inputs='a',
+        ...            partitioned_outputs=['c', 'd'],
+        ...            slice_id=0,
+        ...            slice_count=2,
+        ...            name='x',
+        ...            streaming=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: `streaming` requires a single partitioned output, \
+"x" has 2
+
+        Processing partitions in parallel
+
+        >>> n = _MultiNode(slicer=lbn,
+        ...                func=lambda x: x+10,
+        ...                partitioned_inputs='a',
+        ...                partitioned_outputs='b',
+        ...                slice_id=0,
+        ...                slice_count=1,
+        ...                name='x',
+        ...                partition_workers=2)
+        >>> n.run(inputs={'b-slicer': {'slices': [['subpath/a', 'subpath/b']]},
+        ...               'a': dictionary['a']})
+        {'b-slice-0': {'subpath/a': 13, 'subpath/b': 14}}
+
+        Slices without partitions do not touch their inputs
+
+        >>> n = _MultiNode(slicer=lbn,
+        ...                func=lambda x: x+10,
+        ...                partitioned_inputs='a',
+        ...                partitioned_outputs='b',
+        ...                slice_id=0,
+        ...                slice_count=2,
+        ...                name='x')
+        >>> n.run(inputs={'b-slicer': {'slices': [[], ['subpath/a']]}, 'a': None})
+        {'b-slice-0': {}}
 
-        Configurators
+        Loading the next partitions while the current one is processed
 
-        >>> def fn(x: int, y: int, conf, e: int) -> list:
-        ...     return [x+e+conf['add'], y+e+conf['add']]
         >>> n = _MultiNode(slicer=lbn,
-        ...                func=fn,
-        ...                partitioned_inputs=['a', 'b'],
-        ...                partitioned_outputs=['c', 'd'],
-        ...                other_inputs=['e'],
+        ...                func=lambda x: x+10,
+        ...                partitioned_inputs='a',
+        ...                partitioned_outputs='b',
         ...                slice_id=0,
         ...                slice_count=1,
         ...                name='x',
-        ...                configurator='param:conf')
-        >>> dictionary['param:conf'] = {
-        ...     'template': {'pattern': 'subpath/{ab}'},
-        ...     'configurators': [{'target': ['a'], 'data': {'add': 100}},
-        ...                       {'target': ['*'], 'data': {'add': 20}}]}
-        >>> n.run(inputs=dictionary)
-        {'c-slice-0': {'subpath/a': 203}, 'd-slice-0': {'subpath/a': 204}}
+        ...                prefetch=1)
+        >>> n.run(inputs={'b-slicer': {'slices': [['subpath/a', 'subpath/b']]},
+        ...               'a': dictionary['a']})
+        {'b-slice-0': {'subpath/a': 13, 'subpath/b': 14}}
     """
 
     SLICE_SUFFIX = "-slice-"
+    CHECKPOINT_SUFFIX = "-checkpoint"
+    THREAD_EXECUTOR = "thread"
+    PROCESS_EXECUTOR = "process"
 
     def __init__(
         self,
@@ -602,10 +1659,31 @@ class _MultiNode(_CustomizedFuncNode):
         tags: Union[str, Iterable[str]] = None,
         confirms: Union[str, List[str]] = None,
         namespace: str = None,
-        previous_nodes: List[_MultiNode] = [],
+        previous_outputs: Dict[str, int] = {},
         configurator: str = None,
+        streaming: bool = False,
+        partition_workers: int = None,
+        partition_executor: Literal["thread", "process"] = "thread",
+        prefetch: int = 0,
+        record_stats: bool = False,
+        retries: int = 0,
+        retry_backoff: float = 1.0,
+        continue_on_error: bool = False,
     ):
+        if streaming and len(tolist(partitioned_outputs)) > 1:
+            raise ValueError(
+                "`streaming` requires a single partitioned output, "
+                f'"{name}" has {len(tolist(partitioned_outputs))}'
+            )
         self._slicer = slicer
+        self._record_stats = record_stats
+        self._retries = retries
+        self._retry_backoff = retry_backoff
+        self._continue_on_error = continue_on_error
+        self._streaming = streaming
+        self._partition_workers = partition_workers
+        self._partition_executor = partition_executor
+        self._prefetch = prefetch
 
         self._partitioned_inputs = partitioned_inputs
 
@@ -617,18 +1695,36 @@ class _MultiNode(_CustomizedFuncNode):
 
         self._configurator = configurator
 
-        self._point_to_matches(previous_nodes)
+        self._point_to_matches(previous_outputs)
+
+        sliced_name = self._add_slice_suffix(name)
+        prefix = f"{namespace}." if namespace else ""
+        self._stats_output = (
+            f"{prefix}{sliced_name}{_SlicerNode.STATS_SUFFIX}"
+            if record_stats
+            or continue_on_error
+            or slicer.stats_input is not None
+            or slicer.leases_input is not None
+            else None
+        )
+        self._checkpoint_input = (
+            f"{prefix}{sliced_name}{self.CHECKPOINT_SUFFIX}"
+            if slicer.checkpoints_name is not None
+            else None
+        )
 
         super().__init__(
             func=func,
             inputs=(
                 [self.slicer_output]
+                + optionaltolist(slicer.leases_input)
+                + optionaltolist(self.checkpoint_input)
                 + tolist(self.partitioned_inputs)
                 + optionaltolist(self._configurator)
                 + tolist(self.other_inputs)
             ),
-            outputs=self.partitioned_outputs,
-            name=self._add_slice_suffix(name),
+            outputs=self.partitioned_outputs + optionaltolist(self.stats_output),
+            name=sliced_name,
             tags=tags,
             confirms=confirms,
             namespace=namespace,
@@ -645,11 +1741,12 @@ class _MultiNode(_CustomizedFuncNode):
         """
         return math.ceil(self.slice_id * (input_count / self.slice_count))
 
-    def _point_to_matches(self, previous_nodes: List[_MultiNode]) -> List[str]:
+    def _point_to_matches(self, previous_outputs: Dict[str, int]) -> List[str]:
         """Points to the partitioned output copies from previous nodes.
 
         Args:
-            previous_nodes (List[_MultiNode])
+            previous_outputs (Dict[str, int]): number of slices writing each
+                partitioned output of the previous nodes
 
         Returns:
             List[str]
@@ -659,14 +1756,12 @@ class _MultiNode(_CustomizedFuncNode):
             i.e. all nodes can point to the slice 0 if a previous node outputs
             an input
         """
-        inputs = Counter(
-            inp for n in previous_nodes for inp in n.original_partitioned_outputs
-        )
-
         self._partitioned_inputs = [
             (
-                self.add_slice_suffix(input, self._calc_match_index(inputs[input]))
-                if inputs[input] > 0
+                self.add_slice_suffix(
+                    input, self._calc_match_index(previous_outputs[input])
+                )
+                if previous_outputs.get(input, 0) > 0
                 else input
             )
             for input in self.original_partitioned_inputs
@@ -687,6 +1782,14 @@ class _MultiNode(_CustomizedFuncNode):
             "tags": self._tags,
             "confirms": self._confirms,
             "configurator": self._configurator,
+            "streaming": self._streaming,
+            "partition_workers": self._partition_workers,
+            "partition_executor": self._partition_executor,
+            "prefetch": self._prefetch,
+            "record_stats": self._record_stats,
+            "retries": self._retries,
+            "retry_backoff": self._retry_backoff,
+            "continue_on_error": self._continue_on_error,
         }
         params.update(overwrite_params)
         return self.__class__(**params)
@@ -699,6 +1802,15 @@ class _MultiNode(_CustomizedFuncNode):
             if len(expected) > len(passed):
                 raise e
 
+    @property
+    def slicer(self) -> _SlicerNode:
+        """Slicer node that plans the partitions of this multinode.
+
+        Returns:
+            _SlicerNode
+        """
+        return self._slicer
+
     @property
     def slicer_output(self) -> str:
         """Returns the load balancer json output.
@@ -708,6 +1820,24 @@ class _MultiNode(_CustomizedFuncNode):
         """
         return self._slicer.json_output
 
+    @property
+    def stats_output(self) -> Union[str, None]:
+        """Stats of the partitions processed by this slice, if recorded.
+
+        Returns:
+            Union[str, None]
+        """
+        return self._stats_output
+
+    @property
+    def checkpoint_input(self) -> Union[str, None]:
+        """Checkpoint where partitions are committed one by one, if enabled.
+
+        Returns:
+            Union[str, None]
+        """
+        return self._checkpoint_input
+
     @classmethod
     def add_slice_suffix(
         cls, string: Union[str, List[str]], slice_id: int
@@ -836,28 +1966,84 @@ class _MultiNode(_CustomizedFuncNode):
         return [
             {
                 path: partitioned[path]
-                for path in partitioned
-                if get_filepath_without_extension(path) in slice
+                for path in partition_index(partitioned).subset(slice).values()
             }
             for partitioned in partitioneds
         ]
 
-    def _get_slice(self, slices: List[List[str]]) -> Set[str]:
-        return set(slices[self.slice_id])
+    def _slice_ids(self, plan: _SlicePlan, leases: Union[Leases, None]) -> List[int]:
+        """Slices whose partitions this node may process, in order.
+
+        Args:
+            plan (_SlicePlan): slicer plan
+            leases (Union[Leases, None]): leases, if stealing work
+
+        Returns:
+            List[int]: this slice, followed by the next ones if stealing work
+        """
+        if leases is None:
+            return [self.slice_id]
+        count = len(plan["slices"])
+        return [(self.slice_id + i) % count for i in range(count)]
+
+    def _partition_order(self, plan: _SlicePlan, slice_ids: List[int]) -> List[str]:
+        """Order in which this node processes the partitions.
+
+        Partitions of other slices are taken from their end, so they are
+        stolen before their owners reach them.
+
+        Args:
+            plan (_SlicePlan): slicer plan
+            slice_ids (List[int]): slices whose partitions may be processed
+
+        Returns:
+            List[str]
+        """
+        own, *others = [plan["slices"][i] for i in slice_ids]
+        return own + [p for other in others for p in reversed(other)]
+
+    def _get_slice(self, plan: _SlicePlan, slice_ids: List[int]) -> Set[str]:
+        return {p for i in slice_ids for p in plan["slices"][i]}
+
+    def _get_manifest(
+        self, plan: _SlicePlan, slice_ids: List[int]
+    ) -> Dict[str, List[str]]:
+        if "manifests" not in plan:
+            return {}
+        merged: Dict[str, List[str]] = {}
+        for i in slice_ids:
+            for input, ids in plan["manifests"][i].items():
+                merged.setdefault(input, []).extend(ids)
+        return merged
 
     def _slice_inputs(
-        self, slices: List[List[str]], partitioneds: List[_Partitioned]
+        self,
+        plan: _SlicePlan,
+        partitioneds: List[_Partitioned],
+        slice_ids: List[int],
     ) -> List[_Partitioned]:
         """Returns the partitioned dictionaries sliced for this node.
 
         Args:
+            plan (_SlicePlan): slicer plan
             partitioneds (List[Partitioned]): original partitioned dictionaries
+            slice_ids (List[int]): slices whose partitions may be processed
 
         Returns:
             List[Partitioned]
         """
-        slice = self._get_slice(slices)
-        return self._intersect_partitioneds(slice, partitioneds)
+        slice = self._get_slice(plan, slice_ids)
+        manifest = self._get_manifest(plan, slice_ids)
+        return [
+            (
+                partitioned.subset(manifest[input])
+                if input in manifest and isinstance(partitioned, PartitionLoaders)
+                else self._intersect_partitioneds(slice, [partitioned])[0]
+            )
+            for input, partitioned in zip(
+                self.original_partitioned_inputs, partitioneds
+            )
+        ]
 
     @classmethod
     def _extract_args_part(
@@ -865,9 +2051,23 @@ class _MultiNode(_CustomizedFuncNode):
     ) -> Tuple[List[Any], List[Any]]:
         return args[:nargs], args[nargs:]
 
-    def _extract_slices(self, args: List[Any]) -> Tuple[List[List[str]], List[Any]]:
-        slices, args = self._extract_args_part(args, 1)
-        return slices[0], args
+    def _extract_plan(self, args: List[Any]) -> Tuple[_SlicePlan, List[Any]]:
+        plan, args = self._extract_args_part(args, 1)
+        return self._slicer.read_plan(plan[0]), args
+
+    def _extract_leases(self, args: List[Any]) -> Tuple[Union[Leases, None], List[Any]]:
+        if self.slicer.leases_input is None:
+            return None, args
+        leases, args = self._extract_args_part(args, 1)
+        return leases[0], args
+
+    def _extract_checkpoint(
+        self, args: List[Any]
+    ) -> Tuple[Union[Checkpoint, None], List[Any]]:
+        if self.checkpoint_input is None:
+            return None, args
+        checkpoint, args = self._extract_args_part(args, 1)
+        return checkpoint[0], args
 
     def _extract_partitioneds(
         self, args: List[Any]
@@ -886,16 +2086,465 @@ class _MultiNode(_CustomizedFuncNode):
     def _extract_args(
         self, args: List[Any]
     ) -> Tuple[
-        List[List[str]],
+        _SlicePlan,
+        Union[Leases, None],
+        Union[Checkpoint, None],
         List[_Partitioned],
-        Union[None, Dict[str, _Configurator]],
+        _Configurators,
         List[Any],
     ]:
-        slices, args = self._extract_slices(args)
+        plan, args = self._extract_plan(args)
+        leases, args = self._extract_leases(args)
+        checkpoint, args = self._extract_checkpoint(args)
         partitioneds, args = self._extract_partitioneds(args)
         configurators, args = self._extract_configurators(args)
         other_inputs = args
-        return slices, partitioneds, configurators, other_inputs
+        return plan, leases, checkpoint, partitioneds, configurators, other_inputs
+
+    def _iter_partitions(
+        self, partitioneds: List[_Partitioned], order: List[str] = None
+    ) -> Iterator[Tuple[str, List[Callable[[], Any]]]]:
+        """Iterates over the matching partitions of the sliced inputs.
+
+        Args:
+            partitioneds (List[Partitioned]): sliced partitioned dictionaries
+            order (List[str], optional): order of the partitions. Defaults to
+                None, i.e. sorted.
+
+        Yields:
+            Tuple[str, List[Callable[[], Any]]]: partition and its loaders,
+                loading `Null` for the inputs missing it when the slicer
+                joins them by 'left' or 'outer'
+        """
+        indexes = [partition_index(partitioned) for partitioned in partitioneds]
+        join = self._slicer.join
+        if order is None:
+            order = indexes[0].join(*indexes[1:], how=join)
+        for partition_name in order:
+            found = [partition_name in index for index in indexes]
+            keep = {"inner": all(found), "left": found[0], "outer": any(found)}
+            if keep[join]:
+                yield (
+                    partition_name,
+                    [
+                        partitioned[index.path(partition_name)] if present else _null
+                        for partitioned, index, present in zip(
+                            partitioneds, indexes, found
+                        )
+                    ],
+                )
+
+    def _configurator_resolver(
+        self, plan: _SlicePlan, configurators: _Configurators, slice_ids: List[int]
+    ) -> Union[Callable[[str], Union[_Configurator, None]], None]:
+        """Creates a function that finds the configurator of a partition.
+
+        Configurators resolved by the slicer are looked up, so only older
+        slicer outputs require matching the partitions again.
+
+        Args:
+            plan (_SlicePlan): slicer plan
+            configurators (_Configurators)
+            slice_ids (List[int]): slices whose partitions may be processed
+
+        Returns:
+            Union[Callable[[str], Union[_Configurator, None]], None]: None if
+                the multinode has no configurator
+        """
+        if self._configurator is None:
+            return None
+        elif "configurators" in plan:
+            indexes = {
+                p: index
+                for i in slice_ids
+                for p, index in plan["configurators"][i].items()
+            }
+            declared = configurators["configurators"]
+            return lambda p: declared[indexes[p]] if p in indexes else None
+        else:
+            return ConfiguratorFinder(configurators).__getitem__
+
+    def _find_configurator(
+        self,
+        resolver: Union[Callable[[str], Union[_Configurator, None]], None],
+        partition: str,
+    ) -> List[Any]:
+        """Finds the configurator data of a partition.
+
+        Args:
+            resolver (Union[Callable[[str], Union[_Configurator, None]], None])
+            partition (str)
+
+        Returns:
+            List[Any]: a list containing the data, or an empty list if the
+                multinode has no configurator
+        """
+        if resolver is None:
+            return []
+
+        possible_configurator = resolver(partition)
+        if possible_configurator is None:
+            self._logger.warning(f'No configurator found for "{partition}"')
+            return []
+        else:
+            target = possible_configurator["target"]
+            self._logger.info(f'Using configurator "{target}" for "{partition}"')
+            return [possible_configurator["data"]]
+
+    def _split_outputs(self, fn_return: Any) -> List[Any]:
+        """Splits a function return into one value per partitioned output.
+
+        Args:
+            fn_return (Any)
+
+        Returns:
+            List[Any]
+        """
+        if len(self.partitioned_outputs) > 1:
+            return [fn_return[i] for i, _ in enumerate(self.partitioned_outputs)]
+        else:
+            return [fn_return]
+
+    def _lazy_outputs(
+        self,
+        partition: str,
+        process: Callable[[], Tuple[Any, float]],
+        elapsed: Dict[str, float],
+    ) -> List[Callable]:
+        """Creates a lazy callable for the single output of a partition.
+
+        The partition is processed when the callable is called, i.e. while
+        its output is saved, which happens before the stats are saved.
+
+        Args:
+            partition (str)
+            process (Callable[[], Tuple[Any, float]]): processes the partition
+            elapsed (Dict[str, float]): receives the seconds spent
+
+        Returns:
+            List[Callable]
+        """
+
+        def load_output() -> Any:
+            self._log_processing(partition)
+            fn_return, elapsed[partition] = process()
+            return fn_return
+
+        return [load_output]
+
+    def _run_in_pool(
+        self, processes: Iterable[Tuple[str, Callable[[], Tuple[Any, float]]]]
+    ) -> Iterator[Tuple[str, Tuple[Any, float]]]:
+        """Processes the partitions in a pool of `partition_workers`.
+
+        At most `partition_workers` partitions are in flight at the same time,
+        which bounds the number of loaded inputs kept in memory. Results are
+        yielded as soon as every partition submitted before them finished.
+
+        Args:
+            processes (Iterable[Tuple[str, Callable[[], Tuple[Any, float]]]]):
+                partitions and their processing functions
+
+        Yields:
+            Tuple[str, Tuple[Any, float]]: partition and its result, in the
+                same order of the `processes` argument
+        """
+        executor = (
+            ProcessPoolExecutor
+            if self._partition_executor == self.PROCESS_EXECUTOR
+            else ThreadPoolExecutor
+        )
+        submitted: Deque[str] = deque()
+        results: Dict[str, Tuple[Any, float]] = {}
+        with executor(max_workers=self._partition_workers) as pool:
+            in_flight: Dict[Future, str] = {}
+            for partition_name, process in processes:
+                if len(in_flight) >= self._partition_workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[in_flight.pop(future)] = self._result(future)
+                    while submitted and submitted[0] in results:
+                        name = submitted.popleft()
+                        yield name, results.pop(name)
+                self._log_processing(partition_name)
+                submitted.append(partition_name)
+                in_flight[pool.submit(process)] = partition_name
+            for future in as_completed(in_flight):
+                results[in_flight[future]] = self._result(future)
+                while submitted and submitted[0] in results:
+                    name = submitted.popleft()
+                    yield name, results.pop(name)
+
+    def _result(self, future: Future) -> Union[Any, _PartitionError]:
+        """Result of a future, or its error if the slice continues on errors.
+
+        Args:
+            future (Future)
+
+        Returns:
+            Union[Any, _PartitionError]
+        """
+        try:
+            return future.result()
+        except Exception:
+            if not self._continue_on_error:
+                raise
+            return _PartitionError(traceback.format_exc())
+
+    def _retrying(self, process: Callable[[], T]) -> Callable[[], T]:
+        if self._retries:
+            return partial(_retry, process, self._retries, self._retry_backoff)
+        return process
+
+    def _run_prefetched(
+        self,
+        partitions: Iterable[Tuple[str, Tuple[List[Callable[[], Any]], List[Any]]]],
+        elapsed: Dict[str, float],
+    ) -> Iterator[Tuple[str, Any]]:
+        """Processes the partitions one by one, loading the next ones ahead.
+
+        All the loads run on a single pool, which keeps the inputs of the
+        next `prefetch` partitions loading while the current partition is
+        processed, so I/O and compute overlap.
+
+        Args:
+            partitions (Iterable[Tuple[str, Tuple[List[Callable[[], Any]],
+                List[Any]]]]): partitions, their loaders and extra arguments
+            elapsed (Dict[str, float]): receives the seconds spent
+
+        Yields:
+            Tuple[str, Any]: partition and its function return
+        """
+        max_workers = (self._prefetch + 1) * len(self.partitioned_inputs)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending: Deque[
+                Tuple[str, List[Callable[[], Any]], List[Future], List[Any]]
+            ] = deque()
+            for partition_name, (loaders, args) in partitions:
+                futures = [pool.submit(_timed_load, loader) for loader in loaders]
+                pending.append((partition_name, loaders, futures, args))
+                if len(pending) > self._prefetch:
+                    yield self._compute_loaded(*pending.popleft(), elapsed)
+            while pending:
+                yield self._compute_loaded(*pending.popleft(), elapsed)
+
+    def _compute_loaded(
+        self,
+        partition: str,
+        loaders: List[Callable[[], Any]],
+        futures: List[Future],
+        args: List[Any],
+        elapsed: Dict[str, float],
+    ) -> Tuple[str, Union[Any, _PartitionError]]:
+        """Runs the function over a partition whose inputs are being loaded.
+
+        The first attempt uses the loads in progress. If the load or the
+        function raises, the partition is loaded and processed again up to
+        `retries` times.
+
+        Args:
+            partition (str)
+            loaders (List[Callable[[], Any]]): loaders of each partitioned
+                input, used to retry
+            futures (List[Future]): loads of each partitioned input
+            args (List[Any]): configurator data and other inputs
+            elapsed (Dict[str, float]): receives the seconds spent
+
+        Returns:
+            Tuple[str, Union[Any, _PartitionError]]: partition and its
+                function return, or its error if the slice continues on errors
+        """
+        self._log_processing(partition)
+        try:
+            fn_return, elapsed[partition] = _retry(
+                partial(_process_partition, self._original_func, loaders, args),
+                self._retries,
+                self._retry_backoff,
+                first=partial(self._process_loaded, futures, args),
+            )
+        except Exception:
+            if not self._continue_on_error:
+                raise
+            return partition, _PartitionError(traceback.format_exc())
+        return partition, fn_return
+
+    def _process_loaded(
+        self, futures: List[Future], args: List[Any]
+    ) -> Tuple[Any, float]:
+        """Runs the function over the inputs loaded by the given futures.
+
+        Args:
+            futures (List[Future]): timed loads of each partitioned input
+            args (List[Any]): configurator data and other inputs
+
+        Returns:
+            Tuple[Any, float]: the function return and the seconds spent,
+                counting the slowest load
+        """
+        loaded = [future.result() for future in futures]
+        start = time.perf_counter()
+        fn_return = self._original_func(*[value for value, _ in loaded], *args)
+        load_time = max((seconds for _, seconds in loaded), default=0.0)
+        return fn_return, load_time + time.perf_counter() - start
+
+    def _run_partitions(
+        self,
+        partitions: Iterable[Tuple[str, Tuple[List[Callable[[], Any]], List[Any]]]],
+        elapsed: Dict[str, float],
+    ) -> Iterator[Tuple[str, Union[List[Any], _PartitionError]]]:
+        """Processes the partitions according to the execution settings.
+
+        Partitions are consumed lazily, i.e. only when they are scheduled.
+
+        Args:
+            partitions (Iterable[Tuple[str, Tuple[List[Callable[[], Any]],
+                List[Any]]]]): partitions, their loaders and extra arguments
+            elapsed (Dict[str, float]): receives the seconds spent
+
+        Yields:
+            Tuple[str, Union[List[Any], _PartitionError]]: partition and its
+                value for each output, or its error if the slice continues on
+                errors
+        """
+        processes = (
+            (
+                partition_name,
+                self._retrying(
+                    partial(_process_partition, self._original_func, loaders, args)
+                ),
+            )
+            for partition_name, (loaders, args) in partitions
+        )
+        if self._streaming:
+            for partition_name, process in processes:
+                yield (
+                    partition_name,
+                    self._lazy_outputs(partition_name, process, elapsed),
+                )
+        elif self._partition_workers:
+            for partition_name, result in self._run_in_pool(processes):
+                if isinstance(result, _PartitionError):
+                    yield partition_name, result
+                    continue
+                fn_return, elapsed[partition_name] = result
+                yield partition_name, self._split_outputs(fn_return)
+        else:
+            for partition_name, fn_return in self._run_prefetched(partitions, elapsed):
+                if isinstance(fn_return, _PartitionError):
+                    yield partition_name, fn_return
+                    continue
+                yield partition_name, self._split_outputs(fn_return)
+
+    def _claim(
+        self,
+        partitions: Iterable[Tuple[str, Any]],
+        plan: _SlicePlan,
+        leases: Union[Leases, None],
+    ) -> Iterator[Tuple[str, Any]]:
+        """Filters the partitions this node manages to claim.
+
+        Args:
+            partitions (Iterable[Tuple[str, Any]]): partitions and their data
+            plan (_SlicePlan): slicer plan
+            leases (Union[Leases, None]): leases, if stealing work
+
+        Yields:
+            Tuple[str, Any]: claimed partitions and their data
+        """
+        own = set(plan["slices"][self.slice_id])
+        for partition_name, data in partitions:
+            key = self._partition_key(partition_name)
+            if (
+                leases is None
+                or leases.claim(plan["run_id"], key, self.name)
+                or leases.owner(plan["run_id"], key) == self.name
+            ):
+                if partition_name not in own:
+                    self._logger.info(f'"{self.name}" stole "{partition_name}"')
+                yield partition_name, data
+
+    def _partition_key(self, partition: str) -> str:
+        """Identifies a partition of this multinode across its slices.
+
+        Args:
+            partition (str)
+
+        Returns:
+            str
+
+        Example:
+            >>> n = _MultiNode(slicer=_SlicerNode(2, 'a', 'b', 'x'),
+            ...                func=lambda x: x, partitioned_inputs='a',
+            ...                partitioned_outputs='b', slice_id=1,
+            ...                slice_count=2, name='x')
+            >>> n._partition_key('subpath/a')
+            'x/subpath/a'
+        """
+        node = self.name[: -len(self._add_slice_suffix(""))]
+        return f"{node}/{partition}"
+
+    def _skip_committed(
+        self,
+        partitions: Iterable[Tuple[str, Any]],
+        plan: _SlicePlan,
+        checkpoint: Union[Checkpoint, None],
+        resumed: List[str],
+    ) -> Iterator[Tuple[str, Any]]:
+        """Filters the partitions a previous attempt of this run committed.
+
+        Args:
+            partitions (Iterable[Tuple[str, Any]]): partitions and their data
+            plan (_SlicePlan): slicer plan
+            checkpoint (Union[Checkpoint, None]): checkpoint, if enabled
+            resumed (List[str]): receives the skipped partitions
+
+        Yields:
+            Tuple[str, Any]: partitions to process and their data
+        """
+        for partition_name, data in partitions:
+            if checkpoint is not None and checkpoint.committed(
+                plan["run_id"], self._partition_key(partition_name)
+            ):
+                self._logger.info(
+                    f'Skipping "{partition_name}" on "{self.name}", '
+                    "already committed"
+                )
+                resumed.append(partition_name)
+            else:
+                yield partition_name, data
+
+    def _commit(
+        self,
+        checkpoint: Checkpoint,
+        plan: _SlicePlan,
+        partition: str,
+        values: List[Any],
+    ):
+        """Persists the outputs of a partition, and marks it as committed.
+
+        The persistence is retried up to `retries` times.
+
+        Args:
+            checkpoint (Checkpoint)
+            plan (_SlicePlan): slicer plan
+            partition (str)
+            values (List[Any]): value of each output, lazy if streaming
+        """
+        if self._streaming:
+            values = [value() for value in values]
+        self._retrying(
+            partial(
+                checkpoint.commit,
+                plan["run_id"],
+                self._partition_key(partition),
+                partition,
+                values,
+                self.name,
+            )
+        )()
+
+    def _log_processing(self, partition: str):
+        self._logger.info(f'Processing "{partition}" on "{self.name}"')
 
     @property
     def func(self) -> Callable:
@@ -907,56 +2556,114 @@ class _MultiNode(_CustomizedFuncNode):
 
         @wraps(self._func)
         def fn(*args: Any) -> Any:
-            slices, partitioneds, configurators, other_inputs = self._extract_args(args)
+            (
+                plan,
+                leases,
+                checkpoint,
+                partitioneds,
+                configurators,
+                other_inputs,
+            ) = self._extract_args(args)
 
-            partitioneds = self._slice_inputs(slices, partitioneds)
+            outputs = [dict() for _ in range(len(self.partitioned_outputs))]
+            elapsed: Dict[str, float] = {}
+            resumed: List[str] = []
+            errors: Dict[str, str] = {}
 
-            if self._configurator:
-                configurator_finder = ConfiguratorFinder(configurators)
+            if leases is None and not plan["slices"][self.slice_id]:
+                self._logger.info(f'No partitions planned for "{self.name}"')
+                return self._with_stats(outputs, elapsed)
 
-            outputs = [dict() for _ in range(len(self.partitioned_outputs))]
-            if partitioneds[0]:
-                for partitions in zip(
-                    *[partition.items() for partition in partitioneds]
-                ):
-                    # partitions[i][j]
-                    # i = partitioned partitions
-                    # j = key == 0, value == 1
-                    partition = get_filepath_without_extension(partitions[0][0])
-                    self._logger.info(f'Processing "{partition}" on "{self.name}"')
-
-                    configurator = []
-                    if self._configurator:
-                        possible_configurator = configurator_finder[partition]
-
-                        if possible_configurator is None:
-                            self._logger.warning(
-                                f'No configurator found for "{partition}"'
-                            )
-                        else:
-                            target = possible_configurator["target"]
-                            configurator = [possible_configurator["data"]]
-                            self._logger.info(
-                                f'Using configurator "{target}" for ' f'"{partition}"'
-                            )
-
-                    with ThreadPoolExecutor() as pool:
-                        inputs = pool.map(lambda p: p[1](), partitions)
-
-                    fn_return = self._original_func(
-                        *inputs, *configurator, *other_inputs
-                    )
+            slice_ids = self._slice_ids(plan, leases)
+            partitioneds = self._slice_inputs(plan, partitioneds, slice_ids)
+
+            resolver = self._configurator_resolver(plan, configurators, slice_ids)
 
-                    if len(self.partitioned_outputs) > 1:
-                        for i, _ in enumerate(self.partitioned_outputs):
-                            outputs[i][partition] = fn_return[i]
-                    else:
-                        outputs[0][partition] = fn_return
+            order = self._partition_order(plan, slice_ids) if leases else None
+            partitions = (
+                (
+                    partition_name,
+                    (
+                        loaders,
+                        self._find_configurator(resolver, partition_name)
+                        + list(other_inputs),
+                    ),
+                )
+                for partition_name, loaders in self._skip_committed(
+                    self._claim(
+                        self._iter_partitions(partitioneds, order), plan, leases
+                    ),
+                    plan,
+                    checkpoint,
+                    resumed,
+                )
+            )
 
-            return outputs
+            for partition_name, values in self._run_partitions(partitions, elapsed):
+                if isinstance(values, _PartitionError):
+                    self._record_error(errors, partition_name, values)
+                elif checkpoint is not None:
+                    try:
+                        self._commit(checkpoint, plan, partition_name, values)
+                    except Exception:
+                        if not self._continue_on_error:
+                            raise
+                        self._record_error(
+                            errors,
+                            partition_name,
+                            _PartitionError(traceback.format_exc()),
+                        )
+                else:
+                    for output, value in zip(outputs, values):
+                        output[partition_name] = value
+
+            return self._with_stats(outputs, elapsed, resumed, errors)
 
         return fn
 
+    def _record_error(
+        self, errors: Dict[str, str], partition: str, error: _PartitionError
+    ):
+        self._logger.error(
+            f'"{self.name}" failed to process "{partition}", continuing\n'
+            f"{error.traceback}"
+        )
+        errors[partition] = error.traceback
+
+    def _with_stats(
+        self,
+        outputs: List[Dict[str, Any]],
+        elapsed: Dict[str, float],
+        resumed: List[str] = [],
+        errors: Dict[str, str] = {},
+    ) -> List[Any]:
+        if self.stats_output is not None:
+            return outputs + [self._build_stats(elapsed, resumed, errors)]
+        return outputs
+
+    def _build_stats(
+        self,
+        elapsed: Dict[str, float],
+        resumed: List[str] = [],
+        errors: Dict[str, str] = {},
+    ) -> _SliceStats:
+        """Builds the stats of this slice run.
+
+        Args:
+            elapsed (Dict[str, float]): seconds spent on each partition
+            resumed (List[str]): partitions committed by a previous attempt
+            errors (Dict[str, str]): traceback of each failed partition
+
+        Returns:
+            _SliceStats
+        """
+        stats: _SliceStats = {"timestamp": time.time(), "elapsed": elapsed}
+        if resumed:
+            stats["resumed"] = resumed
+        if errors:
+            stats["errors"] = errors
+        return stats
+
 
 class _SynchronizationNode(_CustomizedFuncNode):
     """Barrier node to prevent multinode dependants to run out of order.
@@ -975,9 +2682,24 @@ class _SynchronizationNode(_CustomizedFuncNode):
         ...                'subpath/c': lambda: 15} for mn in mns}
         >>> n.run(inputs=dictionary)
         {'b': {}}
+
+        Waiting for the slice markers only
+
+        >>> mns = [_MultiNode(slicer=lbn, func=fn,
+        ...                   partitioned_inputs='a', slice_count=2,
+        ...                   partitioned_outputs='b', slice_id=i, name='x',
+        ...                   record_stats=True)
+        ...        for i in range(2)]
+        >>> n = _SynchronizationNode(multinodes=mns, name='x',
+        ...                          partitioned_outputs='b', barrier='markers')
+        >>> n
+        Node(nonefy, ['x-slice-0-stats', 'x-slice-1-stats'], ['b'], \
+'x-synchronization')
     """
 
     SYNCHRONIZATION_SUFFIX = "-synchronization"
+    BARRIER_OUTPUTS = "outputs"
+    BARRIER_MARKERS = "markers"
 
     def __init__(
         self,
@@ -987,13 +2709,21 @@ class _SynchronizationNode(_CustomizedFuncNode):
         tags: Union[str, Iterable[str]] = None,
         confirms: Union[str, List[str]] = None,
         namespace: str = None,
+        barrier: Literal["outputs", "markers"] = BARRIER_OUTPUTS,
+        error_sources: List[_MultiNode] = [],
+        max_errors: int = 0,
     ):
         self._multinodes = multinodes
         self._partitioned_outputs = partitioned_outputs
+        self._barrier = barrier
+        self._error_sources = error_sources
+        self._max_errors = max_errors
+        self._work_stealing = multinodes[0].slicer.leases_input is not None
+        self._input_names = self._extract_inputs(multinodes)
 
         super().__init__(
             func=nonefy,
-            inputs=self._extract_inputs(multinodes),
+            inputs=self._input_names,
             outputs=tolist(partitioned_outputs),
             name=self._add_synchronization_suffix(name),
             tags=tags,
@@ -1016,17 +2746,138 @@ class _SynchronizationNode(_CustomizedFuncNode):
             "namespace": self._namespace,
             "tags": self._tags,
             "confirms": self._confirms,
+            "barrier": self._barrier,
+            "error_sources": self._error_sources,
+            "max_errors": self._max_errors,
         }
         params.update(overwrite_params)
         return self.__class__(**params)
 
-    @classmethod
-    def _extract_inputs(cls, nodes: List[_MultiNode]) -> List[str]:
-        return [output for node in nodes for output in node.outputs]
+    def _extract_inputs(self, nodes: List[_MultiNode]) -> List[str]:
+        if self._work_stealing:
+            inputs = [nodes[0].slicer_output] + [node.stats_output for node in nodes]
+        elif self._barrier == self.BARRIER_MARKERS:
+            assert all(
+                node.stats_output is not None for node in nodes
+            ), "multinodes must record stats to be synchronized by markers"
+            inputs = [node.stats_output for node in nodes]
+        else:
+            inputs = [output for node in nodes for output in node.partitioned_outputs]
+        assert all(
+            node.stats_output is not None for node in self._error_sources
+        ), "multinodes must record stats to have their errors checked"
+        listed = set(inputs)
+        return inputs + [
+            node.stats_output
+            for node in self._error_sources
+            if node.stats_output not in listed
+        ]
+
+    def _check_errors(self, markers: List[_SliceStats]):
+        """Checks the number of partitions that failed is tolerated.
+
+        Args:
+            markers (List[_SliceStats]): stats written by each error source
+
+        Raises:
+            RuntimeError: if more than `max_errors` partitions failed
+
+        Example:
+            >>> lbn = _SlicerNode(2, 'a', 'b', 'x')
+            >>> mns = [_MultiNode(slicer=lbn, func=lambda x: x,
+            ...                   partitioned_inputs='a', slice_count=2,
+            ...                   partitioned_outputs='b', slice_id=i, name='x',
+            ...                   continue_on_error=True)
+            ...        for i in range(2)]
+            >>> n = _SynchronizationNode(multinodes=mns, name='x',
+            ...                          partitioned_outputs='b',
+            ...                          error_sources=mns, max_errors=1)
+            >>> n.inputs
+            ['b-slice-0', 'b-slice-1', 'x-slice-0-stats', 'x-slice-1-stats']
+            >>> n._check_errors([{'elapsed': {}, 'errors': {'a': 'Trace'}},
+            ...                  {'elapsed': {}}])
+            >>> n._check_errors([{'elapsed': {}, 'errors': {'a': 'Trace'}},
+            ...                  {'elapsed': {}, 'errors': {'c': 'Trace'}}])
+            Traceback (most recent call last):
+            ...
+            RuntimeError: 2 partitions failed, more than the 1 tolerated: \
+['x/a', 'x/c']. Check the errors in the stats of the slices.
+        """
+        failed = sorted(
+            slice_node._partition_key(partition)
+            for slice_node, marker in zip(self._error_sources, markers)
+            for partition in marker.get("errors", {})
+        )
+        if len(failed) > self._max_errors:
+            raise RuntimeError(
+                f"{len(failed)} partitions failed, more than the "
+                f"{self._max_errors} tolerated: {failed}. Check the errors in "
+                "the stats of the slices."
+            )
+        elif failed:
+            self._logger.warning(f"Partitions {failed} failed, and were skipped")
+
+    def _check_exactly_once(self, plan: _SlicePlan, markers: List[_SliceStats]):
+        """Checks every planned partition was processed by a single slice.
+
+        Args:
+            plan (_SlicePlan): slicer plan
+            markers (List[_SliceStats]): stats written by each slice
+
+        Raises:
+            RuntimeError: if a partition was not processed, or was processed
+                more than once by the same node
+
+        Example:
+            >>> lbn = _SlicerNode(2, 'a', 'b', 'x', work_stealing=True)
+            >>> mns = [_MultiNode(slicer=lbn, func=lambda x: x,
+            ...                   partitioned_inputs='a', slice_count=2,
+            ...                   partitioned_outputs='b', slice_id=i, name='x')
+            ...        for i in range(2)]
+            >>> n = _SynchronizationNode(multinodes=mns, name='x',
+            ...                          partitioned_outputs='b')
+            >>> n.inputs
+            ['b-slicer', 'x-slice-0-stats', 'x-slice-1-stats']
+            >>> plan = {'slices': [['a', 'b'], ['c']], 'run_id': '1'}
+            >>> n._check_exactly_once(plan, [{'elapsed': {'a': 1, 'c': 1}},
+            ...                              {'elapsed': {'b': 1}}])
+            >>> n._check_exactly_once(plan, [{'elapsed': {'a': 1, 'c': 1}},
+            ...                              {'elapsed': {'c': 1}}])
+            Traceback (most recent call last):
+            ...
+            RuntimeError: "x" did not process ['b'], and processed ['c'] more \
+than once
+        """
+        planned = {p for slice in plan["slices"] for p in slice}
+        processed: Dict[str, Counter] = {}
+        for slice_node, marker in zip(self._multinodes, markers):
+            name = slice_node.name[: -len(slice_node._add_slice_suffix(""))]
+            processed.setdefault(name, Counter()).update(marker["elapsed"])
+            processed[name].update(marker.get("resumed", []))
+            processed[name].update(marker.get("errors", {}))
+        for name, counts in processed.items():
+            missing = sorted(planned - set(counts))
+            repeated = sorted(p for p, count in counts.items() if count > 1)
+            if missing or repeated:
+                raise RuntimeError(
+                    f'"{name}" did not process {missing}, and processed '
+                    f"{repeated} more than once"
+                )
 
     @property
     def func(self) -> Callable:
         def fn(*args: Any) -> List[dict]:
+            values = dict(zip(self._input_names, args))
+            if self._work_stealing:
+                slicer = self._multinodes[0].slicer
+                self._check_exactly_once(
+                    slicer.read_plan(values[slicer.json_output]),
+                    [values[node.stats_output] for node in self._multinodes],
+                )
+            if self._error_sources:
+                self._check_errors(
+                    [values[node.stats_output] for node in self._error_sources]
+                )
             return [dict() for _ in range(len(self.outputs))]
 
         return fn
@@ -1084,9 +2935,23 @@ def multipipeline(
     tags: Union[str, Iterable[str]] = None,
     confirms: Union[str, List[str]] = None,
     namespace: str = None,
-    n_slices: int = MAX_NODES * MAX_WORKERS,
+    n_slices: Union[int, Literal["auto"]] = MAX_NODES * MAX_WORKERS,
     max_simultaneous_steps: int = None,
     filter: IsFunction[str] = truthify,
+    balance: _Balance = "count",
+    streaming: bool = False,
+    partition_workers: int = None,
+    partition_executor: Literal["thread", "process"] = "thread",
+    prefetch: int = 0,
+    barrier: Literal["outputs", "markers"] = "outputs",
+    work_stealing: bool = False,
+    group_by: Union[str, List[str]] = None,
+    checkpoint: bool = False,
+    retries: int = 0,
+    retry_backoff: float = 1.0,
+    continue_on_error: bool = False,
+    max_errors: int = 0,
+    join: Join = "inner",
 ) -> Pipeline:
     """Creates multiple pipelines to process partitioned data.
 
@@ -1115,13 +2980,96 @@ def multipipeline(
             Defaults to None.
         namespace (str, optional): Namespace the nodes belong to.
             Defaults to None.
-        n_slices (int): Number of multinodes to build.
-            Defaults to MAX_WORKERS + MAX_NODES
+        n_slices (Union[int, str]): Number of multinodes to build. If 'auto',
+            MAX_WORKERS * MAX_NODES multinodes are built, but the slicer
+            only gives partitions to as many slices as the partition count
+            and their estimated costs are worth, and the remaining slices
+            finish without loading their partitioned inputs, see the
+            warning below. 'hash' balance keeps hashing into all the
+            slices, so partitions do not move when others are added.
+            Defaults to MAX_WORKERS * MAX_NODES
         max_simultaneous_steps (int): Maximum number of slices created for
             each branch. Defaults to None.
         filter (IsFunction[str]): A function applied to each partition of
             the partitioned inputs. If the function returns False, the
-            parttition won't be used.
+            parttition won't be used. If the function has a `prefixes`
+            attribute, only the partitions starting with one of them are
+            listed, and if it has a `many` attribute, it is called once with
+            all the partitions, returning the ones to keep.
+        balance (Union[str, Callable[[str], float]]): How partitions are
+            distributed among slices. 'count' splits the sorted partitions
+            into ranges of the same length, 'size' packs the partitions
+            by the sum of their file sizes, and a function receiving a
+            partition and returning its cost packs them by that cost.
+            Packing uses the longest processing time first rule. 'hash'
+            assigns each partition by a consistent hash of its name, so
+            adding or removing partitions does not move the others, and
+            changing `n_slices` moves only a proportional share of them.
+            Defaults to 'count'.
+        streaming (bool): Whether each partition is processed only when its
+            output is saved, so a slice holds one partition in memory instead
+            of all of them. Relies on the partitioned dataset lazy saving,
+            so every node must have a single partitioned output.
+            Defaults to False.
+        partition_workers (int): Number of partitions processed at the same
+            time inside each slice. At most this number of partitions are
+            loaded at once, and outputs keep the same order. Cannot be used
+            with `streaming`. Defaults to None, i.e. one after another.
+        partition_executor (str): Whether `partition_workers` are 'thread's or
+            'process'es. Process workers require the function and the
+            partition loaders to be picklable. Defaults to 'thread'.
+        prefetch (int): Number of partitions loaded in background while
+            the current partition is processed, so I/O and compute overlap.
+            Up to `prefetch` + 1 partitions are kept in memory. Only applies
+            when neither `streaming` nor `partition_workers` are set.
+            Defaults to 0.
+        barrier (str): What the synchronization step waits for. 'outputs'
+            loads the partitioned outputs of every slice, while 'markers'
+            makes every slice write a small JSON with its stats, and waits
+            for these files only, without loading the partitioned data.
+            Defaults to 'outputs'.
+        work_stealing (bool): Whether slices claim the partitions they
+            process using lease files stored next to the slicer output. Each
+            slice processes its own partitions first, then steals the
+            unclaimed partitions of the other slices. Each partition is
+            processed by a single slice as long as the output filesystem
+            creates files exclusively, e.g. local filesystems, or object
+            stores supporting conditional writes; other filesystems raise
+            on the first claim, before any partition is processed. Slices
+            synchronize by markers, and the synchronization checks every
+            partition was processed exactly once. Requires a single layer
+            pipeline, and cannot be used with `streaming`. Defaults to False.
+        group_by (Union[str, List[str]]): Placeholders of the configurator
+            template, e.g. 'store'. Partitions with the same values for
+            these placeholders are kept in the same slice, and the groups
+            are balanced across slices. Partitions that do not match the
+            template are placed alone. Requires a `configurator`.
+            Defaults to None.
+        checkpoint (bool): Whether slices save the outputs of each partition
+            as soon as it is processed, marking it as committed in a folder
+            next to the slicer output. A slice executed again skips the
+            partitions committed by the same slicer run, so a failed slice
+            only recomputes the partitions it did not finish. Outputs must
+            not be set to `overwrite`. Defaults to False.
+        retries (int): Number of times the load and processing of a
+            partition, and its persistence when checkpointing, are attempted
+            again after raising. Defaults to 0.
+        retry_backoff (float): Seconds waited before the first retry of a
+            partition, doubled for each retry after it. Defaults to 1.0.
+        continue_on_error (bool): Whether slices keep processing their other
+            partitions when a partition fails after its retries. Failed
+            partitions are not saved, and their tracebacks are written to
+            the stats of the slice, next to the slicer output. The
+            synchronization then fails if more than `max_errors` partitions
+            failed. Cannot be used with `streaming` unless checkpointing.
+            Defaults to False.
+        max_errors (int): Number of failed partitions tolerated by the
+            synchronization when `continue_on_error`. Defaults to 0.
+        join (str): How the partitions of multiple partitioned inputs are
+            matched by their names without extension. 'inner' processes the
+            partitions present in every input, 'left' the partitions of the
+            first input, and 'outer' the partitions present in any input.
+            Inputs missing a partition receive `Null`. Defaults to 'inner'.
 
     Returns:
         Pipeline
@@ -1165,6 +3113,14 @@ def multipipeline(
             output: pipe(A->B0, B0->C0, [C0, D0] -> E0)
                                 B0->D0
 
+    Warning:
+        `n_slices='auto'` builds MAX_WORKERS * MAX_NODES slices, since the
+        partitions are only known when the slicer runs. Slices without
+        partitions still run as nodes, loading their non partitioned
+        inputs, e.g. parameters, and writing their stats, when recorded.
+        Bound that cost with the `MAX_WORKERS` and `MAX_NODES` environment
+        variables, or with `max_simultaneous_steps` in a `multipipeline`.
+
     Warning:
         every function must me declared considering partitioned inputs are
         the first arguments of the function, the configurator (if present)
@@ -1179,6 +3135,27 @@ def multipipeline(
         target ['a'], the first match will be used i.e. order is random or
         list instance order driven.
     """
+    assert not (
+        streaming and partition_workers
+    ), "`streaming` and `partition_workers` cannot be used together"
+    assert not (
+        prefetch and (streaming or partition_workers)
+    ), "`prefetch` cannot be used with `streaming` or `partition_workers`"
+    assert not (
+        work_stealing and (streaming or len(pipe.grouped_nodes) > 1)
+    ), "`work_stealing` requires a single layer pipeline without `streaming`"
+    assert not (
+        group_by and configurator is None
+    ), "`group_by` requires a configurator template"
+    assert not (
+        continue_on_error and streaming and not checkpoint
+    ), "`continue_on_error` requires `checkpoint` when `streaming`"
+    assert join in JOINS, f'`join` must be one of {JOINS}, not "{join}"'
+
+    auto_slices = n_slices == "auto"
+    if auto_slices:
+        n_slices = MAX_NODES * MAX_WORKERS
+
     # sorts just to keep output consistency
     partitioned_output = sorted(list(pipe.all_outputs()))
     if max_simultaneous_steps is not None:
@@ -1193,25 +3170,30 @@ def multipipeline(
     confirms = unique(_treat_optional_one_or_many(confirms))
     tags = unique(_treat_optional_one_or_many(tags) + [name])
 
-    slicer = Pipeline(
-        [
-            _SlicerNode(
-                slice_count=n_slices,
-                partitioned_inputs=partitioned_input,
-                partitioned_outputs=tolist(partitioned_output)[0],
-                name=name,
-                tags=tags,
-                confirms=confirms,
-                namespace=namespace,
-                filter=filter,
-                configurator=configurator,
-            )
-        ]
+    slicer = _SlicerNode(
+        slice_count=n_slices,
+        partitioned_inputs=partitioned_input,
+        partitioned_outputs=tolist(partitioned_output)[0],
+        name=name,
+        tags=tags,
+        confirms=confirms,
+        namespace=namespace,
+        filter=filter,
+        configurator=configurator,
+        balance=balance,
+        work_stealing=work_stealing,
+        auto_slices=auto_slices,
+        group_by=group_by,
+        checkpoint=checkpoint,
+        join=join,
     )
 
     sources = set(tolist(partitioned_input) + tolist(partitioned_output))
 
-    multinodes = Pipeline([])
+    # slices are built in a single pass, indexing the outputs of the previous
+    # layers, and the pipeline is only built once at the end
+    multinodes: List[_MultiNode] = []
+    previous_outputs: Dict[str, int] = {}
 
     for layer in pipe.grouped_nodes:
         multinode_layer: List[_MultiNode] = []
@@ -1236,30 +3218,40 @@ def multipipeline(
                         partitioned_outputs=lnode.outputs,
                         slice_count=n_slices,
                         slice_id=i,
-                        slicer=slicer.nodes[0],
+                        slicer=slicer,
                         confirms=unique(lnode.confirms + confirms),
                         tags=unique(list(lnode.tags) + tags),
-                        previous_nodes=multinodes._nodes,
+                        previous_outputs=previous_outputs,
                         configurator=node_configurator,
+                        streaming=streaming,
+                        partition_workers=partition_workers,
+                        partition_executor=partition_executor,
+                        prefetch=prefetch,
+                        record_stats=barrier == _SynchronizationNode.BARRIER_MARKERS,
+                        retries=retries,
+                        retry_backoff=retry_backoff,
+                        continue_on_error=continue_on_error,
                     )
                 )
 
-        multinodes = multinodes + Pipeline(multinode_layer)
+        for lnode in layer:
+            for output in lnode.outputs:
+                previous_outputs[output] = previous_outputs.get(output, 0) + n_slices
+        multinodes.extend(multinode_layer)
 
-    synchronization = Pipeline(
-        [
-            _SynchronizationNode(
-                multinodes=_sortnodes(multinodes.grouped_nodes[-1]),
-                partitioned_outputs=partitioned_output,
-                name=name,
-                tags=tags,
-                confirms=confirms,
-                namespace=namespace,
-            )
-        ]
+    synchronization = _SynchronizationNode(
+        multinodes=_sortnodes(multinode_layer),
+        partitioned_outputs=partitioned_output,
+        name=name,
+        tags=tags,
+        confirms=confirms,
+        namespace=namespace,
+        barrier=barrier,
+        error_sources=_sortnodes(multinodes) if continue_on_error else [],
+        max_errors=max_errors,
     )
 
-    return slicer + multinodes + synchronization
+    return Pipeline([slicer, *multinodes, synchronization])
 
 
 def multinode(
@@ -1272,8 +3264,22 @@ def multinode(
     tags: Union[str, Iterable[str]] = None,
     confirms: Union[str, List[str]] = None,
     namespace: str = None,
-    n_slices: int = MAX_NODES * MAX_WORKERS,
+    n_slices: Union[int, Literal["auto"]] = MAX_NODES * MAX_WORKERS,
     filter: IsFunction[str] = truthify,
+    balance: _Balance = "count",
+    streaming: bool = False,
+    partition_workers: int = None,
+    partition_executor: Literal["thread", "process"] = "thread",
+    prefetch: int = 0,
+    barrier: Literal["outputs", "markers"] = "outputs",
+    work_stealing: bool = False,
+    group_by: Union[str, List[str]] = None,
+    checkpoint: bool = False,
+    retries: int = 0,
+    retry_backoff: float = 1.0,
+    continue_on_error: bool = False,
+    max_errors: int = 0,
+    join: Join = "inner",
 ) -> Pipeline:
     """Creates multiple nodes to process partitioned data.
 
@@ -1346,9 +3352,54 @@ def multinode(
             Defaults to None.
         namespace (str, optional): Namespace the nodes belong to.
             Defaults to None.
-        n_slices (int): Number of multinodes to build.
-            Defaults to MAX_WORKERS + MAX_NODES
+        n_slices (Union[int, str]): Number of multinodes to build, or 'auto'
+            to let the slicer decide how many of them receive partitions,
+            out of MAX_WORKERS * MAX_NODES built ones, see the warning
+            below. Defaults to MAX_WORKERS * MAX_NODES
         filter (IsFunction[str], optional): Function to filter input partitions
+        balance (Union[str, Callable[[str], float]], optional): How partitions
+            are distributed among slices. 'count' splits the sorted
+            partitions into ranges of the same length, 'size' packs the
+            partitions by the sum of their file sizes, and a function
+            receiving a partition and returning its cost packs them by that
+            cost. 'hash' keeps each partition in the same slice across runs.
+            Defaults to 'count'.
+        streaming (bool, optional): Whether each partition is processed only
+            when its output is saved, keeping a single partition in memory.
+            Requires a single partitioned output. Defaults to False.
+        partition_workers (int, optional): Number of partitions processed at
+            the same time inside each slice. Defaults to None.
+        partition_executor (str, optional): Whether `partition_workers` are
+            'thread's or 'process'es. Defaults to 'thread'.
+        prefetch (int, optional): Number of partitions loaded in background
+            while the current partition is processed. Defaults to 0.
+        barrier (str, optional): Whether the synchronization step waits for
+            the slice 'outputs', or for small 'markers' written by each
+            slice. Defaults to 'outputs'.
+        work_stealing (bool, optional): Whether slices that finish their own
+            partitions process the unclaimed partitions of other slices.
+            Defaults to False.
+        group_by (Union[str, List[str]], optional): Configurator template
+            placeholders whose partitions are kept in the same slice.
+            Defaults to None.
+        checkpoint (bool, optional): Whether slices persist each partition
+            as soon as it is processed, so slices executed again skip the
+            partitions already committed. Defaults to False.
+        retries (int, optional): Number of times a failed partition is
+            attempted again. Defaults to 0.
+        retry_backoff (float, optional): Seconds waited before the first
+            retry, doubled for each retry after it. Defaults to 1.0.
+        continue_on_error (bool, optional): Whether slices keep processing
+            after a partition fails, recording its traceback in the slice
+            stats. Defaults to False.
+        max_errors (int, optional): Number of failed partitions tolerated by
+            the synchronization when `continue_on_error`. Defaults to 0.
+        join (str, optional): How the partitions of multiple partitioned
+            inputs are matched by their names without extension. 'inner'
+            processes the partitions present in every input, 'left' the
+            partitions of the first input, and 'outer' the partitions present
+            in any input. Inputs missing a partition receive `Null`.
+            Defaults to 'inner'.
 
     Returns:
         Pipeline
@@ -1500,6 +3551,14 @@ def multinode(
         the multinode name is also added as a tag into all nodes in order
         to allow running the multinode with `kedro run --tag`.
 
+    Warning:
+        `n_slices='auto'` builds MAX_WORKERS * MAX_NODES slices, since the
+        partitions are only known when the slicer runs. Slices without
+        partitions still run as nodes, loading their non partitioned
+        inputs, e.g. parameters, and writing their stats, when recorded.
+        Bound that cost with the `MAX_WORKERS` and `MAX_NODES` environment
+        variables, or with `max_simultaneous_steps` in a `multipipeline`.
+
     Warning:
         every function must me declared considering partitioned inputs are
         the first arguments of the function, the configurator (if present)
@@ -1535,6 +3594,20 @@ def multinode(
         configurator=configurator,
         confirms=confirms,
         filter=filter,
+        balance=balance,
+        streaming=streaming,
+        partition_workers=partition_workers,
+        partition_executor=partition_executor,
+        prefetch=prefetch,
+        barrier=barrier,
+        work_stealing=work_stealing,
+        group_by=group_by,
+        checkpoint=checkpoint,
+        retries=retries,
+        retry_backoff=retry_backoff,
+        continue_on_error=continue_on_error,
+        max_errors=max_errors,
+        join=join,
         max_simultaneous_steps=None,
         n_slices=n_slices,
         name=name,
@@ -1,14 +1,17 @@
 """Hook to enable MultiNode."""
 
 from copy import deepcopy
-from typing import Dict, Any
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Any
 from kedro.pipeline import Pipeline
 from kedro.io import DataCatalog
 from kedro.framework.hooks import hook_impl
-from kedro_datasets.json import JSONDataset
 from kedro_partitioned.pipeline.multinode import _SlicerNode, _MultiNode
-from upath import UPath
-from kedro_datasets.partitions import PartitionedDataset
+
+if TYPE_CHECKING:
+    from kedro_datasets.json import JSONDataset
+    from kedro_datasets.partitions import PartitionedDataset
+    from upath import UPath
 
 
 class MultiNodeEnabler:
@@ -37,6 +40,11 @@ class MultiNodeEnabler:
     >>> catalog._datasets['b-slicer']._filepath
     PurePosixPath('b/b-slicer.json')
 
+    Slice outputs share the filesystem of the original output:
+
+    >>> catalog._datasets['b-slice-0']._filesystem is catalog._datasets['b']._filesystem
+    True
+
     Azure Blob Storage:
 
 
@@ -53,8 +61,81 @@ class MultiNodeEnabler:
 
     >>> catalog._datasets['b-slicer']._protocol
     'http'
+
+    Balancing by runtime:
+
+    >>> pipe = multipipeline(Pipeline([
+    ...     node(func=lambda x: x, name='node', inputs='a', outputs='b'),]),
+    ...     'a', 'pipe', n_slices=2, balance='runtime')
+    >>> catalog = DataCatalog(datasets={
+    ...     'a': PathSafePartitionedDataset(path='a', dataset='pandas.CSVDataset'),
+    ...     'b': PathSafePartitionedDataset(path='b', dataset='pandas.CSVDataset')})
+    >>> hook.before_pipeline_run({}, pipe, catalog)
+
+    >>> catalog._datasets['node-slice-1-stats']._filepath
+    PurePosixPath('b/b-slicer-stats/node-slice-1.json')
+
+    >>> catalog._datasets['b-slicer-stats']._dataset._path
+    'b/b-slicer-stats'
+
+    Stealing work:
+
+    >>> pipe = multipipeline(Pipeline([
+    ...     node(func=lambda x: x, name='node', inputs='a', outputs='b'),]),
+    ...     'a', 'pipe', n_slices=2, work_stealing=True)
+    >>> catalog = DataCatalog(datasets={
+    ...     'a': PathSafePartitionedDataset(path='a', dataset='pandas.CSVDataset'),
+    ...     'b': PathSafePartitionedDataset(path='b', dataset='pandas.CSVDataset')})
+    >>> hook.before_pipeline_run({}, pipe, catalog)
+
+    >>> catalog._datasets['b-slicer-leases']._path
+    'b/b-slicer-leases'
+
+    Checkpointing partitions:
+
+    >>> pipe = multipipeline(Pipeline([
+    ...     node(func=lambda x: x, name='node', inputs='a', outputs='b'),]),
+    ...     'a', 'pipe', n_slices=2, checkpoint=True)
+    >>> catalog = DataCatalog(datasets={
+    ...     'a': PathSafePartitionedDataset(path='a', dataset='pandas.CSVDataset'),
+    ...     'b': PathSafePartitionedDataset(path='b', dataset='pandas.CSVDataset')})
+    >>> hook.before_pipeline_run({}, pipe, catalog)
+
+    >>> catalog._datasets['node-slice-1-checkpoint']._path
+    'b/b-slicer-checkpoints'
     """
 
+    def _clone(self, partitioned: "PartitionedDataset") -> "PartitionedDataset":
+        """Creates the dataset of a slice output.
+
+        Args:
+            partitioned (PartitionedDataset): original partitioned output
+
+        Returns:
+            PartitionedDataset: a clone sharing the filesystem, if the
+                dataset supports it, otherwise a deep copy
+        """
+        clone = getattr(partitioned, "clone", None)
+        return clone() if callable(clone) else deepcopy(partitioned)
+
+    def _stats_path(
+        self, partitioned: "PartitionedDataset", slicer: _SlicerNode
+    ) -> "UPath":
+        from upath import UPath
+
+        return UPath(partitioned._path) / slicer.stats_name
+
+    def _slicer_output(
+        self, partitioned: "PartitionedDataset", slicer: _SlicerNode
+    ) -> "JSONDataset":
+        from kedro_datasets.json import JSONDataset
+        from upath import UPath
+
+        return JSONDataset(
+            filepath=str(UPath(partitioned._path) / f"{slicer.json_output}.json"),
+            credentials=partitioned._credentials,
+        )
+
     @hook_impl
     def before_pipeline_run(
         self,
@@ -69,6 +150,17 @@ class MultiNodeEnabler:
             pipeline (Pipeline): Pipeline to be run.
             catalog (DataCatalog): Catalog of data sources.
         """
+        # imported here since every kedro command imports this module
+        from kedro_datasets.json import JSONDataset
+        from kedro_datasets.partitions import PartitionedDataset
+        from upath import UPath
+
+        from kedro_partitioned.extras.datasets.nullable_dataset import (
+            NullableDataset,
+        )
+        from kedro_partitioned.io.checkpoint_dataset import CheckpointDataset
+        from kedro_partitioned.io.lease_dataset import LeaseDataset
+
         for node in pipeline.nodes:
             if isinstance(node, _MultiNode):
                 for original, slice in zip(
@@ -78,7 +170,59 @@ class MultiNodeEnabler:
                     assert isinstance(
                         partitioned, PartitionedDataset
                     ), "multinode cannot have non partitioned outputs"
-                    catalog.add(slice, deepcopy(partitioned))
+                    catalog.add(slice, self._clone(partitioned))
+
+                # slices may run without their slicer, e.g. when resumed
+                partitioned = catalog._get_dataset(node.slicer.original_output)
+                catalog.add(
+                    node.slicer_output,
+                    self._slicer_output(partitioned, node.slicer),
+                    replace=True,
+                )
+
+                if node.checkpoint_input is not None:
+                    slices = [catalog._get_dataset(s) for s in node.partitioned_outputs]
+                    assert not any(s._overwrite for s in slices), (
+                        f'"{node.name}" cannot checkpoint partitioned outputs '
+                        "with `overwrite`"
+                    )
+                    partitioned = catalog._get_dataset(node.slicer.original_output)
+                    catalog.add(
+                        node.checkpoint_input,
+                        CheckpointDataset(
+                            path=str(
+                                UPath(partitioned._path) / node.slicer.checkpoints_name
+                            ),
+                            outputs=slices,
+                            credentials=partitioned._credentials,
+                        ),
+                    )
+
+                if node.slicer.leases_input is not None:
+                    partitioned = catalog._get_dataset(node.slicer.original_output)
+                    catalog.add(
+                        node.slicer.leases_input,
+                        LeaseDataset(
+                            path=str(
+                                UPath(partitioned._path) / node.slicer.leases_input
+                            ),
+                            credentials=partitioned._credentials,
+                        ),
+                        replace=True,
+                    )
+
+                if node.stats_output is not None:
+                    partitioned = catalog._get_dataset(node.slicer.original_output)
+                    catalog.add(
+                        node.stats_output,
+                        JSONDataset(
+                            filepath=str(
+                                self._stats_path(partitioned, node.slicer)
+                                / f"{node.name}.json"
+                            ),
+                            credentials=partitioned._credentials,
+                        ),
+                    )
 
                 for input in node.original_partitioned_inputs:
                     partitioned = catalog._get_dataset(input)
@@ -97,13 +241,23 @@ class MultiNodeEnabler:
                 )
                 catalog.add(
                     node.json_output,
-                    JSONDataset(
-                        filepath=str(
-                            UPath(partitioned._path) / f"{node.json_output}.json"
-                        ),
-                        credentials=partitioned._credentials,
-                    ),
+                    self._slicer_output(partitioned, node),
+                    replace=True,
                 )
 
+                if node.stats_input is not None:
+                    catalog.add(
+                        node.stats_input,
+                        NullableDataset(
+                            dataset=partial(
+                                PartitionedDataset, dataset="json.JSONDataset"
+                            ),
+                            verbose=False,
+                            path=str(self._stats_path(partitioned, node)),
+                            filename_suffix=".json",
+                            credentials=partitioned._credentials,
+                        ),
+                    )
+
 
 multinode_enabler = MultiNodeEnabler()
@@ -1,10 +1,13 @@
 """Non categorized utilitary functions."""
 
 from functools import reduce
+import importlib
 import inspect
 import re
-from typing import Any, Callable, Dict, Union
+import sys
+from typing import Any, Callable, Dict, List, Tuple, Union
 
+from kedro_partitioned.utils.string import regex_prefix
 from kedro_partitioned.utils.typing import T
 
 
@@ -138,6 +141,8 @@ def filter_or_regex(func: Union[Callable[[str], bool], str]) -> Callable[[str],
         False
         >>> func1('ab')
         False
+        >>> filter_or_regex('sales/2020.*').prefixes
+        ['sales/2020']
     """
     if isinstance(func, str):
         regex = re.compile(func)
@@ -145,6 +150,9 @@ def filter_or_regex(func: Union[Callable[[str], bool], str]) -> Callable[[str],
         def filter_func(x: str) -> bool:
             return bool(re.match(regex, x))
 
+        prefix = regex_prefix(func)
+        if prefix:
+            filter_func.prefixes = [prefix]
         return filter_func
     else:
         return func
@@ -212,3 +220,46 @@ def compose(*fns: Callable) -> Callable:
         return reduce(lambda r, fn: fn(r), fns, x)
 
     return chainit
+
+
+def lazy_module(
+    name: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Creates the `__getattr__` and `__dir__` of a module with lazy attributes.
+
+    Each attribute is imported from its submodule on first access, so
+    importing one of them does not import the dependencies of the others.
+
+    Args:
+        name (str): name of the module, i.e. its `__name__`
+        attributes (Dict[str, str]): submodule, relative to the module, by
+            attribute name
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: the module
+            `__getattr__` and `__dir__`
+
+    Example:
+        >>> getattr_, dir_ = lazy_module(
+        ...     'kedro_partitioned.utils', {'jump_hash': '.scheduling'})
+        >>> getattr_('jump_hash').__module__
+        'kedro_partitioned.utils.scheduling'
+        >>> 'jump_hash' in dir_()
+        True
+        >>> getattr_('missing')
+        Traceback (most recent call last):
+        ...
+        AttributeError: module 'kedro_partitioned.utils' has no attribute 'missing'
+    """
+    module = sys.modules[name]
+
+    def __getattr__(attribute: str) -> Any:
+        if attribute in attributes:
+            submodule = importlib.import_module(attributes[attribute], name)
+            return getattr(submodule, attribute)
+        raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,148 @@
+"""Utils for matching the partitions of different partitioned datasets."""
+
+import heapq
+import itertools
+import sys
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple
+
+from typing_extensions import Literal
+
+from kedro_partitioned.utils.string import get_filepath_without_extension
+
+Join = Literal["inner", "left", "outer"]
+JOINS = ("inner", "left", "outer")
+
+
+class PartitionIndex:
+    """Partition ids of a listing, stripped of their extensions and sorted.
+
+    Partitions of different datasets match by their ids without extension,
+    e.g. 'a/b.csv' and 'a/b.parquet.gz' are the partition 'a/b'. The index
+    strips every path once, interning the ids so the indexes of different
+    datasets share them, and keeps them in a sorted list.
+
+    Example:
+        >>> index = PartitionIndex(['b.csv', 'a.csv.gz', 'c/d.parquet'])
+        >>> index.ids
+        ['a', 'b', 'c/d']
+        >>> index.path('a')
+        'a.csv.gz'
+        >>> 'b' in index, 'z' in index
+        (True, False)
+        >>> index.intersect(PartitionIndex(['c/d.csv', 'a.json']))
+        ['a', 'c/d']
+        >>> index.subset(['c/d', 'z', 'b'])
+        {'c/d': 'c/d.parquet', 'b': 'b.csv'}
+        >>> index.join(PartitionIndex(['c/d.csv', 'e.csv']), how='outer')
+        ['a', 'b', 'c/d', 'e']
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """Initializes the index.
+
+        Args:
+            paths (Iterable[str]): partition paths, if two of them have the
+                same id, the last one is kept
+        """
+        self._paths: Dict[str, str] = {
+            sys.intern(get_filepath_without_extension(path)): path for path in paths
+        }
+        self.ids: List[str] = sorted(self._paths)
+
+    def __len__(self) -> int:
+        """Number of partitions."""
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the sorted partition ids."""
+        return iter(self.ids)
+
+    def __contains__(self, id: object) -> bool:
+        """Whether a partition id is in the index."""
+        return id in self._paths
+
+    def path(self, id: str) -> str:
+        """Path of a partition id.
+
+        Args:
+            id (str): partition id
+
+        Returns:
+            str
+        """
+        return self._paths[id]
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Iterates over the sorted partition ids and their paths.
+
+        Yields:
+            Tuple[str, str]: partition id and path
+        """
+        for id in self.ids:
+            yield id, self._paths[id]
+
+    def intersect(self, *others: "PartitionIndex") -> List[str]:
+        """Partition ids present in this index and in all the others.
+
+        Args:
+            others (PartitionIndex): indexes to intersect with
+
+        Returns:
+            List[str]: sorted partition ids
+        """
+        smallest, *rest = sorted((self, *others), key=len)
+        ids = list(smallest.ids)
+        for other in rest:
+            ids = [id for id in ids if id in other._paths]
+        return ids
+
+    def join(self, *others: "PartitionIndex", how: Join = "inner") -> List[str]:
+        """Partition ids of a join of this index with the others.
+
+        The sorted ids of the indexes are merged in a single pass.
+
+        Args:
+            others (PartitionIndex): indexes to join with
+            how (Join, optional): 'inner' keeps the ids present in every
+                index, 'left' the ids of this index, and 'outer' the ids
+                present in any of them. Defaults to 'inner'.
+
+        Returns:
+            List[str]: sorted partition ids
+        """
+        assert how in JOINS, f'`how` must be one of {JOINS}, not "{how}"'
+        if how == "inner":
+            return self.intersect(*others)
+        elif how == "left":
+            return list(self.ids)
+        merged = heapq.merge(self.ids, *(other.ids for other in others))
+        return [id for id, _ in itertools.groupby(merged)]
+
+    def subset(self, ids: Iterable[str]) -> Dict[str, str]:
+        """Paths of the given partition ids that are in the index.
+
+        Args:
+            ids (Iterable[str]): partition ids
+
+        Returns:
+            Dict[str, str]: path by partition id, in the order of `ids`
+        """
+        return {id: self._paths[id] for id in ids if id in self._paths}
+
+
+def partition_index(partitioned: Mapping[str, object]) -> PartitionIndex:
+    """Index of a partitioned dictionary, reusing the one it carries.
+
+    Args:
+        partitioned (Mapping[str, object]): partition by path, e.g. the
+            loaders of a partitioned dataset
+
+    Returns:
+        PartitionIndex
+
+    Example:
+        >>> partition_index({'b.csv': None, 'a.csv': None}).ids
+        ['a', 'b']
+    """
+    index = getattr(partitioned, "index", None)
+    return index if isinstance(index, PartitionIndex) else PartitionIndex(partitioned)
@@ -0,0 +1,73 @@
+"""Utils for distributing weighted items into bins."""
+
+import hashlib
+import heapq
+from typing import Dict, List
+
+from kedro_partitioned.utils.typing import T
+
+
+def lpt_schedule(costs: Dict[T, float], bins: int) -> List[List[T]]:
+    """Distributes items into bins using the longest processing time rule.
+
+    Items are sorted by their cost in descending order, and each one of them
+    is assigned to the bin with the lowest accumulated cost. This greedy
+    scheduler guarantees a makespan at most 4/3 of the optimal one.
+
+    Args:
+        costs (Dict[T, float]): cost of each item
+        bins (int): number of bins
+
+    Returns:
+        List[List[T]]: items assigned to each bin, in scheduling order
+
+    Example:
+        >>> lpt_schedule({'a': 5, 'b': 1, 'c': 1, 'd': 3}, 2)
+        [['a'], ['d', 'b', 'c']]
+
+        >>> lpt_schedule({'a': 1, 'b': 1, 'c': 1}, 2)
+        [['a', 'c'], ['b']]
+
+        >>> lpt_schedule({}, 2)
+        [[], []]
+    """
+    heap = [(0.0, i) for i in range(bins)]
+    assignment: List[List[T]] = [[] for _ in range(bins)]
+    for item, cost in sorted(costs.items(), key=lambda x: (-x[1], x[0])):
+        load, i = heapq.heappop(heap)
+        assignment[i].append(item)
+        heapq.heappush(heap, (load + cost, i))
+    return assignment
+
+
+def jump_hash(key: str, buckets: int) -> int:
+    """Assigns a key to a bucket using jump consistent hashing.
+
+    The key is hashed with blake2b, so the bucket is the same across
+    processes and python versions. Growing the number of buckets from n to
+    n + 1 moves only 1/(n + 1) of the keys, all of them to the new bucket.
+
+    Args:
+        key (str): key to assign
+        buckets (int): number of buckets
+
+    Returns:
+        int: bucket of the key, between 0 and `buckets` - 1
+
+    Example:
+        >>> [jump_hash(k, 3) for k in ['a', 'b', 'c', 'd']]
+        [0, 2, 2, 0]
+
+        >>> keys = [str(i) for i in range(1000)]
+        >>> moved = [k for k in keys if jump_hash(k, 10) != jump_hash(k, 11)]
+        >>> all(jump_hash(k, 11) == 10 for k in moved), len(moved) < 150
+        (True, True)
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    seed = int.from_bytes(digest, "little")
+    bucket, jump = -1, 0
+    while jump < buckets:
+        bucket = jump
+        seed = (seed * 2862933555777941757 + 1) % (1 << 64)
+        jump = int((bucket + 1) * ((1 << 31) / ((seed >> 33) + 1)))
+    return bucket
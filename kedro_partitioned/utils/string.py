@@ -1,6 +1,12 @@
 """Utils for string manipulation."""
 
-from pathlib import Path
+from typing import Union
+
+COMPRESSION_EXTENSIONS = frozenset(
+    {".gz", ".bz2", ".xz", ".zst", ".zip", ".lz4", ".snappy"}
+)
+_REGEX_SPECIAL = set(".^$*+?{}[]()|\\")
+_REGEX_OPTIONAL = set("*?{")
 
 
 def get_filepath_extension(filepath: str) -> str:
@@ -24,8 +30,21 @@ def get_filepath_extension(filepath: str) -> str:
 
         >>> get_filepath_extension('path/to.file/file.extension')
         '.extension'
+
+        Compressed files keep the extension of their content
+
+        >>> get_filepath_extension('path/file.v1.csv.gz')
+        '.csv.gz'
     """
-    return Path(filepath).suffix
+    name = filepath.rpartition("/")[2]
+    dot = name.rfind(".")
+    if not 0 < dot < len(name) - 1:
+        return ""
+    if name[dot:] in COMPRESSION_EXTENSIONS:
+        inner = name.rfind(".", 0, dot)
+        if 0 < inner < dot - 1:
+            return name[inner:]
+    return name[dot:]
 
 
 def get_filepath_without_extension(filepath: str) -> str:
@@ -46,9 +65,47 @@ def get_filepath_without_extension(filepath: str) -> str:
 
         >>> get_filepath_without_extension('a/.gitignore')
         'a/.gitignore'
+
+        >>> get_filepath_without_extension('a/b.csv.gz')
+        'a/b'
     """
     ext = get_filepath_extension(filepath)
-    if ext:
-        return filepath.rsplit(ext, 1)[0]
-    else:
-        return filepath
+    return filepath[: len(filepath) - len(ext)]
+
+
+def regex_prefix(pattern: str) -> Union[str, None]:
+    r"""Literal prefix of every string matched by a regex at its start.
+
+    Args:
+        pattern (str): regex, as used by `re.match`
+
+    Returns:
+        Union[str, None]: the prefix, or None if it cannot be determined,
+            e.g. because the regex has alternatives
+
+    Example:
+        >>> regex_prefix(r'sales/2020\-\d{2}')
+        'sales/2020-'
+        >>> regex_prefix(r'^sales/2020-0?')
+        'sales/2020-'
+        >>> regex_prefix(r'sales/(a|b)')
+        >>> regex_prefix(r'\d+')
+        ''
+    """
+    if "|" in pattern:
+        return None
+    prefix = []
+    i = 1 if pattern.startswith("^") else 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            prefix.append(pattern[i + 1])
+            i += 2
+        elif char in _REGEX_SPECIAL:
+            if char in _REGEX_OPTIONAL and prefix:
+                prefix.pop()
+            break
+        else:
+            prefix.append(char)
+            i += 1
+    return "".join(prefix)
@@ -1,9 +1,21 @@
 """Package for type annotations."""
 
-from typing import Callable, Tuple, TypeVar, Union
-from kedro_datasets.pandas import CSVDataset, ExcelDataset, ParquetDataset
+from typing import TYPE_CHECKING, Any, Callable, Tuple, TypeVar, Union
+
+if TYPE_CHECKING:
+    from kedro_datasets.pandas import CSVDataset, ExcelDataset, ParquetDataset
+
+    PandasDatasets = Union[CSVDataset, ExcelDataset, ParquetDataset]
 
 T = TypeVar("T")
 Args = Tuple[T]
 IsFunction = Callable[[T], bool]
-PandasDatasets = Union[CSVDataset, ExcelDataset, ParquetDataset]
+
+
+def __getattr__(name: str) -> Any:
+    # pandas datasets are only imported when their annotation is used
+    if name == "PandasDatasets":
+        from kedro_datasets.pandas import CSVDataset, ExcelDataset, ParquetDataset
+
+        return Union[CSVDataset, ExcelDataset, ParquetDataset]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
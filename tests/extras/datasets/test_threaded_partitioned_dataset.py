@@ -1,8 +1,11 @@
 """Threaded partitioned dataset tests."""
 
+from functools import partial
 import pathlib
 from typing import List
+import pandas as pd
 import pytest
+from kedro.io import DatasetError
 from pytest_mock import MockFixture
 from .mocked_dataset import MockedDataset
 from kedro_partitioned.extras.datasets.threaded_partitioned_dataset import (
@@ -67,3 +70,58 @@ def test_save_callable(setup: ThreadedPartitionedDataset):
     }
     setup.save(to_save)
     assert all(["cnt" in loader() for loader in setup.load().values()])
+
+
+def test_save_error():
+    """Saving stops at the first partition that fails, raising its error."""
+    computed = []
+
+    def compute(partition: str) -> pd.DataFrame:
+        computed.append(partition)
+        if partition == "b":
+            raise ValueError("failed")
+        return MockedDataset.EXAMPLE_DATA
+
+    dataset = ThreadedPartitionedDataset(
+        path=(BASE_PATH / "error").as_posix(), dataset=MockedDataset, max_workers=1
+    )
+    to_save = {p: partial(compute, p) for p in ["a", "b", "c", "d", "e", "f"]}
+    with pytest.raises(DatasetError, match="failed"):
+        dataset.save(to_save)
+    assert "f" not in computed
+
+
+def test_overwrite(tmp_path: pathlib.Path):
+    """Previous files are deleted in batches before saving.
+
+    Args:
+        tmp_path (pathlib.Path): pytest temporary directory
+    """
+    for name in ["x", "y/z", "y/w"]:
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("old")
+    dataset = ThreadedPartitionedDataset(
+        path=tmp_path.as_posix(), dataset=MockedDataset, overwrite=True, max_workers=2
+    )
+    dataset.DELETE_BATCH_SIZE = 2
+    dataset.save({"a": MockedDataset.EXAMPLE_DATA})
+    assert not tmp_path.exists() or list(tmp_path.rglob("*")) == []
+
+
+def test_save_config_copies(mocker: MockFixture):
+    """Each partition gets its own copy of the nested dataset configuration.
+
+    Args:
+        mocker (MockFixture): pytest-mock fixture
+    """
+    init = mocker.spy(MockedDataset, "__init__")
+    dataset = ThreadedPartitionedDataset(
+        path=(BASE_PATH / "config").as_posix(),
+        dataset={"type": MockedDataset, "save_args": {"index": False}},
+        max_workers=1,
+    )
+    dataset.save({p: MockedDataset.EXAMPLE_DATA for p in ["a", "b"]})
+    save_args = [call.kwargs["save_args"] for call in init.call_args_list]
+    assert save_args == [{"index": False}] * 2
+    assert save_args[0] is not save_args[1]
+    assert all(args is not dataset._dataset_config["save_args"] for args in save_args)
@@ -0,0 +1,48 @@
+"""Path safe partitioned dataset tests."""
+
+from pathlib import Path
+import pandas as pd
+from pytest_mock import MockerFixture
+from kedro_partitioned.io import PathSafePartitionedDataset
+
+
+def _write(path: Path, name: str):
+    """Writes a partition with a single row.
+
+    Args:
+        path (Path): folder of the partitions
+        name (str): partition name
+    """
+    pd.DataFrame({"x": [0]}).to_csv(path / f"{name}.csv", index=False)
+
+
+def test_clone(tmp_path: Path, mocker: MockerFixture):
+    """Clones share the filesystem, but list and cache partitions on their own.
+
+    Args:
+        tmp_path (Path): pytest temporary directory
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    for name in ["a", "b"]:
+        _write(tmp_path, name)
+    dataset = PathSafePartitionedDataset(
+        path=tmp_path.as_posix(),
+        dataset={"type": "pandas.CSVDataset", "load_args": {"sep": ","}},
+        filename_suffix=".csv",
+    )
+    assert sorted(dataset.load()) == ["a", "b"]
+
+    clone = dataset.clone()
+    assert clone._filesystem is dataset._filesystem
+    find = mocker.spy(dataset._filesystem, "find")
+    _write(tmp_path, "c")
+    assert sorted(clone.load()) == ["a", "b", "c"]
+    assert find.call_count == 1
+    # the original keeps its own cached listing
+    assert sorted(dataset.load()) == ["a", "b"]
+    assert find.call_count == 1
+
+    clone._dataset_config["load_args"]["sep"] = ";"
+    clone._credentials["token"] = "secret"
+    assert dataset._dataset_config["load_args"] == {"sep": ","}
+    assert "token" not in dataset._credentials
@@ -0,0 +1,491 @@
+"""End to end tests for multinodes running through the Kedro runner."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+import pandas as pd
+import pytest
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+from kedro.runner import SequentialRunner
+from pytest_mock import MockerFixture
+from kedro_partitioned.extras.datasets.nullable_dataset import isnull
+from kedro_partitioned.io import PathSafePartitionedDataset
+from kedro_partitioned.pipeline import multinode, multipipeline
+from kedro_partitioned.plugin import MultiNodeEnabler
+
+PARTITIONS = ["a", "b", "c", "d"]
+
+
+def _add_one(df: pd.DataFrame) -> pd.DataFrame:
+    """Adds one to the column `x`.
+
+    Args:
+        df (pd.DataFrame): partition data
+
+    Returns:
+        pd.DataFrame
+    """
+    return df.assign(x=df["x"] + 1)
+
+
+@pytest.fixture()
+def catalog(tmp_path: Path) -> DataCatalog:
+    """Creates a catalog with a partitioned input and output.
+
+    Args:
+        tmp_path (Path): pytest temporary directory
+
+    Returns:
+        DataCatalog
+    """
+    (tmp_path / "input").mkdir()
+    for i, name in enumerate(PARTITIONS):
+        pd.DataFrame({"x": [i]}).to_csv(tmp_path / "input" / f"{name}.csv", index=False)
+    return DataCatalog(
+        datasets={
+            name: PathSafePartitionedDataset(
+                path=(tmp_path / name).as_posix(),
+                dataset="pandas.CSVDataset",
+                filename_suffix=".csv",
+            )
+            for name in ["input", "output"]
+        }
+    )
+
+
+def run(pipe: Pipeline, catalog: DataCatalog) -> Dict[str, Any]:
+    """Runs a multinode pipeline as Kedro does, with the plugin hook.
+
+    Args:
+        pipe (Pipeline): pipeline to run
+        catalog (DataCatalog): catalog of the pipeline
+
+    Returns:
+        Dict[str, Any]: free outputs of the run
+    """
+    catalog = catalog.shallow_copy()
+    MultiNodeEnabler().before_pipeline_run({}, pipe, catalog)
+    return SequentialRunner().run(pipe, catalog)
+
+
+def load_output(catalog: DataCatalog) -> Dict[str, pd.DataFrame]:
+    """Loads the output partitions.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+
+    Returns:
+        Dict[str, pd.DataFrame]
+    """
+    return {k: v() for k, v in catalog.load("output").items()}
+
+
+def test_run(catalog: DataCatalog):
+    """Multinodes process every partition once.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+    """
+    run(multinode(_add_one, "input", "output", "x", n_slices=3), catalog)
+    output = load_output(catalog)
+    assert sorted(output) == PARTITIONS
+    assert [output[p]["x"][0] for p in PARTITIONS] == [1, 2, 3, 4]
+
+
+def test_runtime_balance(catalog: DataCatalog, tmp_path: Path):
+    """Slices record their runtime, which is used by the next run.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        tmp_path (Path): pytest temporary directory
+    """
+    pipe = multinode(_add_one, "input", "output", "x", n_slices=2, balance="runtime")
+    run(pipe, catalog)
+
+    stats_dir = tmp_path / "output" / "output-slicer-stats"
+    stats = [json.loads(p.read_text()) for p in sorted(stats_dir.glob("*.json"))]
+    assert sorted(p for s in stats for p in s["elapsed"]) == PARTITIONS
+
+    stats[0]["elapsed"] = {p: 100.0 if p == "a" else 1.0 for p in PARTITIONS}
+    stats[1]["elapsed"] = {}
+    for path, content in zip(sorted(stats_dir.glob("*.json")), stats):
+        path.write_text(json.dumps(content))
+
+    run(pipe, catalog)
+    plan = json.loads((tmp_path / "output" / "output-slicer.json").read_text())
+    assert plan["slices"] == [["a"], ["b", "c", "d"]]
+    assert sorted(load_output(catalog)) == PARTITIONS
+
+
+def test_streaming(catalog: DataCatalog, tmp_path: Path):
+    """Streaming multinodes process each partition while saving it.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        tmp_path (Path): pytest temporary directory
+    """
+    processed = []
+
+    def fn(df: pd.DataFrame) -> pd.DataFrame:
+        processed.append(len(list((tmp_path / "output").glob("*.csv"))))
+        return _add_one(df)
+
+    run(multinode(fn, "input", "output", "x", n_slices=1, streaming=True), catalog)
+    assert processed == [0, 1, 2, 3]
+    output = load_output(catalog)
+    assert [output[p]["x"][0] for p in PARTITIONS] == [1, 2, 3, 4]
+
+
+def test_streaming_multiple_outputs():
+    """Streaming is rejected for nodes with two partitioned outputs."""
+    with pytest.raises(ValueError, match="single partitioned output"):
+        multinode(
+            lambda df: [df, df],
+            "input",
+            ["output", "output2"],
+            "x",
+            n_slices=1,
+            streaming=True,
+        )
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_partition_workers(catalog: DataCatalog, executor: str):
+    """Partitions of a slice can be processed in a pool.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        executor (str): kind of pool
+    """
+    pipe = multinode(
+        _add_one,
+        "input",
+        "output",
+        "x",
+        n_slices=1,
+        partition_workers=2,
+        partition_executor=executor,
+    )
+    run(pipe, catalog)
+    output = load_output(catalog)
+    assert [output[p]["x"][0] for p in PARTITIONS] == [1, 2, 3, 4]
+
+
+def test_prefetch(catalog: DataCatalog):
+    """Partitions loaded ahead keep their order and results.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+    """
+    pipe = multinode(_add_one, "input", "output", "x", n_slices=1, prefetch=2)
+    run(pipe, catalog)
+    output = load_output(catalog)
+    assert [output[p]["x"][0] for p in PARTITIONS] == [1, 2, 3, 4]
+
+
+def _add(df: pd.DataFrame, conf: Dict[str, int]) -> pd.DataFrame:
+    """Adds the configured value to the column `x`.
+
+    Args:
+        df (pd.DataFrame): partition data
+        conf (Dict[str, int]): configurator data
+
+    Returns:
+        pd.DataFrame
+    """
+    return df.assign(x=df["x"] + conf["add"])
+
+
+def test_configurators(catalog: DataCatalog):
+    """Slices use the configurators resolved by the slicer.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+    """
+    catalog.add_feed_dict(
+        {
+            "params:conf": {
+                "template": {"pattern": "{name}"},
+                "configurators": [
+                    {"target": ["*"], "data": {"add": 10}},
+                    {"target": ["b"], "data": {"add": 20}},
+                    {"target": ["c"], "cached": True, "data": {"add": 30}},
+                ],
+            }
+        }
+    )
+    pipe = multinode(
+        _add, "input", "output", "x", n_slices=2, configurator="params:conf"
+    )
+    run(pipe, catalog)
+    output = load_output(catalog)
+    assert {p: df["x"][0] for p, df in output.items()} == {"a": 10, "b": 21, "d": 13}
+
+
+def test_manifest(catalog: DataCatalog, tmp_path: Path, mocker: MockerFixture):
+    """Slices load the partitions listed by the slicer without listing.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        tmp_path (Path): pytest temporary directory
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    pipe = multinode(_add_one, "input", "output", "x", n_slices=2)
+    run(pipe, catalog)
+    plan = json.loads((tmp_path / "output" / "output-slicer.json").read_text())
+    assert plan["manifests"] == [{"input": ["a", "b"]}, {"input": ["c", "d"]}]
+
+    # a slice running in another process, with a brand new dataset
+    dataset = PathSafePartitionedDataset(
+        path=(tmp_path / "input").as_posix(),
+        dataset="pandas.CSVDataset",
+        filename_suffix=".csv",
+    )
+    find = mocker.spy(dataset._filesystem, "find")
+    slice_node = next(n for n in pipe.nodes if n.name == "x-slice-1")
+    output = slice_node.run({"output-slicer": plan, "input": dataset.load()})
+    assert sorted(output["output-slice-1"]) == ["c", "d"]
+    find.assert_not_called()
+
+
+def test_slice_loaders(tmp_path: Path, mocker: MockerFixture):
+    """Slices create loaders only for their own partitions.
+
+    Args:
+        tmp_path (Path): pytest temporary directory
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    for name in PARTITIONS:
+        pd.DataFrame({"x": [0]}).to_csv(tmp_path / f"{name}.csv", index=False)
+    dataset = PathSafePartitionedDataset(
+        path=tmp_path.as_posix(), dataset="pandas.CSVDataset", filename_suffix=".csv"
+    )
+    factory = mocker.spy(dataset, "_partition_loader")
+    pipe = multinode(_add_one, "input", "output", "x", n_slices=2)
+    slice_node = next(n for n in pipe.nodes if n.name == "x-slice-0")
+    output = slice_node.run(
+        {"output-slicer": [["a", "b"], ["c", "d"]], "input": dataset.load()}
+    )
+    assert sorted(output["output-slice-0"]) == ["a", "b"]
+    assert factory.call_count == 2
+
+
+def test_marker_barrier(catalog: DataCatalog, mocker: MockerFixture):
+    """The synchronization waits for the slice markers, not their outputs.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    load = mocker.spy(PathSafePartitionedDataset, "load")
+    pipe = multinode(_add_one, "input", "output", "x", n_slices=2, barrier="markers")
+    run(pipe, catalog)
+    # the slicer and each slice load the input, no slice output is loaded
+    loaded = [call.args[0] for call in load.call_args_list]
+    assert loaded == [catalog._get_dataset("input")] * 3
+    assert sorted(load_output(catalog)) == PARTITIONS
+
+
+@pytest.mark.parametrize("partition_workers", [None, 2])
+def test_work_stealing(catalog: DataCatalog, tmp_path: Path, partition_workers: int):
+    """A slice that finishes its share processes partitions of the others.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        tmp_path (Path): pytest temporary directory
+        partition_workers (int): partitions processed at the same time
+    """
+    pipe = multinode(
+        _add_one,
+        "input",
+        "output",
+        "x",
+        n_slices=2,
+        work_stealing=True,
+        partition_workers=partition_workers,
+    )
+    run(pipe, catalog)
+
+    stats_dir = tmp_path / "output" / "output-slicer-stats"
+    stats = [json.loads(p.read_text()) for p in stats_dir.glob("*.json")]
+    # every partition is processed by exactly one slice
+    processed = [p for s in stats for p in s["elapsed"]]
+    assert sorted(processed) == PARTITIONS
+    output = load_output(catalog)
+    assert [output[p]["x"][0] for p in PARTITIONS] == [1, 2, 3, 4]
+
+
+def test_auto_slices(catalog: DataCatalog, tmp_path: Path, mocker: MockerFixture):
+    """Automatic slicing leaves the extra slices without partitions.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        tmp_path (Path): pytest temporary directory
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    mocker.patch("kedro_partitioned.pipeline.multinode.MAX_WORKERS", 6)
+    mocker.patch("kedro_partitioned.pipeline.multinode.MAX_NODES", 1)
+    pipe = multinode(_add_one, "input", "output", "x", n_slices="auto")
+    assert len(pipe.nodes) == 8
+
+    run(pipe, catalog)
+    plan = json.loads((tmp_path / "output" / "output-slicer.json").read_text())
+    assert plan["slices"] == [["a"], ["b"], ["c"], ["d"], [], []]
+    assert sorted(load_output(catalog)) == PARTITIONS
+
+
+def test_checkpoint(catalog: DataCatalog):
+    """A slice executed again skips the partitions committed before failing.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+    """
+    processed = []
+    failing = {"c"}
+
+    def fn(df: pd.DataFrame) -> pd.DataFrame:
+        partition = PARTITIONS[df["x"][0]]
+        processed.append(partition)
+        if partition in failing:
+            raise ValueError(partition)
+        return _add_one(df)
+
+    pipe = multinode(fn, "input", "output", "x", n_slices=1, checkpoint=True)
+    with pytest.raises(ValueError):
+        run(pipe, catalog)
+    assert sorted(load_output(catalog)) == ["a", "b"]
+
+    failing.clear()
+    processed.clear()
+    run(pipe.from_nodes("x-slice-0"), catalog)
+    assert processed == ["c", "d"]
+    output = load_output(catalog)
+    assert [output[p]["x"][0] for p in PARTITIONS] == [1, 2, 3, 4]
+
+
+def test_retries(catalog: DataCatalog):
+    """Partitions that raise are processed again.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+    """
+    attempts = []
+
+    def fn(df: pd.DataFrame) -> pd.DataFrame:
+        attempts.append(df["x"][0])
+        if attempts.count(df["x"][0]) < 2:
+            raise OSError("transient")
+        return _add_one(df)
+
+    pipe = multinode(fn, "input", "output", "x", n_slices=1, retries=1, retry_backoff=0)
+    run(pipe, catalog)
+    assert sorted(attempts) == [0, 0, 1, 1, 2, 2, 3, 3]
+    output = load_output(catalog)
+    assert [output[p]["x"][0] for p in PARTITIONS] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("partition_workers", [None, 2])
+def test_continue_on_error(
+    catalog: DataCatalog, tmp_path: Path, partition_workers: int
+):
+    """Failed partitions are recorded and checked by the synchronization.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        tmp_path (Path): pytest temporary directory
+        partition_workers (int): partitions processed at the same time
+    """
+
+    def fn(df: pd.DataFrame) -> pd.DataFrame:
+        if df["x"][0] == 2:
+            raise ValueError("malformed")
+        return _add_one(df)
+
+    def pipe(max_errors: int):
+        return multinode(
+            fn,
+            "input",
+            "output",
+            "x",
+            n_slices=2,
+            partition_workers=partition_workers,
+            continue_on_error=True,
+            max_errors=max_errors,
+        )
+
+    with pytest.raises(Exception, match="1 partitions failed"):
+        run(pipe(0), catalog)
+
+    run(pipe(1), catalog)
+    assert sorted(load_output(catalog)) == ["a", "b", "d"]
+    stats = json.loads(
+        (tmp_path / "output" / "output-slicer-stats" / "x-slice-1.json").read_text()
+    )
+    assert list(stats["errors"]) == ["c"]
+    assert "ValueError: malformed" in stats["errors"]["c"]
+
+
+@pytest.mark.parametrize(
+    "join, expected",
+    [
+        ("inner", {"b": 1}),
+        ("left", {"a": 0, "b": 1}),
+        ("outer", {"a": 0, "b": 1, "e": 1}),
+    ],
+)
+def test_join(
+    catalog: DataCatalog, tmp_path: Path, join: str, expected: Dict[str, int]
+):
+    """Partitions of multiple inputs are matched by the join mode.
+
+    Args:
+        catalog (DataCatalog): catalog of the pipeline
+        tmp_path (Path): pytest temporary directory
+        join (str): join mode
+        expected (Dict[str, int]): sum of `x` by output partition
+    """
+    (tmp_path / "other").mkdir()
+    for i, name in enumerate(["b", "e"]):
+        pd.DataFrame({"x": [i]}).to_csv(
+            tmp_path / "other" / f"{name}.csv.gz", index=False
+        )
+    catalog.add(
+        "other",
+        PathSafePartitionedDataset(
+            path=(tmp_path / "other").as_posix(), dataset="pandas.CSVDataset"
+        ),
+    )
+
+    def fn(df: Any, other: Any) -> pd.DataFrame:
+        dfs = [d for d in [df, other] if not isnull(d)]
+        return pd.DataFrame({"x": [sum(d["x"][0] for d in dfs) + 1]})
+
+    pipe = multinode(
+        fn,
+        ["input", "other"],
+        "output",
+        "x",
+        n_slices=2,
+        join=join,
+        filter=lambda p: p in "abe",
+    )
+    run(pipe, catalog)
+    output = load_output(catalog)
+    assert {p: df["x"][0] - 1 for p, df in output.items()} == expected
+
+
+def test_construction_single_pipeline(mocker: MockerFixture):
+    """Building a multipipeline builds a single pipeline, whatever its depth.
+
+    Args:
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    pipe = Pipeline(
+        [node(_add_one, f"d{i}", f"d{i + 1}", name=f"n{i}") for i in range(20)]
+    )
+    init = mocker.spy(Pipeline, "__init__")
+    multi = multipipeline(pipe, "d0", "x", n_slices=16, continue_on_error=True)
+    assert init.call_count == 1
+    # one node per slice of each node, plus the slicer and the synchronization
+    assert len(multi.nodes) == 20 * 16 + 2
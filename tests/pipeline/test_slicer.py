@@ -0,0 +1,213 @@
+"""Tests for the slicer node balancing strategies."""
+
+from pathlib import Path
+from typing import Dict
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+from kedro_partitioned.io import PathSafePartitionedDataset
+from kedro_partitioned.pipeline.decorators.helper_factory import date_range_filter
+from kedro_partitioned.pipeline.multinode import _SlicerNode
+
+SIZES = {"a": 50, "b": 10, "c": 10, "d": 10, "e": 10, "f": 10}
+
+
+@pytest.fixture()
+def partitioned(tmp_path: Path) -> PathSafePartitionedDataset:
+    """Creates a partitioned dataset with files of different sizes.
+
+    Args:
+        tmp_path (Path): pytest temporary directory
+
+    Returns:
+        PathSafePartitionedDataset: dataset pointing to the files
+    """
+    for name, size in SIZES.items():
+        (tmp_path / f"{name}.csv").write_text("x\n" + "1\n" * size)
+    return PathSafePartitionedDataset(
+        path=tmp_path.as_posix(), dataset="pandas.CSVDataset"
+    )
+
+
+def _run(node: _SlicerNode, partitioned: PathSafePartitionedDataset) -> dict:
+    """Runs the slicer with the loaded partitioned dataset.
+
+    Args:
+        node (_SlicerNode): slicer to run
+        partitioned (PathSafePartitionedDataset): input dataset
+
+    Returns:
+        dict: slicer json output
+    """
+    return node.run(inputs={"a": partitioned.load()})[node.json_output]
+
+
+def test_count_balance(partitioned: PathSafePartitionedDataset):
+    """Count balancing splits the sorted partitions into ranges.
+
+    Args:
+        partitioned (PathSafePartitionedDataset): input dataset
+    """
+    plan = _run(_SlicerNode(2, "a", "b", "x"), partitioned)
+    assert plan["version"] == _SlicerNode.PLAN_VERSION
+    assert plan["slices"] == [["a", "b", "c"], ["d", "e", "f"]]
+    assert plan["manifests"][0] == {"a": ["a.csv", "b.csv", "c.csv"]}
+
+
+def test_size_balance(partitioned: PathSafePartitionedDataset):
+    """Size balancing packs the largest partition alone.
+
+    Args:
+        partitioned (PathSafePartitionedDataset): input dataset
+    """
+    plan = _run(_SlicerNode(2, "a", "b", "x", balance="size"), partitioned)
+    assert plan["slices"] == [["a"], ["b", "c", "d", "e", "f"]]
+
+
+def test_size_balance_without_listing_sizes(
+    partitioned: PathSafePartitionedDataset,
+):
+    """Size balancing asks the filesystem when the listing has no sizes.
+
+    Args:
+        partitioned (PathSafePartitionedDataset): input dataset
+    """
+    loaders: Dict = dict(partitioned.load())
+    node = _SlicerNode(2, "a", "b", "x", balance="size")
+    plan = node.run(inputs={"a": loaders})[node.json_output]
+    assert plan["slices"] == [["a"], ["b", "c", "d", "e", "f"]]
+    assert "manifests" not in plan
+
+
+def test_group_by(tmp_path: Path):
+    """Partitions of the same group stay together while balancing sizes.
+
+    Args:
+        tmp_path (Path): pytest temporary directory
+    """
+    sizes = {"s1/p1": 30, "s1/p2": 30, "s2/p1": 20, "s2/p2": 20, "s3/p1": 10}
+    for name, size in sizes.items():
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / f"{name}.csv").write_text("x\n" + "1\n" * size)
+    partitioned = PathSafePartitionedDataset(
+        path=tmp_path.as_posix(), dataset="pandas.CSVDataset", filename_suffix=".csv"
+    )
+    node = _SlicerNode(
+        2, "a", "b", "x", configurator="params:z", balance="size", group_by="store"
+    )
+    plan = node.run(
+        inputs={
+            "a": partitioned.load(),
+            "params:z": {
+                "template": {"pattern": "{store}/{product}"},
+                "configurators": [{"target": ["*", "*"], "data": 1}],
+            },
+        }
+    )[node.json_output]
+    assert plan["slices"] == [["s1/p1", "s1/p2"], ["s2/p1", "s2/p2", "s3/p1"]]
+
+
+@pytest.mark.parametrize("auto_slices", [False, True])
+def test_hash_balance(
+    partitioned: PathSafePartitionedDataset, tmp_path: Path, auto_slices: bool
+):
+    """Hash balancing keeps the partitions in their slices as new ones arrive.
+
+    Args:
+        partitioned (PathSafePartitionedDataset): input dataset
+        tmp_path (Path): pytest temporary directory
+        auto_slices (bool): whether the slicer slices automatically
+    """
+    node = _SlicerNode(8, "a", "b", "x", balance="hash", auto_slices=auto_slices)
+    before = _run(node, partitioned)["slices"]
+    assert sorted(p for s in before for p in s) == sorted(SIZES)
+
+    (tmp_path / "g.csv").write_text("x\n1\n")
+    partitioned._invalidate_caches()
+    after = _run(node, partitioned)["slices"]
+    assert [[p for p in s if p != "g"] for s in after] == before
+
+
+def test_empty_slice_manifests(partitioned: PathSafePartitionedDataset):
+    """Slices without partitions are planned without manifests.
+
+    Args:
+        partitioned (PathSafePartitionedDataset): input dataset
+    """
+    plan = _run(_SlicerNode(8, "a", "b", "x", auto_slices=True), partitioned)
+    assert [len(s) for s in plan["slices"]] == [1] * 6 + [0] * 2
+    assert plan["manifests"][5] == {"a": ["f.csv"]}
+    assert plan["manifests"][6:] == [{}, {}]
+
+
+def test_filter_pushdown(tmp_path: Path, mocker: MockerFixture):
+    """Filters with prefixes list only the folders they can match.
+
+    Args:
+        tmp_path (Path): pytest temporary directory
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    for name in ["sales/2020-12/31", "sales/2021-01/01", "stock/2021-01/01"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / f"{name}.csv").write_text("x\n1\n")
+    partitioned = PathSafePartitionedDataset(
+        path=tmp_path.as_posix(), dataset="pandas.CSVDataset", filename_suffix=".csv"
+    )
+    ls = mocker.spy(partitioned._filesystem, "ls")
+    node = _SlicerNode(
+        2,
+        "a",
+        "b",
+        "x",
+        filter=date_range_filter(
+            "2021-01/01", "2021-01/31", format="%Y-%m/%d", root="sales/"
+        ),
+    )
+    plan = _run(node, partitioned)
+    assert plan["slices"] == [["sales/2021-01/01"], []]
+    # the month out of range is never listed
+    assert sorted(call.args[0] for call in ls.call_args_list) == [
+        (tmp_path / "sales").as_posix(),
+        (tmp_path / "sales" / "2021-01").as_posix(),
+    ]
+
+
+def test_date_index(mocker: MockerFixture):
+    """Date filters parse the dates of a whole listing at once.
+
+    Args:
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    partitions = {f"{day:%Y-%m-%d}": None for day in pd.date_range("2020", "2021")}
+    fn = date_range_filter(
+        ranges=[("2020-01-01", "2020-01-02"), ("2020-12-31", "2021-01-31")]
+    )
+    to_datetime = mocker.spy(pd, "to_datetime")
+    node = _SlicerNode(2, "a", "b", "x", filter=fn)
+    plan = node.func(partitions)
+    assert plan["slices"] == [
+        ["2020-01-01", "2020-01-02"],
+        ["2020-12-31", "2021-01-01"],
+    ]
+    assert to_datetime.call_count == 1
+
+
+def test_date_filter_invalid_dates():
+    """Dates that match the format but do not exist raise in both filters."""
+    fn = date_range_filter(min_date="2020-01-01")
+    with pytest.raises(ValueError):
+        fn("sales/2020-02-30")
+    with pytest.raises(ValueError):
+        fn.many(["sales/2020-01-01", "sales/2020-02-30"])
+    with pytest.raises(ValueError, match="`ranges` cannot be used"):
+        date_range_filter(min_date="2020-01-01", ranges=[("2020-01-01", "2020-01-31")])
+
+
+def test_compressed_partitions():
+    """Partitions match across inputs regardless of compressed extensions."""
+    node = _SlicerNode(1, ["a", "b"], "c", "x")
+    plan = node.func(
+        {"p/1.v2.csv.gz": None, "p/2.csv.gz": None, "p/3.csv": None},
+        {"p/1.v2.parquet": None, "p/2.json": None},
+    )
+    assert plan["slices"] == [["p/1.v2", "p/2"]]
@@ -0,0 +1,63 @@
+"""Tests for the slice plan inspection command."""
+
+from pathlib import Path
+import pandas as pd
+from click.testing import CliRunner
+from kedro.io import DataCatalog
+from pytest_mock import MockerFixture
+from kedro_partitioned.cli import commands, inspect_slicer
+from kedro_partitioned.io import PathSafePartitionedDataset
+from kedro_partitioned.pipeline import multinode
+from kedro_partitioned.pipeline.multinode import _SlicerNode
+
+
+def test_inspect(tmp_path: Path, mocker: MockerFixture):
+    """The command reports the slices and flags the skewed ones.
+
+    Args:
+        tmp_path (Path): pytest temporary directory
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    (tmp_path / "input").mkdir()
+    for name, rows in {"a": 100, "b": 1, "c": 1}.items():
+        pd.DataFrame({"x": range(rows)}).to_csv(
+            tmp_path / "input" / f"{name}.csv", index=False
+        )
+    catalog = DataCatalog(
+        datasets={
+            name: PathSafePartitionedDataset(
+                path=(tmp_path / name).as_posix(),
+                dataset="pandas.CSVDataset",
+                filename_suffix=".csv",
+            )
+            for name in ["input", "output"]
+        }
+    )
+    pipe = multinode(max, "input", "output", "x", n_slices=2)
+    mocker.patch("kedro_partitioned.cli._load_project", return_value=(pipe, catalog))
+
+    result = CliRunner().invoke(
+        commands, ["partitioned", "inspect", "--skew-threshold", "1.2"], obj=None
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0] == "x (balance: count)"
+    assert lines[2].split()[:2] == ["0", "2"] and lines[2].endswith("SKEWED")
+    assert lines[3].split()[:2] == ["1", "1"]
+    assert "skew: 1.33" in lines[4]
+    assert not (tmp_path / "output").exists()
+
+
+def test_inspect_sizes_once(mocker: MockerFixture):
+    """The report reuses the partition sizes the slicer balanced by.
+
+    Args:
+        mocker (MockerFixture): pytest-mock fixture
+    """
+    pipe = multinode(max, "a", "b", "x", n_slices=2, balance="size")
+    slicer = next(n for n in pipe.nodes if isinstance(n, _SlicerNode))
+    loader_size = mocker.patch.object(_SlicerNode, "_loader_size", return_value=10)
+    partitions = {"a.csv": None, "b.csv": None, "c.csv": None}
+    report = inspect_slicer(slicer, DataCatalog(feed_dict={"a": partitions}))
+    assert loader_size.call_count == 3
+    assert sorted(s["bytes"] for s in report["slices"]) == [10, 20]
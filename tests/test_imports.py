@@ -0,0 +1,35 @@
+"""Tests for the modules every kedro command imports."""
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+# modules imported only when datasets are created or partitions are filtered
+LAZY_MODULES = [
+    "pandas",
+    "numpy",
+    "kedro_datasets.pandas",
+    "kedro_datasets.json",
+    "kedro_datasets.partitions",
+]
+
+SCRIPT = """
+import json, sys
+import kedro_partitioned.cli, kedro_partitioned.plugin
+from kedro_partitioned.pipeline import multinode, multipipeline
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test_lazy_imports():
+    """Importing the hook does not import pandas nor datasets."""
+    process = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = json.loads(process.stdout)
+    assert [m for m in LAZY_MODULES if m in modules] == []